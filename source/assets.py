@@ -0,0 +1,91 @@
+# assets.py
+
+import io
+import os
+import pygame
+from concurrent.futures import ThreadPoolExecutor
+
+from data import BLOCKS, ITEMS, ResourcePath
+
+
+def build_manifest():
+    """List the images to decode in the background, in the order they are needed."""
+    image_folders = ['buttons', 'cursor', 'panels', 'sprite_sheets', 'settings', 'items']
+    images = [ResourcePath("checkmark.png").path]
+    for folder in image_folders:
+        folder_path = ResourcePath(folder).path
+        if os.path.isdir(folder_path):
+            images.extend(
+                os.path.join(folder_path, filename) for filename in sorted(os.listdir(folder_path))
+                if filename.endswith('.png')
+            )
+    images.extend(properties.image_file for properties in BLOCKS.values())
+    images.extend(properties.image_file for properties in ITEMS.values())
+    return images
+
+
+class AssetManager:
+    """Decodes images on a thread pool and hands out shared handles."""
+    def __init__(self, max_workers=4):
+        self.max_workers = max_workers
+        self.executor = None
+        self.images = {} # Converted surfaces keyed by path
+        self.scaled = {} # Scaled surfaces keyed by (path, size)
+        self.pending = {} # Decoding futures keyed by path
+        self.total = 0 # Assets queued since startup
+
+    @property
+    def progress(self):
+        """Fraction of queued assets that have finished decoding."""
+        if not self.total:
+            return 1.0
+        waiting = sum(1 for future in self.pending.values() if not future.done())
+        return (self.total - waiting) / self.total
+
+    @property
+    def loaded(self):
+        """Whether every queued asset has finished decoding."""
+        return self.progress >= 1.0
+
+    def preload(self, manifest=None):
+        """Queue every image in the manifest for decoding."""
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="assets")
+
+        for path in dict.fromkeys(manifest or build_manifest()):
+            if path in self.images or path in self.pending:
+                continue
+            self.pending[path] = self.executor.submit(self._decode_image, path)
+            self.total += 1
+
+    def get_image(self, path):
+        """Return the shared surface for an image. Callers must copy before drawing on it."""
+        image = self.images.get(path)
+        if image is None:
+            # Surfaces can only be converted on the main thread, once decoding is done
+            image = self._wait(path).convert_alpha()
+            self.images[path] = image
+        return image
+
+    def get_scaled(self, path, size):
+        """Return the shared surface for an image scaled to a size, scaling it only once."""
+        key = (path, tuple(size))
+        image = self.scaled.get(key)
+        if image is None:
+            image = self.scaled[key] = pygame.transform.scale(self.get_image(path), size)
+        return image
+
+    def _wait(self, path):
+        """Wait for a queued image, or decode it now if it was never queued."""
+        future = self.pending.get(path)
+        if future is None:
+            return self._decode_image(path)
+        return future.result()
+
+    def _decode_image(self, path):
+        with open(path, 'rb') as file:
+            data = file.read()
+        return pygame.image.load(io.BytesIO(data), path)
+
+
+ASSETS = AssetManager()
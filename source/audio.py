@@ -0,0 +1,133 @@
+# audio.py
+
+import io
+import os
+import pygame
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from data import ResourcePath
+
+
+SOUND_FILES = {
+    "reload": "sfx/reload.mp3",
+    "gun_shot": "sfx/gun_shot.mp3",
+    "search": "sfx/search.wav",
+    "footsteps": "sfx/footsteps.wav",
+    "door_open": "sfx/door_open.wav",
+    "door_close": "sfx/door_close.wav",
+    "decade": "sfx/decade.wav",
+    "barricade": "sfx/barricade.wav",
+    "human_death": "sfx/human_death.wav",
+    "zombie_death": "sfx/zombie_death.wav",
+}
+
+# Long tracks are streamed rather than decoded into memory
+MUSIC_FILES = {
+    "title": "music/summoning.mp3",
+    "day": "music/road_runner.mp3",
+    "zombie_sounds": "sfx/zombie_sounds.wav",
+}
+
+
+class AudioService:
+    """Plays sound effects decoded on first use, and streams music tracks."""
+    def __init__(self, memory_budget=16 * 1024 * 1024, music_volume=0.3):
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
+        self.memory_budget = memory_budget # Bytes of decoded sound kept in the cache
+        self.music_volume = music_volume
+        self.sounds = OrderedDict() # Decoded sounds, least recently played first
+        self.sound_sizes = {} # Estimated bytes per cached sound
+        self.cache_size = 0
+        self.pending = {} # Background decodes keyed by sound name
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="audio")
+        self.track = None # Music track currently loaded
+
+    def prefetch(self, name):
+        """Decode a sound effect on a background thread ahead of its first use."""
+        if name not in self.sounds and name not in self.pending:
+            self.pending[name] = self.executor.submit(self._decode, name)
+
+    def play(self, name):
+        """Play a sound effect, decoding it first if needed."""
+        sound = self.get_sound(name)
+        if sound:
+            sound.play()
+
+    def get_sound(self, name):
+        """Return a decoded sound effect, or None if it can't be loaded."""
+        sound = self.sounds.get(name)
+        if sound is not None:
+            self.sounds.move_to_end(name)
+            return sound
+
+        future = self.pending.pop(name, None)
+        try:
+            sound = future.result() if future else self._decode(name)
+        except (FileNotFoundError, pygame.error):
+            return None # Missing sounds are skipped
+        self._cache(name, sound)
+        return sound
+
+    def play_music(self, name, loops=-1):
+        """Stream a music track, loading it only if it isn't already loaded."""
+        if name != self.track:
+            try:
+                pygame.mixer.music.load(ResourcePath(MUSIC_FILES[name]).path)
+            except (FileNotFoundError, pygame.error):
+                self.track = None
+                return
+            self.track = name
+            pygame.mixer.music.set_volume(self.music_volume)
+        pygame.mixer.music.play(loops)
+
+    def stop_music(self):
+        pygame.mixer.music.stop()
+
+    def _decode(self, name):
+        with open(ResourcePath(SOUND_FILES[name]).path, 'rb') as file:
+            data = file.read()
+        return pygame.mixer.Sound(file=io.BytesIO(data))
+
+    def _cache(self, name, sound):
+        """Cache a sound, evicting the least recently played ones over the memory budget."""
+        self.sounds[name] = sound
+        self.sound_sizes[name] = self._estimate_size(sound)
+        self.cache_size += self.sound_sizes[name]
+
+        while self.cache_size > self.memory_budget and len(self.sounds) > 1:
+            evicted, _ = self.sounds.popitem(last=False)
+            self.cache_size -= self.sound_sizes.pop(evicted)
+
+    def _estimate_size(self, sound):
+        frequency, sample_format, channels = pygame.mixer.get_init()
+        return int(sound.get_length() * frequency * channels * abs(sample_format) // 8)
+
+
+class NullAudio:
+    """Silent audio backend for headless runs and simulations."""
+    def prefetch(self, name):
+        pass
+
+    def play(self, name):
+        pass
+
+    def get_sound(self, name):
+        return None
+
+    def play_music(self, name, loops=-1):
+        pass
+
+    def stop_music(self):
+        pass
+
+
+def create_audio(enabled=True):
+    """Return the audio service, or the silent backend if audio is disabled or unavailable."""
+    if enabled and os.environ.get("SDL_AUDIODRIVER") != "dummy":
+        try:
+            return AudioService()
+        except pygame.error:
+            pass
+    return NullAudio()
@@ -5,7 +5,12 @@ from collections import defaultdict
 import csv
 
 from settings import *
-from data import BLOCKS, BarricadeState, BARRICADE_DESCRIPTIONS, ActionResult, ITEMS, ItemType, SkillType
+from topology import NEIGHBOURHOOD_NAMES
+from event_bus import WorldEvent
+from data import (
+    BLOCKS, BARRICADE_TABLE, BARRICADE_HP, BARRICADE_MAX_HP, BARRICADE_MAX_LEVEL, BARRICADE_SUBLEVELS,
+    ActionResult, ITEMS, ItemType,
+)
 
 class CityBlock:
     """Base class for a city block."""
@@ -15,11 +20,19 @@ class CityBlock:
         self.x, self.y = 0, 0
         self.block_outside_desc = 'A non-descript city block.'
         self.observations = []
-        self.neighbourhood = ''
+        self.neighbourhood_id = 0
         self.current_zombies = 0 # Number of zombies currently in the block
         self.current_humans = 0
         self.is_known = False # Has the player seen the block
 
+    @property
+    def neighbourhood(self):
+        return NEIGHBOURHOOD_NAMES[self.neighbourhood_id]
+
+    def get_observable_state(self):
+        """Return a snapshot of the block state that shows up in descriptions."""
+        return ()
+
     def generate_descriptions(self, descriptions_data):
         """Randomly construct three-sentence descriptions of city blocks."""
         if self.type.name in descriptions_data:
@@ -75,14 +88,27 @@ class BuildingBlock(CityBlock):
             self.block_inside_desc = "Inside, this place looks abandoned and forgotten."
             self.block_outside_desc = "Outside, the building shows signs of decay and neglect."
 
+    def get_observable_state(self):
+        """Return a snapshot of the block state that shows up in descriptions."""
+        return (
+            self.barricade.level, self.doors_closed, self.lights_on,
+            self.ransack_level, self.ruined, self.generator_installed,
+        )
+
+    def publish(self, event_type, actor):
+        """Announce a change an actor made to the building."""
+        actor.game.event_bus.publish(event_type, self.x, self.y, character=actor)
+
     def close_doors(self, actor):
         self.doors_closed = True
         actor.ap -= 1
+        self.publish(WorldEvent.BUILDING_CHANGED, actor)
         return ActionResult(True, "You close the doors of the building.", sfx='door_close')
     
     def open_doors(self, actor):
         self.doors_closed = False
         actor.ap -= 1
+        self.publish(WorldEvent.BUILDING_CHANGED, actor)
         return ActionResult(True, "You open the doors of the building.", sfx='door_open')
 
     def add_barricades(self, actor):
@@ -97,16 +123,17 @@ class BuildingBlock(CityBlock):
         if actor.inside:
             if self.ransack_level > 0:
                 return ActionResult(False, "You have to repair the building before you can add barricades.")
-            elif self.barricade.level >= 7 and self.barricade.sublevel >= 4:
+            elif self.barricade.stage.built is None:
                 return ActionResult(False, "You can't add more barricades.")
             
             success_chance = success_chances[self.barricade.level]
             success = random.random() < success_chance * modifier
             if success:
-                add_barricade = self.barricade.adjust_barricade_sublevel(1)
-                if not add_barricade:
+                if not self.barricade.build():
                     return ActionResult(False, "You can't add more barricades.")
-                elif self.barricade.level == 4 and self.barricade.sublevel == 2:
+
+                self.publish(WorldEvent.BARRICADE_CHANGED, actor)
+                if self.barricade.level == 4 and self.barricade.sublevel == 2:
                     actor.ap -= 1
                     message = "You reinforce the barricade. It's looking very strong, now - any further barricading will prevent survivors from climbing in."
                     witness = f"{actor.current_name} reinforced the barricade. It's looking very strong, now - any further barricading will prevent survivors from climbing in."
@@ -131,6 +158,7 @@ class BuildingBlock(CityBlock):
         if self.barricade.level > 0:
             self.barricade.register_hit()
             actor.ap -= 1
+            self.publish(WorldEvent.BARRICADE_CHANGED, actor)
             if self.barricade.level == 0:
                 message = "You smash at the barricades. The last piece of it falls away."
                 witness = "Something smashes through the last of the barricades."
@@ -145,6 +173,7 @@ class BuildingBlock(CityBlock):
         if actor.inside:
             if not self.ruined:
                 self.ransack_level += 1
+                self.publish(WorldEvent.BUILDING_CHANGED, actor)
                 if self.ransack_level == 6:
                     self.ruined = True
                     return ActionResult(True, "You ransack further rooms of the buildling. The building is now ruined.")
@@ -195,13 +224,13 @@ class BuildingBlock(CityBlock):
 
         # Check for duplicate portable generator
         if item.type == ItemType.PORTABLE_GENERATOR:
-            for inventory_item in actor.inventory:
-                if hasattr(inventory_item, 'type') and inventory_item.type == ItemType.PORTABLE_GENERATOR:
-                    actor.ap -= 1
-                    return ActionResult(False, "You found a portable generator, but you can only carry one at a time.")
+            if actor.inventory.has(ItemType.PORTABLE_GENERATOR):
+                actor.ap -= 1
+                return ActionResult(False, "You found a portable generator, but you can only carry one at a time.")
  
         # Add the item to inventory
         actor.inventory.append(item)
+        actor.state.publish(WorldEvent.ITEM_FOUND)
         actor.ap -= 1
         return ActionResult(True, f"You found {item_properties.description}!")
 
@@ -226,7 +255,8 @@ class BuildingBlock(CityBlock):
             return ActionResult(False, "A generator is already installed.")
         else:
             actor.ap -= 1
-            actor.inventory.remove(item)            
+            actor.inventory.remove(item)
+            self.publish(WorldEvent.BUILDING_CHANGED, actor)
             return ActionResult(True, "You install a generator. It needs fuel to operate.")
         
     def fuel_generator(self, actor, item):
@@ -241,6 +271,7 @@ class BuildingBlock(CityBlock):
             actor.ap -= 1
             self.fuel_expiration = actor.game.ticker + FUEL_DURATION
             self.lights_on = True
+            self.publish(WorldEvent.LIGHTS_CHANGED, actor)
             actor.inventory.remove(item)            
             return ActionResult(True, "You fuel the generator. The lights are now on.")
         
@@ -254,7 +285,7 @@ class BuildingBlock(CityBlock):
         if self.ruined:
             if not self.lights_on:
                 return ActionResult(False, "Ruined buildings need to be powered in order to be repaired.")
-            elif not SkillType.CONSTRUCTION in actor.human_skills:
+            elif not actor.stats.can_rebuild:
                 return ActionResult(False, "You need the Construction skill to repair ruins.")
             else:
                 message = "You repair the damage to the building, clearing the rubble and cleaning up the mess."
@@ -262,7 +293,8 @@ class BuildingBlock(CityBlock):
             message = "You repaired the interior of the building and cleaned up the mess."
         actor.ap -= 1
         self.ransack_level = 0
-        self.ruined = False        
+        self.ruined = False
+        self.publish(WorldEvent.BUILDING_CHANGED, actor)
         return ActionResult(True, message)
 
     def dump(self, actor):
@@ -272,6 +304,7 @@ class BuildingBlock(CityBlock):
         if block_npcs.dead_bodies:
             dead_body = random.choice(block_npcs.dead_bodies)
             dead_body.inside = False
+            dead_body.state.publish(WorldEvent.CHARACTER_LEFT)
             actor.ap -= 1
             message = "You dump a body outside."
             witness = f"{actor.current_name} dumps a body outside."
@@ -279,90 +312,65 @@ class BuildingBlock(CityBlock):
 
 
     class BarricadeLevel:
-        """Model barricade levels for buildings"""
-        def __init__(self, level=0):
-            # Set default barricade level (0 by default, i.e., no barricade)
-            self.level = level
-            self.set_barricade_level(level)
-            self.sublevel = 0
-            self.successful_hits = 0
-
-        def set_barricade_level(self, level):
-            """
-            Sets the barricade level. 
-            If the level is out of bounds (less than 0 or greater than 7), it will be capped at 0 or 7.
-            """
-            self.level = max(0, min(level, 7))  # Keep the level within the bounds
-            self.description = self.get_barricade_description()
+        """Model barricade levels for buildings.
 
-        def adjust_barricade_level(self, delta):
-            """
-            Adjust the barricade level by adding or subtracting `delta`.
-            """
-            new_level = self.level + delta
-            self.set_barricade_level(new_level)
+        The level, sublevel and hits taken are held together as one barricade HP value, which
+        indexes the shared BARRICADE_TABLE of stages and their transitions.
+        """
+        __slots__ = ('hp', 'stage')
 
-        def adjust_barricade_sublevel(self, delta):
-            """
-            Adjust the barricade sublevel by adding or subtracting `delta`.
-            Levels 0-1 have 1 sublevel. Levels 2-6 have 3 sublevels. Level 7 has 5 sublevels.
-            """
-            new_sublevel = self.sublevel + delta
+        def __init__(self, hp=0):
+            self.set_hp(hp)
 
-            if self.level <= 1 and new_sublevel > 0:
-                self.adjust_barricade_level(1)
-                self.successful_hits = 0
-                return True
-            
-            elif self.level <= 2 and new_sublevel < 0:
-                self.adjust_barricade_level(-1)
-                self.successful_hits = 0
-                return True
-
-            elif 3 <= self.level <= 7 and new_sublevel < 0:
-                self.adjust_barricade_level(-1)
-                self.sublevel = 2
-                self.successful_hits = 0
-                return True
-
-            elif 2 <= self.level < 7 and new_sublevel < 3:
-                self.sublevel = new_sublevel
-                self.successful_hits = 0
-                return True
-
-            elif 2 <= self.level < 7 and new_sublevel >= 3:
-                self.adjust_barricade_level(1)
-                self.sublevel = 0
-                self.successful_hits = 0
-                return True
-
-            elif self.level == 7 and 0 <= new_sublevel < 5:
-                self.sublevel = new_sublevel
-                self.successful_hits = 0
-                return True
+        def set_hp(self, hp):
+            self.hp = max(0, min(hp, BARRICADE_MAX_HP))
+            self.stage = BARRICADE_TABLE[self.hp]
 
-            else:
-                return False     
+        @property
+        def level(self):
+            return self.stage.level
+
+        @property
+        def sublevel(self):
+            return self.stage.sublevel
+
+        def set_barricade_level(self, level, sublevel=0):
+            """
+            Sets the barricade level and sublevel, clearing any hits taken.
+            If the level is out of bounds (less than 0 or greater than 7), it will be capped at 0 or 7.
+            """
+            level = max(0, min(level, BARRICADE_MAX_LEVEL))
+            sublevel = max(0, min(sublevel, BARRICADE_SUBLEVELS[level] - 1))
+            self.set_hp(BARRICADE_HP[(level, sublevel)])
+
+        def build(self):
+            """Add a stage of barricading. Returns False if the building is fully barricaded."""
+            built = self.stage.built
+            if built is None:
+                return False
+            self.set_hp(built)
+            return True
 
         def register_hit(self):
             """Register a successful hit on the barricade."""
-            self.successful_hits += 1
-            if self.successful_hits == 3:
-                self.adjust_barricade_sublevel(-1)
-                self.successful_hits = 0
+            if self.hp > 0:
+                self.set_hp(self.hp - 1)
+
+        def register_hits(self, count):
+            """Register a number of successful hits at once, returning how many landed before it fell."""
+            landed = min(count, self.hp)
+            if landed:
+                self.set_hp(self.hp - landed)
+            return landed
 
         def get_barricade_description(self):
             """
             Returns the current description of the barricade.
             """
-            barricade_state = list(BarricadeState)[self.level]
-            return BARRICADE_DESCRIPTIONS[barricade_state]
-        
+            return self.stage.description
+
         def can_pass(self, actor):
             """Returns true if the actor can pass the barricade."""
-            if actor.is_human and self.level <= 4:
-                return True
-            elif not actor.is_human and self.level == 0:
-                return True
-            else:
-                return False
\ No newline at end of file
+            if actor.is_human:
+                return self.stage.human_passable
+            return self.stage.zombie_passable
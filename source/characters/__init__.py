@@ -3,11 +3,14 @@
 from dataclasses import dataclass
 
 from settings import *
-from data import ITEMS, ItemType, ItemFunction, SKILLS, SkillType, SkillCategory, OCCUPATIONS
+from data import ITEMS, ItemType, ItemFunction, SKILLS, SkillType, SkillCategory, OCCUPATIONS, SKILL_BITS, get_skill_mask
 from characters.items import Item, Weapon
+from characters.inventory import Inventory
 from characters.human_state import Human
 from characters.zombie_state import Zombie
 from characters.actions import ActionExecutor
+from characters.stats import get_character_stats
+from event_bus import WorldEvent
 
 
 @dataclass
@@ -24,8 +27,7 @@ class Character:
         self.name = name
         self.occupation = occupation
         self.location = (x, y)
-        self.max_hp = MAX_HP
-        self.hp = self.max_hp
+        self.hp = MAX_HP
         self.ap = 0
         self.xp = 0
         self.level = 0
@@ -33,10 +35,13 @@ class Character:
         self.permadeath = False
         self.is_human = is_human
         self.inside = inside
-        self.inventory = []
+        self.inventory = Inventory()
         self.equipped = None
+        self.weapon = None
         self.human_skills = set()
         self.zombie_skills = set()
+        self.skill_mask = 0 # Bitmask of every acquired skill
+        self.stats = None # CharacterStats derived from the skills and form
         self.action = ActionExecutor(game, self)
         self.safehouse = None
         self.current_goal = None
@@ -46,6 +51,10 @@ class Character:
         self.add_starting_items()
 
 
+    @property
+    def max_hp(self):
+        return self.stats.max_hp
+
     def get_state(self):
         """Set state based on is_human."""
         if self.is_human:
@@ -53,6 +62,7 @@ class Character:
         else:
             self.state = Zombie(self)
         self.state.update_name()
+        self.update_stats()
 
     def add_starting_skill(self):
         """Adds a starting skill depending on player's occupation."""
@@ -77,29 +87,28 @@ class Character:
                 self.zombie_skills.add(skill)
             else:
                 self.human_skills.add(skill)
-
-            self.apply_skill_effect(skill)
+            self.skill_mask |= SKILL_BITS[skill]
+            self.update_stats()
             self.level += 1
 
-    def has_skill(self, skill):
-        """Check if a character has a particular skill."""
-        return skill in self.human_skills or skill in self.zombie_skills
+    def update_skill_mask(self):
+        """Rebuild the skill bitmask after skills are restored directly into the skill sets."""
+        self.skill_mask = get_skill_mask(self.human_skills | self.zombie_skills)
+        self.update_stats()
 
-    def apply_skill_effect(self, skill, remove=False):
-        """Apply or remove the passive effects of a skill."""
-        if remove:
-            modifier = -1
-        else:
-            modifier = 1
+    def update_stats(self):
+        """Refresh the derived stats after the skills or the human/zombie form change."""
+        self.stats = get_character_stats(self.skill_mask, self.is_human)
 
-        if skill == SkillType.BODY_BUILDING:
-            self.max_hp += 10 * modifier
-        elif skill == SkillType.FLESH_ROT:
-            self.max_hp += 10 * modifier
+    def has_skill(self, skill):
+        """Check if a character has a particular skill."""
+        return bool(self.skill_mask & SKILL_BITS[skill])
 
     def take_damage(self, amount, fatal=True):
         """Reduces the character's health by the given amount."""
         self.hp -= amount
+        self.state.invalidate_plan()
+        self.game.scheduler.wake(self)
         if self.hp <= 0:
             if fatal:
                 self.hp = 0
@@ -118,10 +127,7 @@ class Character:
         self.is_dead = True
         self.is_human = True
         self.get_state()
-        for skill in self.zombie_skills:
-            self.apply_skill_effect(skill, remove=True)
-        for skill in self.human_skills:
-            self.apply_skill_effect(skill)    
+        self.state.publish(WorldEvent.CHARACTER_REVIVED)
 
     def gain_xp(self, xp):
         """Gain a certain amount of experience points."""
@@ -0,0 +1,275 @@
+# combat_engine.py
+
+import random
+from dataclasses import dataclass
+
+from settings import *
+from data import Action, ActionResult, ITEMS, ItemFunction, ItemType, SkillType, SKILL_BITS
+
+try:
+    import numpy
+except ImportError:
+    numpy = None # Without numpy, attack rolls are drawn one at a time
+
+
+UNARMED = 'punch'
+ZOMBIE_MODES = tuple(ZOMBIE_ATTACKS) # Zombies pick one at random for each attack
+
+# Skill bonuses for each attack mode, as (skills needed, hit chance bonus, damage bonus)
+FIREARM_BONUSES = (
+    ((SkillType.BASIC_FIREARMS_TRAINING,), 25, 0),
+)
+MELEE_BONUSES = (
+    ((SkillType.HAND_TO_HAND,), 15, 0),
+)
+ZOMBIE_BONUSES = (
+    ((SkillType.VIGOUR_MORTIS,), 10, 0),
+)
+ATTACK_BONUSES = {
+    ItemType.PISTOL: FIREARM_BONUSES + (
+        ((SkillType.PISTOL_TRAINING,), 25, 0),
+        ((SkillType.ADV_PISTOL_TRAINING,), 10, 0),
+    ),
+    ItemType.SHOTGUN: FIREARM_BONUSES + (
+        ((SkillType.SHOTGUN_TRAINING,), 25, 0),
+        ((SkillType.ADV_SHOTGUN_TRAINING,), 10, 0),
+    ),
+    ItemType.KNIFE: MELEE_BONUSES + (
+        ((SkillType.KNIFE_COMBAT,), 15, 0),
+    ),
+    ItemType.FIRE_AXE: MELEE_BONUSES + (
+        ((SkillType.AXE_PROFICIENCY,), 15, 0),
+    ),
+    'hands': ZOMBIE_BONUSES + (
+        ((SkillType.DEATH_GRIP,), 15, 0),
+        ((SkillType.DEATH_GRIP, SkillType.REND_FLESH), 0, 1),
+    ),
+    'teeth': ZOMBIE_BONUSES + (
+        ((SkillType.NECK_LURCH,), 10, 0),
+    ),
+}
+
+# Base hit chance (percent) and damage for each attack mode
+ATTACK_STATS = {
+    UNARMED: ((21 - ATTACK_DIFFICULTY) * 5, 1), # A d20 roll of at least ATTACK_DIFFICULTY
+    **{mode: (stats['attack'], stats['damage']) for mode, stats in ZOMBIE_ATTACKS.items()},
+}
+for item_type, properties in ITEMS.items():
+    if properties.item_function == ItemFunction.FIREARM:
+        ATTACK_BONUSES.setdefault(item_type, FIREARM_BONUSES)
+    elif properties.item_function == ItemFunction.MELEE:
+        ATTACK_BONUSES.setdefault(item_type, MELEE_BONUSES)
+    else:
+        continue
+    ATTACK_STATS[item_type] = (properties.attack, properties.damage)
+
+
+def _get_skill_mask(skills):
+    mask = 0
+    for skill in skills:
+        mask |= SKILL_BITS[skill]
+    return mask
+
+
+# Bonuses as (skill mask, hit bonus, damage bonus), and the skills that matter to each mode
+ATTACK_BONUS_MASKS = {
+    mode: tuple((_get_skill_mask(skills), hit, damage) for skills, hit, damage in bonuses)
+    for mode, bonuses in ATTACK_BONUSES.items()
+}
+ATTACK_SKILL_MASKS = {
+    mode: _get_skill_mask(skill for skills, _, _ in bonuses for skill in skills)
+    for mode, bonuses in ATTACK_BONUSES.items()
+}
+
+
+@dataclass
+class AttackProfile:
+    mode: object # ItemType of the weapon, UNARMED, or a ZOMBIE_ATTACKS key
+    chance: int # Percent chance to hit
+    damage: int
+
+
+@dataclass
+class AttackIntent:
+    attacker: object
+    target: object
+    profiles: tuple # AttackProfiles to pick from at random
+
+
+_profiles = {} # AttackProfile keyed by mode and the relevant skills held
+
+
+def get_attack_profile(mode, skill_mask):
+    """Return the hit chance and damage of an attack mode for a character with the given skills."""
+    skill_mask &= ATTACK_SKILL_MASKS.get(mode, 0)
+    profile = _profiles.get((mode, skill_mask))
+    if profile is None:
+        chance, damage = ATTACK_STATS[mode]
+        for required, hit_bonus, damage_bonus in ATTACK_BONUS_MASKS.get(mode, ()):
+            if skill_mask & required == required:
+                chance += hit_bonus
+                damage += damage_bonus
+        profile = _profiles[(mode, skill_mask)] = AttackProfile(mode, chance, damage)
+    return profile
+
+
+def get_attack_profiles(character):
+    """Return the attack profiles a character picks from, or None if it can't attack by weapon.
+
+    Science items and empty firearms are left to the character's own attack rules.
+    """
+    stats = character.stats
+    weapon = character.weapon
+    if not character.is_human or weapon is None:
+        return stats.natural_attacks
+
+    properties = ITEMS[weapon.type]
+    if properties.item_function == ItemFunction.SCIENCE:
+        return None
+    if properties.item_function == ItemFunction.FIREARM and weapon.loaded_ammo == 0:
+        return None
+    profile = stats.attacks.get(weapon.type)
+    if profile is None:
+        return stats.natural_attacks # Other items make poor weapons
+    return (profile,)
+
+
+class CombatEngine:
+    """Resolves attacks in batches.
+
+    NPC attacks are queued as they are decided and resolved together at the end of the batch:
+    attack modes and hit rolls are drawn for the whole batch at once against cached per-attacker
+    profiles, then damage, XP and deaths are applied in queue order. Animations and messages are
+    only produced for attacks the player can see.
+    """
+    def __init__(self, game):
+        self.game = game
+        self.intents = [] # AttackIntents awaiting resolution
+
+    def submit(self, attacker, target):
+        """Queue an NPC attack. Returns False if the attack has to be resolved on its own."""
+        profiles = get_attack_profiles(attacker)
+        if profiles is None:
+            return False
+        self.intents.append(AttackIntent(attacker, target, profiles))
+        return True
+
+    def attack(self, attacker, target):
+        """Resolve a single attack immediately, returning its result."""
+        intent = AttackIntent(attacker, target, get_attack_profiles(attacker))
+        return self._resolve([intent])[0]
+
+    def resolve(self):
+        """Resolve every queued attack, reporting those the player witnessed."""
+        intents, self.intents = self.intents, []
+        if not intents:
+            return
+
+        for intent, result in zip(intents, self._resolve(intents)):
+            if result:
+                intent.attacker.state.report(Action.ATTACK, intent.target, result)
+
+    def _resolve(self, intents):
+        profiles, hits = self._roll(intents)
+        return [
+            self._apply(intent, profile, hit)
+            for intent, profile, hit in zip(intents, profiles, hits)
+        ]
+
+    def _roll(self, intents):
+        """Pick each attack's mode and roll to hit, for the whole batch at once."""
+        count = len(intents)
+        if numpy is not None:
+            choices, rolls = numpy.random.random((2, count))
+            mode_counts = numpy.fromiter((len(intent.profiles) for intent in intents), dtype=int, count=count)
+            modes = (choices * mode_counts).astype(int).tolist()
+            profiles = [intent.profiles[mode] for intent, mode in zip(intents, modes)]
+            chances = numpy.fromiter((profile.chance for profile in profiles), dtype=float, count=count)
+            hits = (rolls * 100 < chances).tolist()
+        else:
+            profiles = [random.choice(intent.profiles) for intent in intents]
+            hits = [random.random() * 100 < profile.chance for profile in profiles]
+        return profiles, hits
+
+    def _apply(self, intent, profile, hit):
+        attacker, target = intent.attacker, intent.target
+
+        # Earlier attacks in the batch may have killed either side
+        if attacker.is_dead or target.is_dead:
+            return None
+        # or used up an NPC's AP (the player's AP isn't metered)
+        if attacker.ap < 1 and attacker is not self.game.state.player:
+            return None
+        if attacker.location != target.location or attacker.inside != target.inside:
+            return None
+
+        attacker.ap -= 1
+        if not hit:
+            return ActionResult(Action.ATTACK, False, target, message="Your attack misses.")
+
+        weapon_broke = False
+        if profile.mode in ITEMS:
+            weapon_broke = self._deplete_weapon(attacker)
+
+        target.take_damage(profile.damage)
+        attacker.gain_xp(profile.damage)
+        killed = target.is_dead
+        if killed:
+            attacker.gain_xp(10)
+
+        headshot = killed and profile.mode in ITEMS and attacker.stats.headshot
+        if headshot:
+            target.permadeath = True
+
+        player = self.game.state.player
+        if player.location != target.location:
+            return ActionResult(Action.ATTACK, True, target) # Nobody to describe it to
+
+        if player.inside == target.inside:
+            self._animate(target, killed)
+        return self._describe(attacker, target, profile, headshot, weapon_broke)
+
+    def _deplete_weapon(self, attacker):
+        """Use up ammo or durability. Returns True if the weapon broke."""
+        weapon = attacker.weapon
+        properties = ITEMS[weapon.type]
+        if properties.item_function == ItemFunction.FIREARM:
+            weapon.loaded_ammo -= 1
+        elif properties.item_function == ItemFunction.MELEE:
+            weapon.durability -= 1
+            if weapon.durability <= 0:
+                attacker.inventory.remove(weapon)
+                attacker.weapon = None
+                return True
+        return False
+
+    def _animate(self, target, killed):
+        """Play the target's hurt or death animation in the description panel."""
+        sprite = self.game.game_ui.description_panel.get_npc_sprite(target)
+        if sprite:
+            sprite.set_action(2 if killed else 3)
+
+    def _describe(self, attacker, target, profile, headshot, weapon_broke):
+        if profile.mode == UNARMED:
+            message = f"You punch the enemy for {profile.damage} damage."
+            witness = f"{attacker.current_name} punches {target.current_name}."
+            attacked = f"{attacker.current_name} punches you for {profile.damage} damage!"
+
+        elif profile.mode in ITEMS:
+            description = ITEMS[profile.mode].description
+            if headshot:
+                message = f"You deal a headshot for {profile.damage} damage."
+                witness = f"{attacker.current_name} deals a headshot against {target.current_name} with {description}."
+            else:
+                message = f"Your attack hits for {profile.damage} damage."
+                witness = f"{attacker.current_name} attacks {target.current_name} with {description}."
+            if weapon_broke:
+                message += " Your weapon breaks!"
+            attacked = f"{attacker.current_name} attacks you with {description} for {profile.damage} damage!"
+
+        else:
+            message = f"You attack {target.current_name} with {profile.mode} for {profile.damage} damage."
+            witness = f"{attacker.current_name} attacks {target.current_name} with {profile.mode}."
+            attacked = f"{attacker.current_name} attacks you with {profile.mode} for {profile.damage} damage!"
+
+        return ActionResult(Action.ATTACK, True, target, message=message, witness=witness, attacked=attacked)
@@ -1,13 +1,11 @@
 # environment.py
 
-import pygame
-
 class EnvironmentHandler:
 
     @staticmethod
     def close_doors(executor, target):
         if executor.is_player:
-            pygame.mixer.Sound.play(executor.game.sounds["door_close"])                
+            executor.game.audio.play("door_close")                
             executor.action_progress.start("Closing doors", executor.block.close_doors, executor.actor)
         else:
             return executor.block.close_doors(executor.actor)
@@ -15,7 +13,7 @@ class EnvironmentHandler:
     @staticmethod
     def open_doors(executor, target):
         if executor.is_player:
-            pygame.mixer.Sound.play(executor.game.sounds["door_open"])                
+            executor.game.audio.play("door_open")                
             executor.action_progress.start("Opening doors", executor.block.open_doors, executor.actor)
         else:
             return executor.block.open_doors(executor.actor)
@@ -23,7 +21,7 @@ class EnvironmentHandler:
     @staticmethod
     def barricade(executor, target):
         if executor.is_player:
-            pygame.mixer.Sound.play(executor.game.sounds["barricade"])                
+            executor.game.audio.play("barricade")                
             executor.action_progress.start("Barricading", executor.block.add_barricades, executor.actor)
         else:
             return executor.block.add_barricades(executor.actor)
@@ -31,7 +29,7 @@ class EnvironmentHandler:
     @staticmethod
     def search(executor, target):
         if executor.is_player:
-            pygame.mixer.Sound.play(executor.game.sounds["search"])                
+            executor.game.audio.play("search")                
             executor.action_progress.start("Searching", executor.block.search, executor.actor)
         else:
             return executor.block.search(executor.actor)
@@ -46,7 +44,7 @@ class EnvironmentHandler:
     @staticmethod
     def decade(executor, target):
         if executor.is_player:
-            pygame.mixer.Sound.play(executor.game.sounds["decade"])                
+            executor.game.audio.play("decade")                
             executor.action_progress.start("Smashing", executor.block.decade, executor.actor)
         else:
             return executor.block.decade(executor.actor)
@@ -54,7 +52,7 @@ class EnvironmentHandler:
     @staticmethod
     def ransack(executor, target):
         if executor.is_player:
-            pygame.mixer.Sound.play(executor.game.sounds["decade"])                
+            executor.game.audio.play("decade")                
             executor.action_progress.start("Ransacking", executor.block.ransack, executor.actor)
         else:
             return executor.block.ransack(executor.actor)        
@@ -62,7 +60,7 @@ class EnvironmentHandler:
     @staticmethod
     def dump(executor, target):
         if executor.is_player:
-            pygame.mixer.Sound.play(executor.game.sounds["door_close"])                
+            executor.game.audio.play("door_close")                
             executor.action_progress.start("Dumping body", executor.block.dump, executor.actor)
         else:
             return executor.block.dump(executor.actor)
\ No newline at end of file
@@ -1,13 +1,11 @@
 # movement.py
 
-import pygame
-
 class MovementHandler:
     
     @staticmethod
     def enter(executor, target):
         if executor.is_player and executor.block.barricade.can_pass(executor.actor):
-            pygame.mixer.Sound.play(executor.game.sounds["footsteps"])                
+            executor.game.audio.play("footsteps")                
             action_result = executor.screen_transition.circle_wipe(executor.player.state.enter, executor.game.chat_history)
         else:
             action_result = executor.actor.state.enter()
@@ -16,7 +14,7 @@ class MovementHandler:
     @staticmethod
     def leave(executor, target):
         if executor.is_player and executor.block.barricade.can_pass(executor.actor):
-            pygame.mixer.Sound.play(executor.game.sounds["footsteps"])                
+            executor.game.audio.play("footsteps")                
             action_result = executor.screen_transition.circle_wipe(executor.player.state.leave, executor.game.chat_history)
         else:
             action_result = executor.actor.state.leave()
@@ -0,0 +1,94 @@
+# siege.py
+
+from dataclasses import dataclass, field
+
+from settings import *
+from data import Action, ActionResult
+from event_bus import WorldEvent
+from profiler import PROFILER
+
+
+SIEGE_ACTIONS = (Action.DECADE, Action.BARRICADE)
+
+
+@dataclass
+class Siege:
+    """The barricade attacks and repairs queued against one building during a batch."""
+    block: object
+    attackers: list = field(default_factory=list) # Characters smashing at the barricades, in queue order
+    builders: list = field(default_factory=list) # (attackers queued before, character) pairs
+
+
+class SiegeResolver:
+    """Resolves barricading and barricade smashing per building, once per batch.
+
+    NPC attempts are queued as they are decided. Each building's queue is then played back in
+    order: the runs of smashing between barricading attempts land as a single change to the
+    barricade HP, so a horde costs the same as one zombie. The outcome matches resolving every
+    attempt on its own.
+    """
+    def __init__(self, game):
+        self.game = game
+        self.sieges = {} # Siege keyed by building location
+
+    def submit(self, actor, action):
+        """Queue an NPC's barricade action. Returns False if it has to be resolved on its own."""
+        block = self.game.state.city.block(*actor.location)
+        if not hasattr(block, 'barricade'):
+            return False
+
+        siege = self.sieges.get(actor.location)
+        if siege is None:
+            siege = self.sieges[actor.location] = Siege(block)
+        if action == Action.DECADE:
+            siege.attackers.append(actor)
+        else:
+            siege.builders.append((len(siege.attackers), actor))
+        return True
+
+    def resolve(self):
+        """Resolve every queued siege, reporting what the player witnessed."""
+        sieges, self.sieges = self.sieges, {}
+        PROFILER.set_counter("sieges", len(sieges))
+        for siege in sieges.values():
+            self._resolve_siege(siege)
+
+    def _resolve_siege(self, siege):
+        block = siege.block
+        queued = 0
+        for queued_before, builder in siege.builders:
+            self._smash(block, siege.attackers[queued:queued_before])
+            queued = queued_before
+            if self._is_present(builder, block):
+                builder.state.report(Action.BARRICADE, None, block.add_barricades(builder))
+        self._smash(block, siege.attackers[queued:])
+
+    def _is_present(self, actor, block):
+        """Check an actor is still alive and at the building, as the player may have acted since."""
+        return not actor.is_dead and actor.location == (block.x, block.y)
+
+    def _smash(self, block, attackers):
+        """Land a run of attacks on the barricade at once. Attacks after it falls cost nothing."""
+        attackers = [actor for actor in attackers if self._is_present(actor, block)]
+        if not attackers:
+            return
+
+        landed = block.barricade.register_hits(len(attackers))
+        if not landed:
+            return
+        for actor in attackers[:landed]:
+            actor.ap -= 1
+
+        last = attackers[landed - 1]
+        block.publish(WorldEvent.BARRICADE_CHANGED, last)
+
+        player = self.game.state.player
+        if player.location == last.location:
+            if block.barricade.level == 0:
+                message = "You smash at the barricades. The last piece of it falls away."
+                witness = "Something smashes through the last of the barricades."
+            else:
+                message = "You smash at the barricades."
+                witness = "Something smashes at the barricades."
+            result = ActionResult(Action.DECADE, True, message=message, witness=witness, sfx='decade')
+            last.state.report(Action.DECADE, None, result)
@@ -1,5 +1,9 @@
 # system.py
 
+from data import Action, ActionResult
+from profiler import PROFILER
+
+
 class SystemHandler:
 
     @staticmethod
@@ -62,4 +66,18 @@ class SystemHandler:
 
     @staticmethod
     def zoom_out(executor, target):
-        executor.game.game_ui.map.zoom_in = False       
\ No newline at end of file
+        executor.game.game_ui.map.zoom_in = False
+
+    @staticmethod
+    def map_layer(executor, target):
+        executor.game.game_ui.map.zoom_in = False
+        executor.game.game_ui.map.cycle_layer()
+
+    @staticmethod
+    def toggle_profiler(executor, target):
+        PROFILER.toggle()
+
+    @staticmethod
+    def dump_trace(executor, target):
+        path = PROFILER.dump_trace()
+        return ActionResult(Action.DUMP_TRACE, True, message=f"Frame trace saved to {path}")
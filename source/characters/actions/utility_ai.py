@@ -1,33 +1,192 @@
 # utility_ai.py
 
-from data import Decision, Goal
+from collections import Counter
+
+from settings import *
+from characters.ai.decisions import is_wounded
+from data import Decision, Goal, BLOCKS, BlockType, ITEMS, ItemType, ItemFunction, Occupation, OccupationCategory, OCCUPATIONS
+
+try:
+    import numpy
+except ImportError:
+    numpy = None # Without numpy, NPCs fall back to their per-NPC behaviour rules
+
+
+# Feature columns gathered for each NPC; every value lies between 0 and 1
+FEATURES = (
+    'bias', 'wounded', 'injured', 'inside', 'outside', 'at_shelter', 'doors_open',
+    'weapon_ready', 'weapon_stowed', 'has_fak', 'needs_fak', 'can_search', 'can_power', 'can_repair', 'can_barricade',
+    'zombies_here', 'consumer', 'civilian', 'science', 'military',
+)
+
+# Decisions the engine can choose, with the features that must be non-zero for each to be valid
+DECISION_REQUIREMENTS = {
+    Decision.FLEE: ('zombies_here',),
+    Decision.ATTACK_TO_KILL: ('zombies_here', 'weapon_ready'),
+    Decision.ARM_THYSELF: ('weapon_stowed',),
+    Decision.HEAL_THYSELF: ('injured', 'has_fak'),
+    Decision.SEEK_FAK: ('needs_fak',),
+    Decision.ENTER_SAFEHOUSE: ('outside', 'at_shelter'),
+    Decision.SCOUT_SAFEHOUSE: ('outside',),
+    Decision.SECURE_SAFEHOUSE: ('inside', 'doors_open'),
+    Decision.SEEK_ITEMS: ('can_search',),
+    Decision.POWER_SAFEHOUSE: ('can_power',),
+    Decision.REPAIR_SAFEHOUSE: ('can_repair',),
+    Decision.BARRICADE_SAFEHOUSE: ('can_barricade',),
+}
+DECISIONS = tuple(DECISION_REQUIREMENTS)
+
+# Score contributed by each feature to each decision
+DECISION_WEIGHTS = {
+    Decision.FLEE: {'zombies_here': 20, 'wounded': 30, 'consumer': 60, 'weapon_ready': -40},
+    Decision.ATTACK_TO_KILL: {'bias': 50, 'military': 20, 'wounded': -30},
+    Decision.ARM_THYSELF: {'bias': 45, 'zombies_here': 30, 'consumer': -100},
+    Decision.HEAL_THYSELF: {'bias': 20, 'wounded': 50},
+    Decision.SEEK_FAK: {'bias': 25, 'wounded': 20},
+    Decision.ENTER_SAFEHOUSE: {'bias': 70},
+    Decision.SCOUT_SAFEHOUSE: {'bias': 40},
+    Decision.SECURE_SAFEHOUSE: {'bias': 60},
+    Decision.SEEK_ITEMS: {'bias': 40},
+    Decision.POWER_SAFEHOUSE: {'bias': 35},
+    Decision.REPAIR_SAFEHOUSE: {'bias': 33},
+    Decision.BARRICADE_SAFEHOUSE: {'bias': 32},
+}
+
+# Extra score for decisions that align with a character's current goal
+GOAL_BIASES = {
+    Goal.SECURE_SHELTER: {Decision.SCOUT_SAFEHOUSE: 30, Decision.ENTER_SAFEHOUSE: 30, Decision.SECURE_SAFEHOUSE: 20},
+    Goal.SURVIVE: {Decision.HEAL_THYSELF: 40, Decision.SEEK_FAK: 30, Decision.FLEE: 30},
+}
+GOALS = tuple(Goal)
+
+SHELTER_TYPES = {BlockType.FACTORY, BlockType.AUTO_REPAIR, BlockType.WAREHOUSE}
+WEAPON_FUNCTIONS = {ItemFunction.MELEE, ItemFunction.FIREARM}
 
 
 class UtilityAI:
-    def __init__(self, character):
-        self.character = character
-
-        self.goal_decisions = {
-            Decision.SCOUT_SAFEHOUSE: self.score_scout_safehouse(),
-            Decision.ATTACK_TO_KILL: self.score_attack_to_kill(),
-            Decision.SEEK_ITEMS: self.score_seek_items(),
-            Decision.SECURE_SAFEHOUSE: self.score_secure_safehouse(),
-            Decision.BARRICADE_SAFEHOUSE: self.score_barricade_safehouse(),
-            Decision.ENTER_SAFEHOUSE: self.score_enter_safehouse(),
-            Decision.DEFEND_SAFEHOUSE: self.score_defend_safehouse(),
-            Decision.POWER_SAFEHOUSE: self.score_power_safehouse(),
-            Decision.ARM_THYSELF: self.score_arm_thyself(),
-            Decision.HEAL_THYSELF: self.score_heal_thyself(),
-            Decision.DUMP_BODIES: self.score_dump_bodies(),
-            Decision.HUNT: self.score_hunt(),
-            Decision.PATROL: self.score_patrol(),
-            Decision.FLEE: self.score_flee(),
+    """Scores every decision for a batch of human NPCs at once and picks the best for each."""
+    def __init__(self, enabled=True):
+        self.enabled = enabled and numpy is not None
+        if not self.enabled:
+            return
+
+        feature_index = {feature: column for column, feature in enumerate(FEATURES)}
+
+        # Features x decisions weight matrix
+        self.weights = numpy.zeros((len(FEATURES), len(DECISIONS)))
+        for column, decision in enumerate(DECISIONS):
+            for feature, weight in DECISION_WEIGHTS[decision].items():
+                self.weights[feature_index[feature], column] = weight
+
+        # Goals x decisions bias matrix, with a final all-zero row for characters without a goal
+        self.goal_biases = numpy.zeros((len(GOALS) + 1, len(DECISIONS)))
+        for goal, biases in GOAL_BIASES.items():
+            for decision, bias in biases.items():
+                self.goal_biases[GOALS.index(goal), DECISIONS.index(decision)] = bias
+
+        # Features x decisions count of requirements, compared against the requirements met
+        self.requirements = numpy.zeros((len(FEATURES), len(DECISIONS)))
+        for column, decision in enumerate(DECISIONS):
+            for feature in DECISION_REQUIREMENTS[decision]:
+                self.requirements[feature_index[feature], column] = 1
+        self.requirement_counts = self.requirements.sum(axis=0)
+
+    def assign(self, characters):
+        """Store the best decision on the state of each human NPC that needs a new plan."""
+        if not self.enabled:
+            return
+        humans = [
+            character for character in characters
+            if character.is_human and not character.is_dead and character is not character.game.state.player
+            and character.state.planner.needs_plan()
+        ]
+        for character in humans:
+            character.state.planner.update_goal() # Goal biases use the goal the NPC will re-plan under
+        for character, decision in zip(humans, self.decide(humans)):
+            character.state.decision = decision
+
+    def decide(self, characters):
+        """Return the highest scoring valid decision for each character, or None if none is valid."""
+        if not characters:
+            return []
+        scores = self.score(characters)
+        best = scores.argmax(axis=1)
+        valid = numpy.isfinite(scores[numpy.arange(len(characters)), best])
+        return [DECISIONS[column] if ok else None for column, ok in zip(best, valid)]
+
+    def score(self, characters):
+        """Return the characters x decisions score matrix, with invalid decisions at -inf."""
+        features = self._get_features(characters)
+        goals = numpy.array([self._get_goal_row(character) for character in characters])
+
+        scores = features @ self.weights + self.goal_biases[goals]
+        met = (features > 0) @ self.requirements
+        return numpy.where(met == self.requirement_counts, scores, -numpy.inf)
+
+    def _get_goal_row(self, character):
+        goal = getattr(character.state, 'current_goal', None)
+        return GOALS.index(goal) if goal in GOALS else len(GOALS)
+
+    def _get_features(self, characters):
+        """Gather the characters x features matrix, counting zombies per block in a single pass."""
+        state = characters[0].game.state
+        city = state.city
+        zombie_counts = Counter(
+            (npc.location, npc.inside) for npc in state.npcs.list
+            if not npc.is_human and not npc.is_dead
+        )
+        occupation_categories = {
+            OccupationCategory.CIVILIAN: 'civilian',
+            OccupationCategory.SCIENCE: 'science',
+            OccupationCategory.MILITARY: 'military',
         }
 
-        # Increase weight for decisions that align with current goal
-        if self.character.current_goal == Goal.SECURE_SHELTER:
-            scores[Decision.SCOUT_SAFEHOUSE] += 30
-        elif self.character.current_goal == Goal.LEVEL_UP:
-            scores[Decision.HUNT] += 40
-        elif self.character.current_goal == Goal.SURVIVE:
-            scores[Decision.HEAL_THYSELF] += 40
\ No newline at end of file
+        rows = []
+        for character in characters:
+            block = city.block(*character.location)
+            is_building = BLOCKS[block.type].is_building
+            inside = character.inside and is_building
+            inventory = character.inventory
+            has_weapon = inventory.has_weapon
+            weapon_ready = character.weapon is not None and ITEMS[character.weapon.type].item_function in WEAPON_FUNCTIONS
+            has_generator = inventory.has(ItemType.PORTABLE_GENERATOR)
+            has_fuel = inventory.has(ItemType.FUEL_CAN)
+            has_toolbox = inventory.has(ItemType.TOOLBOX)
+
+            values = dict.fromkeys(FEATURES, 0.0)
+            values['bias'] = 1.0
+            values['wounded'] = float(is_wounded(character))
+            values['injured'] = float(character.hp < character.max_hp - 10)
+            values['inside'] = float(inside)
+            values['outside'] = float(not character.inside)
+            values['at_shelter'] = float(block.type in SHELTER_TYPES)
+            values['doors_open'] = float(inside and not block.doors_closed)
+            values['weapon_ready'] = float(weapon_ready)
+            values['weapon_stowed'] = float(has_weapon and not weapon_ready)
+            values['has_fak'] = float(inventory.has(ItemType.FIRST_AID_KIT))
+            values['needs_fak'] = float(values['injured'] and not values['has_fak'])
+            values['can_search'] = float(inside and not (has_generator and has_fuel and has_toolbox and has_weapon))
+            values['can_power'] = float(inside and (
+                (has_generator and not block.generator_installed)
+                or (has_fuel and block.generator_installed and not block.lights_on)
+            ))
+            values['can_repair'] = float(inside and has_toolbox and (
+                (block.ransack_level > 0 and not block.ruined)
+                or (block.ruined and character.stats.can_rebuild)
+            ))
+            values['can_barricade'] = float(inside and has_toolbox and block.barricade.level < 4)
+            values['zombies_here'] = min(zombie_counts[(character.location, character.inside)] / BLOCK_CAPACITY, 1.0)
+
+            if character.occupation == Occupation.CONSUMER:
+                values['consumer'] = 1.0
+            else:
+                category = occupation_categories.get(OCCUPATIONS[character.occupation].occupation_category)
+                if category:
+                    values[category] = 1.0
+
+            rows.append([values[feature] for feature in FEATURES])
+
+        return numpy.array(rows)
+
+
+UTILITY_AI = UtilityAI(enabled=UTILITY_AI_ENABLED)
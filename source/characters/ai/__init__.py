@@ -1,4 +1,5 @@
 # __init__.py
 
-from ai.goal_manager import GoalManager
-from ai.decision_manager import DecisionManager
\ No newline at end of file
+from characters.ai.goal_manager import GoalManager
+from characters.ai.decision_manager import DecisionManager
+from characters.ai.planner import Planner
@@ -1,37 +1,21 @@
 # decision_manager.py
 
-from data import Goal
-from characters.ai.decisions import ScoutSafehouse, EnterSafehouse, SecureSafehouse, SeekFAK, HealThyself
+from characters.ai.decisions import DECISION_COMMANDS
 
 
 class DecisionManager:
     """Determines which decision an NPC should take based on its goal."""
 
-    # Mapping of goals to decision sequences
-    goal_decisions = {
-        Goal.SECURE_SHELTER: [
-            ScoutSafehouse(),
-            EnterSafehouse(),
-            SecureSafehouse(),
-        ],
-        Goal.SURVIVE: [
-            SeekFAK(),
-            HealThyself(),
-        ]
-    }
+    @staticmethod
+    def get_command(decision):
+        return DECISION_COMMANDS.get(decision)
 
     @staticmethod
-    def determine_decision(character):
+    def determine_decision(character, goal):
         """Returns the first valid decision for the NPC based on their goal."""
+        for decision in goal.decisions:
+            command = DECISION_COMMANDS[decision]
+            if command.is_valid(character) and not command.is_complete(character):
+                return command
 
-        # Get the character's current goal
-        goal = character.current_goal
-
-        # Get decision sequence for this goal
-        decisions = DecisionManager.goal_decisions.get(goal, [])
-
-        for decision in decisions:
-            if decision.is_valid(character):
-                return decision
-        
-        return None # No valid decision found
\ No newline at end of file
+        return None # No valid decision found
@@ -1,75 +1,247 @@
 # decisions.py
 
-from data import Action, ItemType
+from settings import *
+from data import Action, BLOCKS, BlockType, Decision, ItemType, ItemFunction, Occupation
+from characters.state import BehaviourResult
+from pathfinding import PathGoal
+
+
+SHELTER_TYPES = {BlockType.FACTORY, BlockType.AUTO_REPAIR, BlockType.WAREHOUSE}
+
+
+def get_block(character):
+    return character.game.state.city.block(*character.location)
+
+
+def is_inside_building(character):
+    return character.inside and BLOCKS[get_block(character).type].is_building
+
+
+def is_sheltered(character):
+    """Whether the character is inside a building with the doors closed."""
+    return is_inside_building(character) and get_block(character).doors_closed
+
+
+def is_wounded(character):
+    """Whether the character is hurt badly enough to put survival first."""
+    return character.hp < character.max_hp // 2
+
+
+def has_weapon_ready(character):
+    weapon = character.weapon
+    return weapon is not None and weapon.properties.item_function in (ItemFunction.MELEE, ItemFunction.FIREARM)
+
+
+def is_fully_equipped(character):
+    """Whether the character has everything worth searching for."""
+    inventory = character.inventory
+    return (inventory.has(ItemType.PORTABLE_GENERATOR) and inventory.has(ItemType.FUEL_CAN)
+            and inventory.has(ItemType.TOOLBOX) and inventory.has_weapon)
 
 
 class DecisionCommand:
-    """Base class for all AI decisions."""
+    """Base class for all AI decisions.
+
+    Decisions are stateless and shared by every character. A character keeps carrying out its
+    decision each turn until the decision is complete or no longer valid.
+    """
+    one_shot = False # Re-plan after a single action
 
     def is_valid(self, character):
-        """Checks if this decision is valid for the character."""
+        """Checks if this decision can be carried out by the character."""
         raise NotImplementedError("Subclasses must implement is_valid().")
-    
-    def execute(self, character, executor):
-        """Executes the decision's action using ActionExecutor."""
+
+    def is_complete(self, character):
+        """Checks if the decision has achieved what it set out to do."""
+        return False
+
+    def execute(self, character):
+        """Returns the behaviour that carries out the decision this turn."""
         raise NotImplementedError("Subclasses must implement execute().")
 
 
 class ScoutSafehouseDecision(DecisionCommand):
-    """Find a suitable safehouse based on NPC occupation."""
+    """Heads for the nearest building that makes a good safehouse."""
 
     def is_valid(self, character):
-        """Valid if the NPC does not already have a safehouse."""
-        return not character.has_safehouse
-    
-    def execute(self, character, executor):
-        """Finds the best safehouse and moves toward it."""
-        pass
+        return not character.inside
+
+    def is_complete(self, character):
+        return get_block(character).type in SHELTER_TYPES
+
+    def execute(self, character):
+        return character.state.step_toward(PathGoal.SHELTER)
 
 
 class EnterSafehouseDecision(DecisionCommand):
     """Enters the safehouse if standing outside of it."""
 
     def is_valid(self, character):
-        """Valid if the NPC is at the safehouse but not inside."""
+        return not character.inside and get_block(character).type in SHELTER_TYPES
+
+    def is_complete(self, character):
+        return character.inside
+
+    def execute(self, character):
+        return BehaviourResult(Action.ENTER)
 
-    def execute(self, character, executor):
-        """Enters the building."""
-        return executor.execute(Action.ENTER)
-    
 
 class SecureSafehouseDecision(DecisionCommand):
     """Closes the doors after entering the safehouse."""
 
     def is_valid(self, character):
-        """Valid if inside the safehouse and the doors are open."""
-        return character.inside and not character.safehouse_secured
-    
-    def execute(self, character, executor):
-        """Closes the doors to secure the safehouse."""
-        return executor.execute(Action.CLOSE_DOORS)
-    
+        return is_inside_building(character) and not get_block(character).doors_closed
+
+    def execute(self, character):
+        return BehaviourResult(Action.CLOSE_DOORS)
+
+
+class BarricadeSafehouseDecision(DecisionCommand):
+    """Barricades the safehouse up to a level that still lets survivors in."""
+
+    def is_valid(self, character):
+        return (is_inside_building(character) and character.inventory.has(ItemType.TOOLBOX)
+                and get_block(character).barricade.level < 4)
+
+    def execute(self, character):
+        return BehaviourResult(Action.BARRICADE)
+
+
+class RepairSafehouseDecision(DecisionCommand):
+    """Repairs a ransacked or ruined safehouse."""
+
+    def is_valid(self, character):
+        if not is_inside_building(character) or not character.inventory.has(ItemType.TOOLBOX):
+            return False
+        block = get_block(character)
+        if block.ruined:
+            return character.stats.can_rebuild
+        return block.ransack_level > 0
+
+    def execute(self, character):
+        return BehaviourResult(Action.REPAIR_BUILDING)
+
+
+class PowerSafehouseDecision(DecisionCommand):
+    """Installs a generator in the safehouse and fuels it."""
+
+    def is_valid(self, character):
+        if not is_inside_building(character):
+            return False
+        block = get_block(character)
+        if block.generator_installed:
+            return character.inventory.has(ItemType.FUEL_CAN) and not block.lights_on
+        return character.inventory.has(ItemType.PORTABLE_GENERATOR)
+
+    def execute(self, character):
+        item_type = ItemType.FUEL_CAN if get_block(character).generator_installed else ItemType.PORTABLE_GENERATOR
+        return BehaviourResult(Action.USE, character.inventory.first(item_type))
+
+
+class SeekItemsDecision(DecisionCommand):
+    """Searches the current building until fully equipped."""
+
+    def is_valid(self, character):
+        return is_inside_building(character) and not is_fully_equipped(character)
+
+    def execute(self, character):
+        character.state.make_room()
+        return BehaviourResult(Action.SEARCH)
+
 
 class SeekFAKDecision(DecisionCommand):
-    """Searches for a First Aid Kit if health is low."""
+    """Searches for a First Aid Kit if health is low, heading for a hospital when outside."""
 
     def is_valid(self, character):
-        """Valid if health is low and no FAK in inventory."""
-        return character.hp < 25 and ItemType.FIRST_AID_KIT not in character.inventory
-    
-    def execute(self, character, executor):
-        """Searches for a First Aid Kit."""
-        return executor.execute(Action.SEARCH)
-    
+        return character.hp < character.max_hp - 10 and not character.inventory.has(ItemType.FIRST_AID_KIT)
+
+    def is_complete(self, character):
+        return character.inventory.has(ItemType.FIRST_AID_KIT)
+
+    def execute(self, character):
+        if is_inside_building(character):
+            character.state.make_room()
+            return BehaviourResult(Action.SEARCH)
+        if get_block(character).type == BlockType.HOSPITAL:
+            return BehaviourResult(Action.ENTER)
+        return character.state.step_toward(PathGoal.HOSPITALS)
+
 
 class HealThyselfDecision(DecisionCommand):
     """Uses a First Aid Kit to heal when available."""
 
     def is_valid(self, character):
-        """Valid if the NPC has a First Aid Kit and is injured."""
-        return character.hp < character.max_hp - 10 and ItemType.FIRST_AID_KIT in character.inventory
-    
-    def execute(self, character, executor):
-        """Uses the First Aid Kit to restore health."""
-        fak = character.get_item(ItemType.FIRST_AID_KIT)
-        return executor.execute(Action.USE, fak)
\ No newline at end of file
+        return character.hp < character.max_hp - 10 and character.inventory.has(ItemType.FIRST_AID_KIT)
+
+    def execute(self, character):
+        weapon = character.weapon
+        if weapon is not None and weapon.type == ItemType.FIRST_AID_KIT:
+            return BehaviourResult(Action.HEAL, character)
+        return BehaviourResult(Action.EQUIP, character.inventory.first(ItemType.FIRST_AID_KIT))
+
+
+class ArmThyselfDecision(DecisionCommand):
+    """Equips a weapon from the inventory. Consumers would rather run."""
+
+    def is_valid(self, character):
+        return (character.occupation != Occupation.CONSUMER and character.inventory.has_weapon
+                and not has_weapon_ready(character))
+
+    def is_complete(self, character):
+        return has_weapon_ready(character)
+
+    def execute(self, character):
+        weapon = character.inventory.first_of_function(ItemFunction.MELEE, ItemFunction.FIREARM)
+        return BehaviourResult(Action.EQUIP, weapon)
+
+
+class AttackToKillDecision(DecisionCommand):
+    """Attacks zombies in the same block until none are left standing."""
+
+    def is_valid(self, character):
+        if not has_weapon_ready(character):
+            return False
+        return self._get_target(character) is not None
+
+    def execute(self, character):
+        target = self._get_target(character)
+        return BehaviourResult(Action.ATTACK, target) if target else None
+
+    def _get_target(self, character):
+        """Keep attacking the current target while it's here, only scanning the block for a new one."""
+        state = character.state
+        target = state.current_target
+        if (target is None or target.is_dead or target.is_human
+                or target.location != character.location or target.inside != character.inside):
+            x, y = character.location
+            living_zombies = state.filter_characters_at_location(x, y, character.inside).living_zombies
+            target = state.current_target = living_zombies[0] if living_zombies else None
+        return target
+
+
+class FleeDecision(DecisionCommand):
+    """Runs toward the nearest safehouse when zombies are present."""
+    one_shot = True
+
+    def is_valid(self, character):
+        x, y = character.location
+        return bool(character.state.filter_characters_at_location(x, y, character.inside).living_zombies)
+
+    def execute(self, character):
+        return character.state.step_toward(PathGoal.SHELTER)
+
+
+DECISION_COMMANDS = {
+    Decision.SCOUT_SAFEHOUSE: ScoutSafehouseDecision(),
+    Decision.ENTER_SAFEHOUSE: EnterSafehouseDecision(),
+    Decision.SECURE_SAFEHOUSE: SecureSafehouseDecision(),
+    Decision.BARRICADE_SAFEHOUSE: BarricadeSafehouseDecision(),
+    Decision.REPAIR_SAFEHOUSE: RepairSafehouseDecision(),
+    Decision.POWER_SAFEHOUSE: PowerSafehouseDecision(),
+    Decision.SEEK_ITEMS: SeekItemsDecision(),
+    Decision.SEEK_FAK: SeekFAKDecision(),
+    Decision.HEAL_THYSELF: HealThyselfDecision(),
+    Decision.ARM_THYSELF: ArmThyselfDecision(),
+    Decision.ATTACK_TO_KILL: AttackToKillDecision(),
+    Decision.FLEE: FleeDecision(),
+}
@@ -1,39 +1,47 @@
 # goal_manager.py
 
-from ai.goals import SurviveGoal
+from data import Goal
+from characters.ai.goals import GOAL_COMMANDS, SurviveGoal
+from characters.ai.decisions import is_wounded
+
 
 class GoalManager:
     """Determines NPC goal based on their current state."""
     def __init__(self):
+        self.current_goal = None # GoalCommand being pursued
         self.goal_stack = [] # Stack to remember goals if interrupted
 
     def evaluate_goal(self, character):
         """Evaluates the NPC's current goal and whether to switch goals."""
 
         # High priority interruption
-        if character.hp < character.max_hp // 2:
-            return self.set_goal(character, SurviveGoal())
-        
-        # Resume previous goal if interruption is over
-        if character.current_goal and character.current_goal.is_complete(character):
-            return self.resume_goal(character)
-        
-        # Otherwise, return the current goal or set a new one
-        return character.current_goal if character.current_goal else self.set_goal(character)
-
-    def set_goal(self, character, new_goal):
+        if is_wounded(character) and not isinstance(self.current_goal, SurviveGoal):
+            return self.set_goal(GOAL_COMMANDS[Goal.SURVIVE])
+
+        # Resume previous goals once the current one is complete
+        while self.current_goal and self.current_goal.is_complete(character):
+            self.resume_goal()
+
+        # Otherwise, keep the current goal or pick a new one
+        if self.current_goal is None:
+            self.current_goal = self._get_default_goal(character)
+        return self.current_goal
+
+    def set_goal(self, new_goal):
         """Set a new goal, saving the current goal to the stack."""
 
         # Push the goal if it's different from the current one
-        if character.current_goal and character.current_goal != new_goal:
-            self.goal_stack.append(character.current_goal)
+        if self.current_goal and self.current_goal is not new_goal:
+            self.goal_stack.append(self.current_goal)
 
-        character.current_goal = new_goal
+        self.current_goal = new_goal
         return new_goal
 
-    def resume_goal(self, character):
+    def resume_goal(self):
         """Resume the previous goal when the current one is completed."""
-        if self.goal_stack:
-            character.current_goal = self.goal_stack.pop()
-            return character.current_goal
-        return None
+        self.current_goal = self.goal_stack.pop() if self.goal_stack else None
+        return self.current_goal
+
+    def _get_default_goal(self, character):
+        shelter = GOAL_COMMANDS[Goal.SECURE_SHELTER]
+        return GOAL_COMMANDS[Goal.SCAVENGE] if shelter.is_complete(character) else shelter
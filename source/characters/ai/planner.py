@@ -0,0 +1,63 @@
+# planner.py
+
+from characters.ai.goal_manager import GoalManager
+from characters.ai.decision_manager import DecisionManager
+
+
+class Planner:
+    """Keeps an NPC's goal and current decision across turns, re-planning only when needed.
+
+    A plan stays in force until its decision completes or stops being valid, or an event that
+    could change the best course of action invalidates it.
+    """
+    def __init__(self, character):
+        self.character = character
+        self.goal_manager = GoalManager()
+        self.decision = None # DecisionCommand being carried out
+        self.valid = False # Cleared by invalidating events
+        self.replans = 0
+
+    @property
+    def goal(self):
+        """The Goal being pursued, if any."""
+        goal = self.goal_manager.current_goal
+        return goal.goal if goal else None
+
+    def invalidate(self):
+        """Force a re-plan on the next turn."""
+        self.valid = False
+
+    def needs_plan(self):
+        """Check whether the current decision can't simply be carried on."""
+        decision = self.decision
+        return (
+            not self.valid or decision is None
+            or decision.is_complete(self.character) or not decision.is_valid(self.character)
+        )
+
+    def update_goal(self):
+        return self.goal_manager.evaluate_goal(self.character)
+
+    def next_behaviour(self, scored_decision=None):
+        """Return this turn's behaviour, re-planning first if the plan no longer holds.
+
+        A decision scored by the utility AI is preferred when re-planning, if it is still valid.
+        """
+        if self.needs_plan():
+            self.replan(scored_decision)
+        if self.decision is None:
+            return None
+
+        behaviour = self.decision.execute(self.character)
+        if self.decision.one_shot:
+            self.decision = None
+        return behaviour
+
+    def replan(self, scored_decision=None):
+        goal = self.update_goal()
+        command = DecisionManager.get_command(scored_decision)
+        if command is None or not command.is_valid(self.character):
+            command = DecisionManager.determine_decision(self.character, goal)
+        self.decision = command
+        self.valid = True
+        self.replans += 1
@@ -0,0 +1,84 @@
+# inventory.py
+
+from data import ITEMS, ItemType, ITEM_FUNCTION_BITS, WEAPON_FUNCTION_MASK
+from settings import *
+
+
+class Inventory:
+    """A character's items, indexed by item type and function as they are added and removed."""
+    def __init__(self, items=()):
+        self.items = []
+        self.by_type = {} # Held items of each ItemType, in the order they were picked up
+        self.by_function = {} # Held items of each ItemFunction, in the order they were picked up
+        self.function_mask = 0 # Bitmask of the item functions held
+        for item in items:
+            self.append(item)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __getitem__(self, index):
+        return self.items[index]
+
+    def __contains__(self, item):
+        """Check for an item, or for any item of an ItemType."""
+        if isinstance(item, ItemType):
+            return item in self.by_type
+        return item in self.items
+
+    @property
+    def is_full(self):
+        return len(self.items) >= MAX_ITEMS
+
+    def append(self, item):
+        self.items.append(item)
+        self.by_type.setdefault(item.type, []).append(item)
+        function = ITEMS[item.type].item_function
+        self.by_function.setdefault(function, []).append(item)
+        self.function_mask |= ITEM_FUNCTION_BITS[function]
+
+    def remove(self, item):
+        self.items.remove(item)
+        self._unindex(self.by_type, item.type, item)
+        function = ITEMS[item.type].item_function
+        if not self._unindex(self.by_function, function, item):
+            self.function_mask &= ~ITEM_FUNCTION_BITS[function]
+
+    def count(self, item_type):
+        return len(self.by_type.get(item_type, ()))
+
+    def has(self, item_type):
+        return item_type in self.by_type
+
+    def first(self, item_type):
+        """Return the first held item of a type, or None."""
+        items = self.by_type.get(item_type)
+        return items[0] if items else None
+
+    def has_function(self, *functions):
+        """Check whether any item with one of the given functions is held."""
+        return any(self.function_mask & ITEM_FUNCTION_BITS[function] for function in functions)
+
+    @property
+    def has_weapon(self):
+        return bool(self.function_mask & WEAPON_FUNCTION_MASK)
+
+    def first_of_function(self, *functions):
+        """Return the first held item with one of the given functions, checked in order, or None."""
+        for function in functions:
+            items = self.by_function.get(function)
+            if items:
+                return items[0]
+        return None
+
+    def _unindex(self, index, key, item):
+        """Remove an item from an index, returning whether any items remain under its key."""
+        items = index[key]
+        items.remove(item)
+        if not items:
+            del index[key]
+            return False
+        return True
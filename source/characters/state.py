@@ -3,8 +3,15 @@
 from dataclasses import dataclass
 import random
 
-from data import Action, ActionResult, SKILLS, SkillType, SkillCategory, OCCUPATIONS, OccupationCategory, ITEMS, ItemType, ItemFunction, BLOCKS, BlockType
+from data import Action, ActionResult, SkillCategory, OCCUPATIONS, ITEMS, ItemType, ItemFunction, BlockType
+from data import (
+    ZOMBIE_HUNTER_LEVEL, SKILL_XP_COSTS, SKILL_CATEGORY_MASKS, HUMAN_SKILL_MASK, ZOMBIE_SKILL_MASK, OCCUPATION_SKILL_MASKS,
+    get_eligible_skills,
+)
 from settings import *
+from topology import get_adjacent_locations
+from event_bus import WorldEvent
+from characters.actions.siege import SIEGE_ACTIONS
 
 
 @dataclass
@@ -52,16 +59,28 @@ class State:
 
         # Execute action if one was determined
         if self.next_action:
-            action_result = self.character.action.execute(self.next_action.action, self.next_action.target)
-            if action_result:
-                if action_result.attacked and self.next_action.target == self.game.state.player:
-                    self.game.chat_history.append(action_result.attacked)
-                elif action_result.witness and self.character.location == self.game.state.player.location:
-                    if self.character.inside == self.game.state.player.inside:
-                        self.game.chat_history.append(action_result.witness)                       
-                    else:
-                        if self.next_action.action == Action.DECADE:
-                            self.game.chat_history.append(action_result.witness)                            
+            action, target = self.next_action.action, self.next_action.target
+
+            # Attacks and sieges are resolved with the rest of the batch's
+            if action == Action.ATTACK and self.game.combat.submit(self.character, target):
+                return
+            if action in SIEGE_ACTIONS and self.game.siege.submit(self.character, action):
+                return
+
+            action_result = self.character.action.execute(action, target)
+            self.report(action, target, action_result)
+
+    def report(self, action, target, action_result):
+        """Tell the player about an action that targeted or happened in front of them."""
+        if action_result:
+            if action_result.attacked and target == self.game.state.player:
+                self.game.chat_history.append(action_result.attacked)
+            elif action_result.witness and self.character.location == self.game.state.player.location:
+                if self.character.inside == self.game.state.player.inside:
+                    self.game.chat_history.append(action_result.witness)
+                else:
+                    if action == Action.DECADE:
+                        self.game.chat_history.append(action_result.witness)
 
     def filter_characters_at_location(self, x, y, inside=False, include_player=True):
         """Retrieve all characters at a given location and categorize them."""
@@ -88,22 +107,36 @@ class State:
         return BlockNPCs(x, y, inside, living_humans, living_zombies, dead_bodies, dead_zombies, revivifying_bodies)                      
     
     def get_adjacent_locations(self):
-        """Returns a list of (x, y) coordinates for the 8 adjacent blocks."""
-        x, y = self.character.location
-        adjacent_locations = [
-            (x - 1, y - 1), (x, y - 1), (x + 1, y - 1), # Top row
-            (x - 1, y),                 (x + 1, y),     # Middle row
-            (x - 1, y + 1), (x, y + 1), (x + 1, y + 1)  # Bottom row
-        ]
-        valid_locations = []
-
-        # Filter only valid locations in bounds
-        for location in adjacent_locations:
-            x, y = location
-            if 0 < x < CITY_SIZE - 1 and 0 < y < CITY_SIZE - 1:
-                valid_locations.append(location)
-        return valid_locations
+        """Returns a tuple of (x, y) coordinates for the adjacent blocks within the city."""
+        return get_adjacent_locations(*self.character.location)
     
+    def invalidate_plan(self):
+        """Force a re-plan on the next turn. Only humans plan ahead."""
+        pass
+
+    def get_sleep_ticks(self):
+        """Ticks a character with nothing to do can sleep before it might find something on its own."""
+        if self.character.is_dead:
+            return max(1, STAND_AP - self.character.ap)
+        return DORMANT_WAKE_TICKS
+
+    def should_wake(self, event):
+        """Check whether an event nearby should wake the sleeping character."""
+        return True
+
+    def publish(self, event_type, origin=None):
+        """Announce a change involving this character at its current location."""
+        x, y = self.character.location
+        self.game.event_bus.publish(event_type, x, y, self.character.inside, self.character, origin)
+
+    def step_toward(self, goal):
+        """Move one block toward the nearest block in a goal set, or wander if none is in range."""
+        x, y = self.character.location
+        step = self.game.pathfinding.next_step(goal, x, y)
+        if step is None:
+            return BehaviourResult(Action.WANDER)
+        return BehaviourResult(Action.MOVE, MoveTarget(step[0] - x, step[1] - y))
+
     def _make_choice(self, actions):
         """Choose an action based on weighted probabilities."""
         valid_actions = [(action, weight) for action, weight in actions.items() if weight > 0]
@@ -135,75 +168,38 @@ class State:
         occupation_category = OCCUPATIONS[self.character.occupation].occupation_category
 
         if self.character.is_human:
-            skills = [
-                skill for skill, properties in SKILLS.items() 
-                if properties.skill_category != SkillCategory.ZOMBIE and
-                (properties.skill_category != SkillCategory.ZOMBIE_HUNTER or self.character.level >= 10)
-            ]
+            candidates = HUMAN_SKILL_MASK
+            if self.character.level < ZOMBIE_HUNTER_LEVEL:
+                candidates &= ~SKILL_CATEGORY_MASKS[SkillCategory.ZOMBIE_HUNTER]
         else:
-            skills = [skill for skill, properties in SKILLS.items() 
-                      if properties.skill_category == SkillCategory.ZOMBIE]           
+            candidates = ZOMBIE_SKILL_MASK
 
-        acquired_skills = set(self.character.human_skills) if self.character.is_human else set(self.character.zombie_skills)
+        # Skills not yet learned whose prerequisites are met
+        acquired_skills = self.character.skill_mask
+        skills_with_prereqs_met = get_eligible_skills(acquired_skills, candidates)
+        if not skills_with_prereqs_met:
+            return None
 
-        # Filter skills where prerequisites are met
-        skills_with_prereqs_met = [
-            skill for skill in skills 
-            if all(prerequisite in acquired_skills for prerequisite in SKILLS[skill].prerequisite_skills)
-        ]
-
-        occupation_skills = [skill for skill, properties in SKILLS.items() if skill in skills_with_prereqs_met and properties.skill_category == occupation_category]
+        occupation_skills = get_eligible_skills(acquired_skills, candidates & OCCUPATION_SKILL_MASKS[occupation_category])
 
         # Prioritize occupational skills
-        if occupation_skills:
-                return random.choice(occupation_skills) if random.random() < 0.75 else random.choice(skills_with_prereqs_met)
+        if occupation_skills and random.random() < 0.75:
+            return random.choice(occupation_skills)
                 
         # If no occupation skills are available, pick any valid skill
-        if skills_with_prereqs_met:
-            return random.choice(skills_with_prereqs_met)
-            
-        return None
+        return random.choice(skills_with_prereqs_met)
 
     def _get_skill_xp_cost(self, skill):
-        """Calculate the XP cost for the given skill based on the player's occupation."""
-        player = self.game.state.player
-        skill_category = SKILLS[skill].skill_category
-        occupation_category = OCCUPATIONS[player.occupation].occupation_category
-
-        if skill_category == SkillCategory.CIVILIAN:
-            return 100 # Fixed cost for civilian skills
-        
-        elif skill_category == SkillCategory.MILITARY:
-            if occupation_category == OccupationCategory.MILITARY:
-                return 75
-            elif occupation_category == OccupationCategory.CIVILIAN:
-                return 100
-            else: # Science occupation
-                return 150
-            
-        elif skill_category == SkillCategory.SCIENCE:
-            if occupation_category == OccupationCategory.SCIENCE:
-                return 75
-            elif occupation_category == OccupationCategory.CIVILIAN:
-                return 100
-            else: # Military occupation
-                return 150
-            
-        elif skill_category == SkillCategory.ZOMBIE_HUNTER:
-            return 100
-            
-        elif skill_category == SkillCategory.ZOMBIE:
-            return 100 # Fixed cost for zombie skills     
+        """Look up the XP cost for the given skill based on the character's occupation."""
+        return SKILL_XP_COSTS[self.character.occupation][skill]
 
     def stand(self):
         """Character stands up at full health."""
         if not self.character.permadeath:
             self.character.is_dead = False
             self.character.hp = self.character.max_hp // 2
-            if self.character.has_skill(SkillType.ANKLE_GRAB):
-                self.character.ap -= 1
-            else:
-                self.character.ap -= STAND_AP             
+            self.character.ap -= self.character.stats.stand_ap
+            self.publish(WorldEvent.CHARACTER_STOOD)
 
     def reload(self, actor, item):
         if not actor.weapon:
@@ -277,13 +273,9 @@ class State:
         x, y = self.character.location
         block = self.game.state.city.block(x, y)
 
-        block_properties = BLOCKS[block.type]
-        if self.character.has_skill(SkillType.FIRST_AID):
-            heal_bonus = 5
-            if self.character.has_skill(SkillType.SURGERY) and block_properties.type == BlockType.HOSPITAL and block.lights_on:
-                heal_bonus += 5
-        else:
-            heal_bonus = 0
+        heal_bonus = self.character.stats.heal_bonus
+        if block.type == BlockType.HOSPITAL and block.lights_on:
+            heal_bonus += self.character.stats.surgery_bonus
         if target.hp < target.max_hp:
             target.heal(5 + heal_bonus)
             self.character.inventory.remove(self.character.weapon)
@@ -324,10 +316,9 @@ class State:
         self.character.ap -= 10
 
         # Trigger NPC sprite animation if visible
-        sprites = list(self.game.game_ui.description_panel.human_sprite_group)
-        for sprite in sprites:
-            if target == sprite.npc:
-                sprite.set_action(2)
+        sprite = self.game.game_ui.description_panel.get_npc_sprite(target)
+        if sprite:
+            sprite.set_action(2)
 
         return ActionResult(True, "Following standard procedures, you press the syringe into the back of the zombie's neck and pump the glittering serum into its brain and spinal cord.")
 
@@ -0,0 +1,65 @@
+# stats.py
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+from settings import *
+from data import SkillType, SKILL_BITS
+from characters.actions.combat_engine import ATTACK_STATS, ZOMBIE_MODES, UNARMED, get_attack_profile
+
+
+@dataclass(frozen=True)
+class CharacterStats:
+    """Values a character's skills decide, worked out once per skill set rather than on every check."""
+    max_hp: int
+    move_ap: int
+    stand_ap: int
+    opens_doors: bool # Zombies need MEMORIES OF LIFE to get through closed doors
+    free_running: bool
+    can_ransack: bool
+    can_rebuild: bool # Repair ruined buildings
+    headshot: bool
+    heal_bonus: int # Extra HP restored by first aid kits
+    surgery_bonus: int # Further HP restored in a powered hospital
+    attacks: dict # AttackProfile for each attack mode available in the current form
+    natural_attacks: tuple # AttackProfiles used without a weapon
+
+
+def _has(skill_mask, skill):
+    return bool(skill_mask & SKILL_BITS[skill])
+
+
+@lru_cache(maxsize=None)
+def get_character_stats(skill_mask, is_human):
+    """Return the derived stats of a human or zombie with the given skills."""
+    max_hp = MAX_HP
+    for skill in (SkillType.BODY_BUILDING, SkillType.FLESH_ROT): # Held in either form
+        if _has(skill_mask, skill):
+            max_hp += 10
+
+    if is_human:
+        attacks = {
+            mode: get_attack_profile(mode, skill_mask)
+            for mode in ATTACK_STATS if mode not in ZOMBIE_MODES
+        }
+        natural_attacks = (attacks[UNARMED],)
+    else:
+        attacks = {mode: get_attack_profile(mode, skill_mask) for mode in ZOMBIE_MODES}
+        natural_attacks = tuple(attacks.values())
+
+    first_aid = _has(skill_mask, SkillType.FIRST_AID)
+
+    return CharacterStats(
+        max_hp=max_hp,
+        move_ap=2 if not is_human and not _has(skill_mask, SkillType.LURCHING_GAIT) else 1,
+        stand_ap=1 if _has(skill_mask, SkillType.ANKLE_GRAB) else STAND_AP,
+        opens_doors=is_human or _has(skill_mask, SkillType.MEMORIES_OF_LIFE),
+        free_running=is_human and _has(skill_mask, SkillType.FREE_RUNNING),
+        can_ransack=not is_human and _has(skill_mask, SkillType.RANSACK),
+        can_rebuild=is_human and _has(skill_mask, SkillType.CONSTRUCTION),
+        headshot=is_human and _has(skill_mask, SkillType.HEADSHOT),
+        heal_bonus=5 if first_aid else 0,
+        surgery_bonus=5 if first_aid and _has(skill_mask, SkillType.SURGERY) else 0,
+        attacks=attacks,
+        natural_attacks=natural_attacks,
+    )
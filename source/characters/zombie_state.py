@@ -1,24 +1,12 @@
 # zombie_state.py
 
 import random
-from dataclasses import dataclass
 
 from settings import *
-from data import Action, ActionResult, BLOCKS, SkillType
+from data import Action, ActionResult, BLOCKS
 from characters.state import State, MoveTarget, BehaviourResult
-
-
-@dataclass
-class ZombieWeapon:
-    name: str
-    attack: int
-    damage: int
-
-    @classmethod
-    def choose(cls):
-        """Randomly select hands or teeth and return a ZombieWeapon instance."""
-        attack_type, stats = random.choice(list(ZOMBIE_ATTACKS.items()))
-        return cls(name=attack_type, attack=stats["attack"], damage=stats["damage"])
+from pathfinding import PathGoal
+from event_bus import WorldEvent
 
 
 class Zombie(State):
@@ -32,6 +20,10 @@ class Zombie(State):
 
     def _determine_behaviour(self):
         """Determine the priority for the zombie."""
+        # Priority 1: Stand up if dead
+        if self.character.is_dead:
+            return BehaviourResult(Action.STAND) if self.character.ap >= STAND_AP else False
+
         # Get block properties at current location
         city = self.game.state.city
         block = city.block(self.character.location[0], self.character.location[1])        
@@ -48,10 +40,6 @@ class Zombie(State):
         adjacent_locations = self.get_adjacent_locations()
         move_targets = self.get_move_targets(adjacent_locations, x, y)
 
-        # Priority 1: Stand up if dead
-        if self.character.is_dead:
-            return BehaviourResult(Action.STAND) if self.character.ap >= STAND_AP else False
-
         # Priority 2: Attack current target if in current location, otherwise change target if another human in current location
         if len(block_characters.living_humans) > 0:
             result = self._attack_target(block_characters)
@@ -70,7 +58,7 @@ class Zombie(State):
         # Priority 5: With no immediate priorities, let the zombie decide its next action
         if self.character.inside:
             action_weights = {
-                Action.RANSACK: 50 if not block.ruined and self.character.has_skill(SkillType.RANSACK) else 0,
+                Action.RANSACK: 50 if not block.ruined and self.character.stats.can_ransack else 0,
                 Action.WANDER: 30,
                 Action.LEAVE: 20,
             }
@@ -100,12 +88,12 @@ class Zombie(State):
         # Check if the current target is at the current location but not the same inside status
         if self.current_target.location == self.character.location and self.current_target.inside != self.character.inside:
             if self.character.inside: # Pursue the target outside, if possible
-                if block.barricade.level == 0 and (not block.doors_closed or self.character.has_skill(SkillType.MEMORIES_OF_LIFE)):
+                if block.barricade.level == 0 and (not block.doors_closed or self.character.stats.opens_doors):
                     return BehaviourResult(Action.LEAVE)
                 else: # Attack barricades if they are in the way
                     return BehaviourResult(Action.DECADE)
             else: # Pursue the target inside, if possible
-                if block.barricade.level == 0 and (not block.doors_closed or self.character.has_skill(SkillType.MEMORIES_OF_LIFE)):
+                if block.barricade.level == 0 and (not block.doors_closed or self.character.stats.opens_doors):
                     return BehaviourResult(Action.ENTER)
                 else: # Attack the barricades if they are in the way
                     return BehaviourResult(Action.DECADE)
@@ -122,7 +110,7 @@ class Zombie(State):
         move_targets = []
         for location in adjacent_locations:
             adjacent_x, adjacent_y = location
-            adjacent_characters = self.filter_characters_at_location(x, y)
+            adjacent_characters = self.filter_characters_at_location(adjacent_x, adjacent_y)
             if adjacent_characters.living_humans:
                 dx, dy = adjacent_x - x, adjacent_y - y
                 move_target = MoveTarget(dx, dy)
@@ -138,52 +126,15 @@ class Zombie(State):
                         dx, dy = adjacent_x - x, adjacent_y - y
                         move_target = MoveTarget(dx, dy)
                         move_targets.append(move_target)
+        if not move_targets: # Head for lit buildings further away
+            step = self.game.pathfinding.next_step(PathGoal.LIT_BUILDINGS, x, y)
+            if step:
+                move_targets.append(MoveTarget(step[0] - x, step[1] - y))
         return move_targets        
     
     def attack(self, target):
-        weapon = ZombieWeapon.choose()  # Get attack choice
-
-        # Base attack success rate
-        attack_chance = weapon.attack
-        bonus_damage = 0
-
-        # Apply skill bonuses
-        if self.character.has_skill(SkillType.VIGOUR_MORTIS):
-            attack_chance += 10
-        if weapon.name == 'hands' and self.character.has_skill(SkillType.DEATH_GRIP):
-            attack_chance += 15
-            if self.character.has_skill(SkillType.REND_FLESH):
-                bonus_damage = 1
-        if weapon.name == 'teeth' and self.character.has_skill(SkillType.NECK_LURCH):
-            attack_chance += 10
-
-        roll = random.randint(1, 100)
-        attack_success = roll <= attack_chance
-        self.character.ap -= 1
-
-        if attack_success:
-            target.take_damage(weapon.damage + bonus_damage)
-            self.character.gain_xp(weapon.damage + bonus_damage)
-            if target.is_dead:
-                self.character.gain_xp(10)
+        return self.game.combat.attack(self.character, target)
 
-            # Trigger NPC sprite animation if visible
-            sprites = list(self.game.game_ui.description_panel.human_sprite_group)
-            for sprite in sprites:
-                if target == sprite.npc:
-                    if target.is_dead:
-                        sprite.set_action(2)
-                    else:
-                        sprite.set_action(3)
-
-            message = f"You attack {target.current_name} with {weapon.name} for {weapon.damage + bonus_damage} damage."
-            witness = f"{self.character.current_name} attacks {target.current_name} with {weapon.name}."
-            attacked = f"{self.character.current_name} attacks you with {weapon.name} for {weapon.damage + bonus_damage} damage!"
-            return ActionResult(True, message, witness, attacked)
-        else:
-            message = "Your attack misses."
-            return ActionResult(False, message)    
-        
     def enter(self):
         x, y = self.character.location
         city = self.game.state.city
@@ -191,10 +142,11 @@ class Zombie(State):
 
         if building.barricade.level == 0:
             if building.doors_closed:
-                if self.character.has_skill(SkillType.MEMORIES_OF_LIFE):
+                if self.character.stats.opens_doors:
                     building.doors_closed = False
                     self.character.inside = True
                     self.character.ap -= 1
+                    self.publish(WorldEvent.CHARACTER_ENTERED)
                     message = "You enter the building, leaving the doors wide open."
                     witness = f"{self.character.current_name} entered the building, leaving the doors wide open."
                     return ActionResult(True, message, witness, sfx='footsteps')
@@ -203,6 +155,7 @@ class Zombie(State):
             else:
                 self.character.inside = True
                 self.character.ap -= 1
+                self.publish(WorldEvent.CHARACTER_ENTERED)
                 message = "You enter the building."
                 witness = f"{self.character.current_name} entered the building."
                 return ActionResult(True, message, witness, sfx='footsteps')   
@@ -216,9 +169,10 @@ class Zombie(State):
     
         if building.barricade.level == 0:
             if building.doors_closed:
-                if self.character.has_skill(SkillType.MEMORIES_OF_LIFE):
+                if self.character.stats.opens_doors:
                     self.character.inside = False
                     self.character.ap -= 1
+                    self.publish(WorldEvent.CHARACTER_LEFT)
                     message = "You left the building, leaving the doors wide open."
                     witness = f"{self.character.current_name} left the building, leaving the doors wide open."
                     return ActionResult(True, message, witness, sfx='footsteps')   
@@ -227,6 +181,7 @@ class Zombie(State):
             else:
                 self.character.inside = False
                 self.character.ap -= 1
+                self.publish(WorldEvent.CHARACTER_LEFT)
                 message = "You left the building."
                 witness = f"{self.character.current_name} left the building."
                 return ActionResult(True, message, witness, sfx='footsteps')
@@ -241,11 +196,9 @@ class Zombie(State):
         # Check if the new coordinates are valid within the grid
         if 0 <= new_x < CITY_SIZE and 0 <= new_y < CITY_SIZE:
             self.character.inside = False
-            if self.character.has_skill(SkillType.LURCHING_GAIT):
-                self.character.ap -= 1
-            else:
-                self.character.ap -= 2
+            self.character.ap -= self.character.stats.move_ap
             self.character.location = (new_x, new_y)
+            self.publish(WorldEvent.CHARACTER_MOVED, origin=(x, y))
         
         else:
             return False        
@@ -258,3 +211,4 @@ class Zombie(State):
     def die(self):
         """Handles the character's death."""
         self.character.is_dead = True
+        self.publish(WorldEvent.CHARACTER_DIED)
@@ -7,7 +7,8 @@ from pathlib import Path
 
 from blocks import CityBlock, BuildingBlock
 from settings import *
-from data import BLOCKS, BlockType, NEIGHBOURHOODS
+from data import BLOCKS, BlockType
+from topology import NEIGHBOURHOOD_IDS
 
 class City:
     def __init__(self):
@@ -207,16 +208,9 @@ class City:
 
 
     def _generate_neighbourhoods(self, grid):
-        neighbourhood_index = 0
-
-        for y_start in range(0, CITY_SIZE, NEIGHBOURHOOD_SIZE): # Iterate over rows in steps of 10
-            for x_start in range(0, CITY_SIZE, NEIGHBOURHOOD_SIZE): # Iterate over columns in steps of 10
-                neighbourhood_name = NEIGHBOURHOODS[neighbourhood_index]
-                neighbourhood_index += 1
-
-                # Collect blocks and add to neighbourhood group
-                for y in range(y_start, y_start + NEIGHBOURHOOD_SIZE):
-                    for x in range(x_start, x_start + NEIGHBOURHOOD_SIZE):
-                        grid[y][x].neighbourhood = neighbourhood_name
+        """Tag each block with the id of its 10x10 neighbourhood."""
+        for row in grid:
+            for block in row:
+                block.neighbourhood_id = NEIGHBOURHOOD_IDS[block.y * CITY_SIZE + block.x]
 
         return grid
\ No newline at end of file
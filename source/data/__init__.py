@@ -1,12 +1,20 @@
 # __init__.py
 
-from .barricade_data import BarricadeState, BARRICADE_DESCRIPTIONS
+from .barricade_data import (
+    BarricadeState, BarricadeStage, BARRICADE_DESCRIPTIONS, BARRICADE_HITS, BARRICADE_SUBLEVELS, BARRICADE_MAX_LEVEL,
+    BARRICADE_TABLE, BARRICADE_MAX_HP, BARRICADE_HP,
+)
 from .block_data import BlockType, BlockProperties, BLOCKS, BlockNPCs
-from .item_data import ItemType, ItemFunction, ItemProperties, ITEMS
+from .item_data import ItemType, ItemFunction, ItemProperties, ITEMS, ITEM_FUNCTION_BITS, WEAPON_FUNCTION_MASK
 from .neighbourhood_data import NEIGHBOURHOODS
 from .path import ResourcePath, DataPath, SaveLoadPath
 from .action_data import Action, ActionResult
 from .decision_data import Decision
 from .goal_data import Goal
 from .character_data import Occupation, OccupationProperties, OccupationCategory, OCCUPATIONS
-from .skill_data import SkillType, SkillProperties, SkillCategory, SKILLS
\ No newline at end of file
+from .skill_data import SkillType, SkillProperties, SkillCategory, SKILLS
+from .skill_tree import (
+    ZOMBIE_HUNTER_LEVEL, SKILL_PREREQUISITES, SKILL_DEPENDENTS, SKILL_DEPTHS, SKILLS_BY_CATEGORY, SKILL_XP_COSTS,
+    SKILL_BITS, PREREQUISITE_MASKS, SKILL_CATEGORY_MASKS, HUMAN_SKILL_MASK, ZOMBIE_SKILL_MASK, OCCUPATION_SKILL_MASKS,
+    get_skill_xp_cost, get_missing_prerequisite, get_skill_mask, get_eligible_skills,
+)
@@ -60,6 +60,9 @@ class Action(Enum):
     BACK = auto()
     ZOOM_IN = auto()
     ZOOM_OUT = auto()
+    MAP_LAYER = auto()
+    TOGGLE_PROFILER = auto()
+    DUMP_TRACE = auto()
     RESTART = auto()
 
 
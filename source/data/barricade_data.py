@@ -1,5 +1,6 @@
 # barricade_data.py
 
+from dataclasses import dataclass
 from enum import Enum, auto
 
 
@@ -23,4 +24,49 @@ BARRICADE_DESCRIPTIONS = {
     BarricadeState.HEAVILY_BARRICADED: "heavily barricaded",
     BarricadeState.VERY_HEAVILY_BARRICADED: "very heavily barricaded",
     BarricadeState.EXTREMELY_HEAVILY_BARRICADED: "extremely heavily barricaded"
-}
\ No newline at end of file
+}
+
+
+BARRICADE_HITS = 3 # Successful hits needed to knock down one stage of barricading
+BARRICADE_SUBLEVELS = (1, 1, 3, 3, 3, 3, 3, 5) # Stages of barricading in each level
+BARRICADE_MAX_LEVEL = len(BARRICADE_SUBLEVELS) - 1
+HUMAN_PASSABLE_LEVEL = 4 # Highest level survivors can climb through
+
+
+@dataclass(frozen=True)
+class BarricadeStage:
+    level: int
+    sublevel: int
+    description: str
+    built: int # Barricade HP after adding a stage, or None if fully barricaded
+    human_passable: bool
+    zombie_passable: bool
+
+
+def _build_barricade_table():
+    """Return the BarricadeStage for every barricade HP value.
+
+    Barricade HP counts the hits needed to clear the barricade: each stage is worth BARRICADE_HITS
+    points, and hits taken on the current stage are subtracted, so damage is always one point.
+    """
+    stages = [(level, sublevel) for level, count in enumerate(BARRICADE_SUBLEVELS) for sublevel in range(count)]
+    descriptions = tuple(BARRICADE_DESCRIPTIONS[state] for state in BarricadeState)
+
+    table = []
+    for hp in range((len(stages) - 1) * BARRICADE_HITS + 1):
+        stage = -(-hp // BARRICADE_HITS) # Stages partly knocked down still stand
+        level, sublevel = stages[stage]
+        built = (stage + 1) * BARRICADE_HITS if stage + 1 < len(stages) else None
+        table.append(BarricadeStage(
+            level, sublevel, descriptions[level], built, level <= HUMAN_PASSABLE_LEVEL, level == 0,
+        ))
+    return tuple(table)
+
+
+BARRICADE_TABLE = _build_barricade_table() # BarricadeStage indexed by barricade HP
+BARRICADE_MAX_HP = len(BARRICADE_TABLE) - 1 # Fits in a byte
+
+# Barricade HP of each (level, sublevel) with no hits taken
+BARRICADE_HP = {
+    (stage.level, stage.sublevel): hp for hp, stage in enumerate(BARRICADE_TABLE) if hp % BARRICADE_HITS == 0
+}
@@ -80,4 +80,8 @@ ITEMS = {
     ItemType.TENNIS_RACKET: ItemProperties('Tennis Racket', 'a tennis racket', ItemFunction.MELEE, ResourcePath('items/tennis_racket.png').path, 10, 2, 20, None),
     ItemType.SHOTGUN: ItemProperties('Shotgun', 'a shotgun', ItemFunction.FIREARM, ResourcePath('items/shotgun.png').path, 5, 10, None, 2),
     ItemType.PISTOL: ItemProperties('Pistol', 'a pistol', ItemFunction.FIREARM, ResourcePath('items/pistol.png').path, 5, 5, None, 6),
-}
\ No newline at end of file
+}
+
+# Item function bitmasks: each function is one bit, so the functions held fit in a single integer
+ITEM_FUNCTION_BITS = {function: 1 << index for index, function in enumerate(ItemFunction)}
+WEAPON_FUNCTION_MASK = ITEM_FUNCTION_BITS[ItemFunction.MELEE] | ITEM_FUNCTION_BITS[ItemFunction.FIREARM]
@@ -0,0 +1,102 @@
+# skill_tree.py
+
+from functools import lru_cache
+
+from data.skill_data import SkillCategory, SKILLS
+from data.character_data import Occupation, OccupationCategory, OCCUPATIONS
+
+
+ZOMBIE_HUNTER_LEVEL = 10 # Level required to learn Zombie Hunter skills
+
+# XP cost of each skill category, by occupation category
+CATEGORY_XP_COSTS = {
+    SkillCategory.CIVILIAN: {category: 100 for category in OccupationCategory},
+    SkillCategory.MILITARY: {
+        OccupationCategory.MILITARY: 75,
+        OccupationCategory.CIVILIAN: 100,
+        OccupationCategory.SCIENCE: 150,
+        OccupationCategory.ZOMBIE: 150,
+    },
+    SkillCategory.SCIENCE: {
+        OccupationCategory.SCIENCE: 75,
+        OccupationCategory.CIVILIAN: 100,
+        OccupationCategory.MILITARY: 150,
+        OccupationCategory.ZOMBIE: 150,
+    },
+    SkillCategory.ZOMBIE_HUNTER: {category: 100 for category in OccupationCategory},
+    SkillCategory.ZOMBIE: {category: 100 for category in OccupationCategory},
+}
+
+# Prerequisite graph: the skills each skill requires, and the skills that require it
+SKILL_PREREQUISITES = {skill: tuple(properties.prerequisite_skills) for skill, properties in SKILLS.items()}
+SKILL_DEPENDENTS = {skill: tuple(
+    dependent for dependent, prerequisites in SKILL_PREREQUISITES.items() if skill in prerequisites
+) for skill in SKILLS}
+
+# Indentation of each skill in the skill tree
+SKILL_DEPTHS = {skill: len(prerequisites) for skill, prerequisites in SKILL_PREREQUISITES.items()}
+
+# Skills in each category, in display order
+SKILLS_BY_CATEGORY = {
+    category: tuple(skill for skill, properties in SKILLS.items() if properties.skill_category == category)
+    for category in SkillCategory
+}
+
+# Skill bitmasks: each skill is one bit, so a character's skills fit in a single integer
+SKILL_BITS = {skill: 1 << index for index, skill in enumerate(SKILLS)}
+PREREQUISITE_MASKS = {
+    skill: sum(SKILL_BITS[prerequisite] for prerequisite in prerequisites)
+    for skill, prerequisites in SKILL_PREREQUISITES.items()
+}
+SKILL_CATEGORY_MASKS = {
+    category: sum(SKILL_BITS[skill] for skill in skills) for category, skills in SKILLS_BY_CATEGORY.items()
+}
+ZOMBIE_SKILL_MASK = SKILL_CATEGORY_MASKS[SkillCategory.ZOMBIE]
+HUMAN_SKILL_MASK = sum(SKILL_BITS.values()) & ~ZOMBIE_SKILL_MASK
+
+# Skills matching each occupation category, which characters prefer to learn
+OCCUPATION_SKILL_MASKS = {
+    category: SKILL_CATEGORY_MASKS[SkillCategory[category.name]] if category.name in SkillCategory.__members__ else 0
+    for category in OccupationCategory
+}
+
+# XP cost of every skill for every occupation
+SKILL_XP_COSTS = {
+    occupation: {
+        skill: CATEGORY_XP_COSTS[properties.skill_category][OCCUPATIONS[occupation].occupation_category]
+        for skill, properties in SKILLS.items()
+    }
+    for occupation in Occupation
+}
+
+
+def get_skill_xp_cost(occupation, skill, level=None):
+    """Return the XP cost of a skill for an occupation, or None if the character's level is too low."""
+    if level is not None and SKILLS[skill].skill_category == SkillCategory.ZOMBIE_HUNTER and level < ZOMBIE_HUNTER_LEVEL:
+        return None
+    return SKILL_XP_COSTS[occupation][skill]
+
+
+def get_missing_prerequisite(skill, acquired_skills):
+    """Return the first prerequisite of a skill that hasn't been acquired, if any."""
+    for prerequisite in SKILL_PREREQUISITES[skill]:
+        if prerequisite not in acquired_skills:
+            return prerequisite
+    return None
+
+
+def get_skill_mask(skills):
+    """Return the bitmask of a collection of skills."""
+    mask = 0
+    for skill in skills:
+        mask |= SKILL_BITS[skill]
+    return mask
+
+
+@lru_cache(maxsize=None)
+def get_eligible_skills(acquired_mask, candidate_mask):
+    """Return the candidate skills not yet acquired whose prerequisites have all been acquired."""
+    return tuple(
+        skill for skill, bit in SKILL_BITS.items()
+        if candidate_mask & bit and not acquired_mask & bit and not PREREQUISITE_MASKS[skill] & ~acquired_mask
+    )
@@ -0,0 +1,106 @@
+# event_bus.py
+
+from collections import defaultdict
+from dataclasses import dataclass
+from enum import IntFlag, auto
+
+from settings import *
+
+
+class WorldEvent(IntFlag):
+    """Kinds of world-state change. Flags combine into subscription masks."""
+    CHARACTER_MOVED = auto() # Arrived at a new block
+    CHARACTER_ENTERED = auto()
+    CHARACTER_LEFT = auto()
+    CHARACTER_DIED = auto()
+    CHARACTER_STOOD = auto() # Got back up after dying
+    CHARACTER_REVIVED = auto() # Zombie revivified as a human
+    BARRICADE_CHANGED = auto()
+    LIGHTS_CHANGED = auto()
+    BUILDING_CHANGED = auto() # Doors, ransacking, repairs and generators
+    ITEM_FOUND = auto()
+
+
+CHARACTER_EVENTS = (
+    WorldEvent.CHARACTER_MOVED | WorldEvent.CHARACTER_ENTERED | WorldEvent.CHARACTER_LEFT
+    | WorldEvent.CHARACTER_DIED | WorldEvent.CHARACTER_STOOD | WorldEvent.CHARACTER_REVIVED
+)
+MOVEMENT_EVENTS = WorldEvent.CHARACTER_MOVED | WorldEvent.CHARACTER_ENTERED | WorldEvent.CHARACTER_LEFT
+BLOCK_EVENTS = WorldEvent.BARRICADE_CHANGED | WorldEvent.LIGHTS_CHANGED | WorldEvent.BUILDING_CHANGED
+ALL_EVENTS = CHARACTER_EVENTS | BLOCK_EVENTS | WorldEvent.ITEM_FOUND
+
+
+@dataclass
+class Event:
+    type: WorldEvent
+    x: int
+    y: int
+    inside: bool = None # Side of the block the character is on, None for changes to the block itself
+    character: object = None # Character involved, or the actor behind a block change
+    origin: tuple = None # Location a moving character came from
+
+
+class EventBus:
+    """Delivers world-state changes to the subscribers that care about them.
+
+    Subscribers register a callback with a WorldEvent mask, either for every event, for the events
+    at one block, or for the events involving one character. Publishing to a block or character
+    nobody watches costs a couple of dictionary lookups.
+    """
+    def __init__(self):
+        self.subscribers = [] # (mask, callback) pairs for every event
+        self.block_subscribers = defaultdict(list) # (mask, callback) pairs keyed by block index
+        self.character_subscribers = defaultdict(list) # (mask, callback) pairs keyed by character
+
+    def subscribe(self, callback, mask=ALL_EVENTS):
+        self.subscribers.append((mask, callback))
+
+    def unsubscribe(self, callback):
+        self._remove(self.subscribers, callback)
+
+    def subscribe_block(self, x, y, callback, mask=ALL_EVENTS):
+        self.block_subscribers[y * CITY_SIZE + x].append((mask, callback))
+
+    def unsubscribe_block(self, x, y, callback):
+        index = y * CITY_SIZE + x
+        subscribers = self.block_subscribers.get(index)
+        if subscribers is not None:
+            self._remove(subscribers, callback)
+            if not subscribers:
+                del self.block_subscribers[index]
+
+    def subscribe_character(self, character, callback, mask=ALL_EVENTS):
+        self.character_subscribers[character].append((mask, callback))
+
+    def unsubscribe_character(self, character, callback):
+        subscribers = self.character_subscribers.get(character)
+        if subscribers is not None:
+            self._remove(subscribers, callback)
+            if not subscribers:
+                del self.character_subscribers[character]
+
+    def publish(self, event_type, x, y, inside=None, character=None, origin=None):
+        """Announce a change at a block.
+
+        Subscribers to the block, to the block a moving character came from, and to the character
+        involved each receive the event once.
+        """
+        block_subscribers = self.block_subscribers.get(y * CITY_SIZE + x)
+        origin_subscribers = None
+        if origin is not None and origin != (x, y):
+            origin_subscribers = self.block_subscribers.get(origin[1] * CITY_SIZE + origin[0])
+        character_subscribers = self.character_subscribers.get(character) if character is not None else None
+
+        if not (self.subscribers or block_subscribers or origin_subscribers or character_subscribers):
+            return
+
+        event = Event(event_type, x, y, inside, character, origin)
+        for subscribers in (self.subscribers, block_subscribers, origin_subscribers, character_subscribers):
+            if subscribers:
+                # Copied, as callbacks may move their own subscriptions
+                for mask, callback in tuple(subscribers):
+                    if event_type & mask:
+                        callback(event)
+
+    def _remove(self, subscribers, callback):
+        subscribers[:] = [subscriber for subscriber in subscribers if subscriber[1] != callback]
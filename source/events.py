@@ -47,6 +47,8 @@ class EventHandler:
             pygame.K_z: Action.MOVE_DOWNLEFT,
             pygame.K_c: Action.MOVE_DOWNRIGHT,
             pygame.K_ESCAPE: Action.PAUSE,
+            pygame.K_F3: Action.TOGGLE_PROFILER,
+            pygame.K_F4: Action.DUMP_TRACE,
         }
         action = key_to_action.get(event.key)
         if action:
@@ -161,35 +163,13 @@ class ClickTarget:
     def __init__(self, game, mouse_pos):
         self.type = None
         self.sprite = None
-        self.human_sprite_group = game.game_ui.description_panel.human_sprite_group
-        self.zombie_sprite_group = game.game_ui.description_panel.zombie_sprite_group
-        self.viewport_group = game.game_ui.viewport.viewport_group
-        self.inventory_group = game.game_ui.inventory_panel.inventory_group
-        self.player_portrait = game.game_ui.status_panel.player_sprite
+        self.hit_test = game.game_ui.hit_test
         
         self.get(mouse_pos)
 
     def get(self, mouse_pos):
-        """Get the target of a mouse click, saving the sprite and returning the target type."""
-        for sprite in self.viewport_group:
-            if sprite.rect.collidepoint(mouse_pos):
-                self.sprite = sprite                
-                self.type = 'block'
-        for sprite in self.inventory_group:
-            if sprite.rect.collidepoint(mouse_pos):
-                self.sprite = sprite  
-                self.type = 'item'
-        for sprite in self.zombie_sprite_group:
-            if sprite.rect.collidepoint(mouse_pos):
-                self.sprite = sprite                
-                self.type = 'zombie'
-        for sprite in self.human_sprite_group:
-            if sprite.rect.collidepoint(mouse_pos):
-                self.sprite = sprite                
-                self.type = 'human'
-        if self.player_portrait.rect.collidepoint(mouse_pos):
-            self.sprite = self.player_portrait
-            self.type = 'self'
+        """Get the top-most target of a mouse click, saving the sprite and target type."""
+        self.type, self.sprite = self.hit_test.query(mouse_pos)
         if self.type == None:
             self.type = 'screen'
 
@@ -211,6 +191,7 @@ class MapEventHandler:
         key_to_action = {
             pygame.K_PAGEDOWN: Action.ZOOM_OUT,
             pygame.K_PAGEUP: Action.ZOOM_IN,
+            pygame.K_TAB: Action.MAP_LAYER,
             pygame.K_ESCAPE: Action.CLOSE_MAP,
         }
         action = key_to_action.get(event.key)
@@ -9,11 +9,18 @@ import menus
 import events
 import saveload
 import ui
+from assets import ASSETS
+from audio import create_audio
 from city import City
+from pathfinding import PathfindingService
+from event_bus import EventBus, WorldEvent
+from scheduler import NPCScheduler
+from characters.actions.combat_engine import CombatEngine
+from characters.actions.siege import SiegeResolver
 from characters import Character, CharacterName
 from populate import GenerateNPCs
 from blocks import CityBlock, BuildingBlock
-from data import Occupation, ResourcePath
+from data import Occupation
 
 
 @dataclass
@@ -25,8 +32,10 @@ class GameState:
 
 class GameInitializer:
     """Initialize the game, centralizing resources."""
-    def __init__(self, screen):
+    def __init__(self, screen, audio=True):
         self.screen = screen
+        self.audio = create_audio(audio) # Silent when audio is disabled or headless
+        ASSETS.preload() # Decode assets in the background while the title menu shows
         self.state = None
         self.cursor = ui.Cursor(self)
         self.menu = menus.GameMenu(self)         
@@ -41,27 +50,6 @@ class GameInitializer:
         self.start_new_game = False
         self.title_event_handler = events.TitleEventHandler(self) 
         self.title_screen = True
-        pygame.mixer.init()  # Initialize the mixer
-        self.load_sounds()    # Load sound effects
-
-    def load_sounds(self):
-        """Load sound effects for actions."""
-        self.sounds = {
-            #"attack": pygame.mixer.Sound("sfx/attack.wav"),
-            #"damage": pygame.mixer.Sound("sfx/damage.wav"),
-            "reload": pygame.mixer.Sound(ResourcePath("sfx/reload.mp3").path),
-            "gun_shot": pygame.mixer.Sound(ResourcePath("sfx/gun_shot.mp3").path),
-            "zombie_sounds": pygame.mixer.Sound(ResourcePath("sfx/zombie_sounds.wav").path),
-            "search": pygame.mixer.Sound(ResourcePath("sfx/search.wav").path),
-            "footsteps": pygame.mixer.Sound(ResourcePath("sfx/footsteps.wav").path),
-            "door_open": pygame.mixer.Sound(ResourcePath("sfx/door_open.wav").path),
-            "door_close": pygame.mixer.Sound(ResourcePath("sfx/door_close.wav").path),
-            "decade": pygame.mixer.Sound(ResourcePath("sfx/decade.wav").path),
-            "barricade": pygame.mixer.Sound(ResourcePath("sfx/barricade.wav").path),
-            "human_death": pygame.mixer.Sound(ResourcePath("sfx/human_death.wav").path),
-            "zombie_death": pygame.mixer.Sound(ResourcePath("sfx/zombie_death.wav").path),
-
-        }        
 
     def initialize_game(self, player, portrait):
         """Generate a new game state."""
@@ -144,6 +132,14 @@ class GameInitializer:
 
     def _create_resources(self, portrait, set_time=None):
         """Create or reinitialize game resources."""
+        self.audio.prefetch("footsteps") # Usually the first sound played
+        self.event_bus = EventBus()
+        self.pathfinding = PathfindingService(self.state.city)
+        self.event_bus.subscribe(self.pathfinding.on_lights_changed, WorldEvent.LIGHTS_CHANGED)
+        self.scheduler = NPCScheduler(self)
+        self.combat = CombatEngine(self)
+        self.siege = SiegeResolver(self)
+
         # Initialize event handlers
         self.event_handler = events.EventHandler(self) 
         self.map_event_handler = events.MapEventHandler(self)
@@ -6,6 +6,9 @@ from collections import deque
 
 from settings import *
 from game import GameInitializer
+from profiler import PROFILER
+from event_bus import WorldEvent
+from characters.actions.utility_ai import UTILITY_AI
 
 # Main game loop
 def main():
@@ -29,6 +32,7 @@ def main():
     running = True
 
     while running:
+        PROFILER.begin_frame()
         
         # Get events
         events = pygame.event.get()
@@ -94,23 +98,26 @@ def main():
                 action_timer += clock.get_time()
                 if action_timer >= action_interval:
                     game.state.npcs.gain_ap() # Grant AP to all NPCs
-                    action_queue = deque(game.state.npcs.list) # Load all NPCs into the queue
                     action_timer = 0
                     game.ticker += 1
+                    action_queue = deque(game.scheduler.get_awake_npcs(game.ticker)) # Load the awake NPCs into the queue
                     
                     # Check buildings for fuel expiry
                     for row in game.state.city.grid:
                         for block in row:
                             if hasattr(block, 'fuel_expiration') and block.fuel_expiration < game.ticker:
                                 if block.lights_on:
-                                    block.lights_on = False         
+                                    block.lights_on = False
+                                    game.event_bus.publish(WorldEvent.LIGHTS_CHANGED, block.x, block.y)
 
                 # Process the action queue in batches
-                for _ in range(min(actions_per_frame, len(action_queue))):
-                    npc = action_queue.popleft() # Get next npc
-                    npc.state.get_action()
-                    npc.state.act()
-                    npc.state.gain_skill()
+                with PROFILER.section("npcs"):
+                    batch = [action_queue.popleft() for _ in range(min(actions_per_frame, len(action_queue)))]
+                    UTILITY_AI.assign(batch) # Score the batch's human decisions together
+                    for npc in batch:
+                        game.scheduler.take_turn(npc)
+                    game.siege.resolve() # Resolve the batch's barricading together
+                    game.combat.resolve() # Resolve the batch's attacks together
 
                 # Handle player death
                 if game.state.player.is_dead:
@@ -123,8 +130,11 @@ def main():
                 # Update the cursor
                 game.cursor.update()
 
+        PROFILER.draw(screen)
         pygame.display.flip()
-        clock.tick(FPS)
+        with PROFILER.section("tick"):
+            clock.tick(FPS)
+        PROFILER.end_frame()
 
     pygame.quit()
     sys.exit()
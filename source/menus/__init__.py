@@ -13,6 +13,6 @@ class GameMenu:
         self.newgame_menu = NewGameMenu(game)
         self.save_menu = SaveLoadMenu("save")
         self.load_menu = SaveLoadMenu("load")
-        self.title_menu = TitleMenu()
+        self.title_menu = TitleMenu(game)
         self.title_action = TitleAction(game)
         self.skills_menu = SkillsMenu(game)
\ No newline at end of file
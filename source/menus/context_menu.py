@@ -23,6 +23,12 @@ shadow_color = Color(105,105,105)
 
 margin = 2
 
+# Firearm loaded by each type of ammo
+AMMO_FIREARMS = {
+    ItemType.PISTOL_CLIP: ItemType.PISTOL,
+    ItemType.SHOTGUN_SHELL: ItemType.SHOTGUN,
+}
+
 class ContextMenu:
     """Create a context-sensitive popup menu based on the target"""
     def __init__(self, click_target, player):
@@ -52,7 +58,10 @@ class ContextMenu:
             elif item.type == ItemType.PORTABLE_GENERATOR:
                 menu_data = [properties.item_type, 'Install', 'Drop']
             elif properties.item_function == ItemFunction.AMMO:
-                menu_data = [properties.item_type, 'Reload', 'Drop']
+                if self.player.inventory.has(AMMO_FIREARMS[item.type]):
+                    menu_data = [properties.item_type, 'Reload', 'Drop']
+                else: # Nothing to load it into
+                    menu_data = [properties.item_type, 'Drop']
         
         elif menu_type == 'center block':
             properties = BLOCKS[self.sprite.block.type]
@@ -4,6 +4,7 @@ import pygame
 
 from settings import *
 from data import OCCUPATIONS, Occupation, OccupationCategory, ResourcePath
+from assets import ASSETS
 from ui import Button, WrapText
 from characters import CharacterName, Character
 
@@ -203,7 +204,7 @@ class PortraitSprite(pygame.sprite.Sprite):
     def __init__(self, image_path, x, y):
         super().__init__()
         self.portrait_path = image_path
-        self.sprite_sheet = pygame.image.load(ResourcePath(image_path).path).convert_alpha()
+        self.sprite_sheet = ASSETS.get_image(ResourcePath(image_path).path)
 
         # Extract first frame (assuming sprite sheet is horizontal)
         frame_width, frame_height = 66, 66
@@ -3,7 +3,11 @@
 import pygame
 
 from settings import *
-from data import SKILLS, SkillCategory, OCCUPATIONS, OccupationCategory, ResourcePath
+from data import (
+    SKILLS, SkillCategory, ResourcePath, ZOMBIE_HUNTER_LEVEL, SKILL_DEPTHS, SKILLS_BY_CATEGORY,
+    get_skill_xp_cost, get_missing_prerequisite,
+)
+from assets import ASSETS
 from ui import Button, WrapText
 
 
@@ -26,27 +30,58 @@ class SkillsMenu:
             SkillCategory.ZOMBIE: 1,
         }        
 
+        # Render caches
+        self.backgrounds = {} # Title and category headings, keyed by whether the player is human
+        self.progress_text = None # Rendered level and XP
+        self.progress_key = None
+        self.info_panel = None # Rendered info panel and gain button rect
+        self.info_panel_key = None
+        self.skills_key = None # Player skills, XP and level the slots were last refreshed for
+
     def draw(self, screen):
         """Draws the skills menu."""      
         player = self.game.state.player        
+        self._refresh_skill_slots()
+
+        screen.blit(self._get_background(player.is_human), (0, 0))
+        self.back_button.draw(screen)
+
+        # Display Level and XP at the top
+        progress_key = (player.level, player.xp)
+        if progress_key != self.progress_key:
+            self.progress_text = self._render_progress_text(*progress_key)
+            self.progress_key = progress_key
+        for text, position in self.progress_text:
+            screen.blit(text, position)
+
+        # Draw skill slots
+        self.skill_slots.draw(screen)
+
+        # Draw info panel if a skill is selected
+        if self.selected_skill:
+            self._draw_info_panel(screen)
+
+    def update(self):
+        """Deselect all other skills when a new one is selected."""
+        for skill_slot in self.skill_slots:
+            skill_slot.selected = (skill_slot == self.selected_skill)
+            skill_slot.update()
 
+    def _get_background(self, is_human):
+        """Return the background with the title and category headings, rendering it once per form."""
+        background = self.backgrounds.get(is_human)
+        if background is None:
+            background = self.backgrounds[is_human] = self._render_background(is_human)
+        return background
+
+    def _render_background(self, is_human):
         # Create a dark green background
-        screen.fill(DARK_GREEN)
+        background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        background.fill(DARK_GREEN)
         
         title_text = font_xxl.render("Skills", True, WHITE)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 75))
-
-        screen.blit(title_text, title_rect)
-        self.back_button.draw(screen)
-
-        level = player.level
-        xp = player.xp
-
-        # Display Level and XP at the top
-        level_text = font_large.render(f"Player Level: {level}", True, WHITE)
-        xp_text = font_large.render(f"XP: {xp}", True, WHITE)
-        screen.blit(level_text, (self.margin, 10))
-        screen.blit(xp_text, (self.margin, level_text.get_height() + 10))
+        background.blit(title_text, title_rect)
 
         # Initialize y-offset for each column
         base_y = SCREEN_HEIGHT * 7 // 40
@@ -63,141 +98,135 @@ class SkillsMenu:
                 y_offset += SCREEN_HEIGHT // 2  # Move to second row of middle column
 
             # Draw category title
-            if (player.is_human and category != SkillCategory.ZOMBIE) or (not player.is_human and category == SkillCategory.ZOMBIE):
+            if (is_human and category != SkillCategory.ZOMBIE) or (not is_human and category == SkillCategory.ZOMBIE):
                 category_text = font_xl.render(category.name.replace("_", " "), True, (200, 200, 0))
-                screen.blit(category_text, (x_pos, y_offset))
+                background.blit(category_text, (x_pos, y_offset))
 
-        # Draw skill slots
-        self.skill_slots.update()
-        self.skill_slots.draw(screen)
+        return background
 
-        # Draw info panel if a skill is selected
-        if self.selected_skill:
-            self._draw_info_panel(screen)
+    def _render_progress_text(self, level, xp):
+        level_text = font_large.render(f"Player Level: {level}", True, WHITE)
+        xp_text = font_large.render(f"XP: {xp}", True, WHITE)
+        return [(level_text, (self.margin, 10)), (xp_text, (self.margin, level_text.get_height() + 10))]
 
-    def update(self):
-        """Deselect all other skills when a new one is selected."""
+    def _get_skills_key(self):
+        player = self.game.state.player
+        return (player.is_human, frozenset(player.human_skills), frozenset(player.zombie_skills), player.xp, player.level)
+
+    def _refresh_skill_slots(self):
+        """Refresh slot states only when the player's skills, XP or level change."""
+        skills_key = self._get_skills_key()
+        if skills_key == self.skills_key:
+            return
+
+        # The player switched between human and zombie, so show the other skill tree
+        if self.skills_key is not None and skills_key[0] != self.skills_key[0]:
+            self.selected_skill = None
+            self.skill_slots = self._create_skill_slots()
+
+        self.skills_key = skills_key
+        acquired_skills = self._get_acquired_skills()
         for skill_slot in self.skill_slots:
-            skill_slot.selected = (skill_slot == self.selected_skill)
-            skill_slot.update()
+            if skill_slot.acquired != (skill_slot.skill in acquired_skills):
+                skill_slot.acquired = skill_slot.skill in acquired_skills
+                skill_slot.update()
+
+    def _get_acquired_skills(self):
+        player = self.game.state.player
+        return player.human_skills | player.zombie_skills
 
     def _draw_info_panel(self, screen):
-        """Draws the information panel for the selected skill."""
+        """Draws the information panel for the selected skill, re-rendering it only when something changes."""
         x, y = 50, SCREEN_HEIGHT // 2
+        info_panel_key = (self.selected_skill.skill, self.skills_key)
+        if info_panel_key != self.info_panel_key:
+            self.info_panel = self._render_info_panel(self.selected_skill.skill)
+            self.info_panel_key = info_panel_key
+
+        info_panel, gain_button_rect = self.info_panel
+        screen.blit(info_panel, (x, y))
+
+        # Only allow gaining the skill while its button is showing
+        if gain_button_rect:
+            self.gain_button_rect = gain_button_rect.move(x, y)
+        elif hasattr(self, 'gain_button_rect'):
+            del self.gain_button_rect
+
+    def _render_info_panel(self, skill):
+        """Render the information panel for a skill, returning it with the gain button rect, if any."""
         width, height = SCREEN_WIDTH // 3, SCREEN_HEIGHT // 2 - 40
         player = self.game.state.player
+        button_rect = self._get_gain_button_rect(width)
+        info_panel = pygame.Surface((width, max(height, button_rect.bottom)), pygame.SRCALPHA) # The button hangs below the border
+        gain_button_rect = None
 
         # Draw border
-        pygame.draw.rect(screen, WHITE, (x, y, width, height), 2)
+        pygame.draw.rect(info_panel, WHITE, (0, 0, width, height), 2)
 
         # Draw skill name
-        properties = SKILLS[self.selected_skill.skill]
+        properties = SKILLS[skill]
         skill_name = font_large.render(properties.skill_type, True, WHITE)
         skill_name_width = skill_name.get_width()
-        screen.blit(skill_name, (x + width // 2 - skill_name_width // 2, y + 10))
+        info_panel.blit(skill_name, (width // 2 - skill_name_width // 2, 10))
 
         # Draw skill description
         wrapped_description = WrapText(properties.description, font_large, width - 20)
-        y_offset = y + 50
+        y_offset = 50
         for line in wrapped_description.lines:
             text_surface = font_large.render(line, True, WHITE)
-            screen.blit(text_surface, (x + 10, y_offset))
+            info_panel.blit(text_surface, (10, y_offset))
             y_offset += 20
 
         # Determine XP cost
-        xp_cost = self._get_skill_xp_cost(self.selected_skill.skill)
+        xp_cost = self._get_skill_xp_cost(skill)
+        missing_prerequisite = get_missing_prerequisite(skill, self._get_acquired_skills())
 
         # Skill acquisition rules
         if xp_cost is None:
-            status_text = "Requires Level 10+"
+            status_text = f"Requires Level {ZOMBIE_HUNTER_LEVEL}+"
             colour = RED
-        elif self.selected_skill.skill in player.human_skills or self.selected_skill.skill in player.zombie_skills:
+        elif skill in player.human_skills or skill in player.zombie_skills:
             status_text = "Skill already learned"
             colour = LIGHT_GRAY
-        elif properties.prerequisite_skills:
-            parent_skill = properties.prerequisite_skills[0]
-            if parent_skill not in player.human_skills and parent_skill not in player.zombie_skills:
-                prereq = SKILLS[parent_skill]
-                status_text = f"Requires {prereq.skill_type} skill"
-                colour = RED
-            elif len(properties.prerequisite_skills) > 1:
-                first_child_skill = properties.prerequisite_skills[1]
-                if first_child_skill not in player.human_skills and first_child_skill not in player.zombie_skills:
-                    prereq = SKILLS[first_child_skill]
-                    status_text = f"Requires {prereq.skill_type} skill"
-                    colour = RED
-                else:
-                    status_text = f"Requires {xp_cost} XP"
-                    colour = WHITE
-                    self._draw_gain_button(screen, x, y, width, xp_cost)                    
-            else:
-                status_text = f"Requires {xp_cost} XP"
-                colour = WHITE
-                self._draw_gain_button(screen, x, y, width, xp_cost)                
-                
+        elif missing_prerequisite:
+            status_text = f"Requires {SKILLS[missing_prerequisite].skill_type} skill"
+            colour = RED
         elif player.xp < xp_cost:
             status_text = f"Requires {xp_cost} XP"
             colour = RED
         else:
             status_text = f"Requires {xp_cost} XP"
             colour = WHITE
-            self._draw_gain_button(screen, x, y, width, xp_cost)
+            gain_button_rect = self._draw_gain_button(info_panel, button_rect)
         
         # Draw status text
         status_surface = font_large.render(status_text, True, colour)
-        status_rect = status_surface.get_rect(center=(x + width // 2, y + height - 40))
-        screen.blit(status_surface, status_rect)
+        status_rect = status_surface.get_rect(center=(width // 2, height - 40))
+        info_panel.blit(status_surface, status_rect)
 
-    def _draw_gain_button(self, screen, x, y, width, xp_cost):
-        """Draw the 'GAIN SKILL' button at the bottom of the info panel."""
-        button_width, button_height = 120, 40
-        button_x = x + width // 2 - button_width // 2
-        button_y = y + width - 60
+        return info_panel, gain_button_rect
 
-        self.gain_button_rect = pygame.Rect(button_x, button_y, button_width, button_height)
+    def _get_gain_button_rect(self, width):
+        """Return where the 'GAIN SKILL' button sits in an info panel of the given width."""
+        button_width, button_height = 120, 40
+        return pygame.Rect(width // 2 - button_width // 2, width - 60, button_width, button_height)
 
+    def _draw_gain_button(self, surface, gain_button_rect):
+        """Draw the 'GAIN SKILL' button at the bottom of the info panel, returning its rect."""
         # Draw button
-        pygame.draw.rect(screen, (0, 150, 0), self.gain_button_rect)
-        pygame.draw.rect(screen, WHITE, self.gain_button_rect, 2)
+        pygame.draw.rect(surface, (0, 150, 0), gain_button_rect)
+        pygame.draw.rect(surface, WHITE, gain_button_rect, 2)
 
         # Draw button text
         text_surface = font_large.render(f"GAIN SKILL", True, WHITE)
-        text_rect = text_surface.get_rect(center=self.gain_button_rect.center)
-        screen.blit(text_surface, text_rect)
+        text_rect = text_surface.get_rect(center=gain_button_rect.center)
+        surface.blit(text_surface, text_rect)
+        return gain_button_rect
 
     def _get_skill_xp_cost(self, skill):
-        """Calculate the XP cost for the given skill based on the player's occupation."""
+        """Look up the XP cost for the given skill based on the player's occupation."""
         player = self.game.state.player
-        skill_category = SKILLS[skill].skill_category
-        occupation_category = OCCUPATIONS[player.occupation].occupation_category
-
-        if skill_category == SkillCategory.CIVILIAN:
-            return 100 # Fixed cost for civilian skills
-        
-        elif skill_category == SkillCategory.MILITARY:
-            if occupation_category == OccupationCategory.MILITARY:
-                return 75
-            elif occupation_category == OccupationCategory.CIVILIAN:
-                return 100
-            else: # Science occupation
-                return 150
-            
-        elif skill_category == SkillCategory.SCIENCE:
-            if occupation_category == OccupationCategory.SCIENCE:
-                return 75
-            elif occupation_category == OccupationCategory.CIVILIAN:
-                return 100
-            else: # Military occupation
-                return 150
-            
-        elif skill_category == SkillCategory.ZOMBIE_HUNTER:
-            if player.level >= 10: # Requires level 10
-                return 100
-            else:
-                return None
-            
-        elif skill_category == SkillCategory.ZOMBIE:
-            return 100 # Fixed cost for zombie skills
+        return get_skill_xp_cost(player.occupation, skill, player.level)
 
     def _gain_skill(self):
         """Grants the selected skill if the player has enough XP."""
@@ -207,12 +236,17 @@ class SkillsMenu:
         player = self.game.state.player
         skill = self.selected_skill.skill
         xp_cost = self._get_skill_xp_cost(skill)
+        if xp_cost is None or player.xp < xp_cost:
+            return
 
         player.xp -= xp_cost
         player.add_skill(skill)
         self.selected_skill.acquired = True
+        self.selected_skill.update()
 
     def create_resources(self):
+        self.selected_skill = None
+        self.skills_key = None
         self.skill_slots = self._create_skill_slots()
         self.back_button = self._create_back_button()         
 
@@ -230,16 +264,15 @@ class SkillsMenu:
         """Create SkillSlots and add to skill_slots group"""
         player = self.game.state.player        
         skill_slots = pygame.sprite.Group()
-
-        if player.is_human:
-            acquired_skills = [skill for skill in SKILLS if skill in player.human_skills]
-        else:
-            acquired_skills = [skill for skill in SKILLS if skill in player.zombie_skills]
+        acquired_skills = player.human_skills if player.is_human else player.zombie_skills
 
         # Initialize y-offset for each column
         base_y = SCREEN_HEIGHT // 4
 
-        for category in SkillCategory:
+        for category, skills in SKILLS_BY_CATEGORY.items():
+            if player.is_human == (category == SkillCategory.ZOMBIE):
+                continue
+
             column = self.category_columns.get(category, 0)
             x_pos = self.column_x_positions[column]
             y_offset = base_y
@@ -248,33 +281,19 @@ class SkillsMenu:
             if category == SkillCategory.ZOMBIE_HUNTER:
                 y_offset += SCREEN_HEIGHT // 2  # Move to second row of middle column
 
-            for skill in SKILLS:
-                properties = SKILLS[skill]
-
-                if (player.is_human and properties.skill_category != SkillCategory.ZOMBIE) or \
-                    (not player.is_human and properties.skill_category == SkillCategory.ZOMBIE):
-
-                    if properties.skill_category == category:
-                        indent_level = self._get_skill_depth(skill)
-                        indent = indent_level - 1 if indent_level > 0 else 0
-
-                        skill_slot = SkillSlot(
-                            skill, properties, x_pos + (indent * 20), y_offset, 
-                            self.column_width, acquired=(skill in acquired_skills),
-                            indent_level=indent_level
-                        )
-                        skill_slots.add(skill_slot)
-                        y_offset += self.skill_spacing     
+            for skill in skills:
+                indent_level = SKILL_DEPTHS[skill]
+                indent = indent_level - 1 if indent_level > 0 else 0
+
+                skill_slot = SkillSlot(
+                    skill, SKILLS[skill], x_pos + (indent * 20), y_offset, 
+                    self.column_width, acquired=(skill in acquired_skills),
+                    indent_level=indent_level
+                )
+                skill_slots.add(skill_slot)
+                y_offset += self.skill_spacing     
         
         return skill_slots
-    
-    def _get_skill_depth(self, skill, depth=0):
-        """Recursively determine the indentation depth for a skill based on prerequisites."""
-        prerequisites = SKILLS[skill].prerequisite_skills
-        if not prerequisites:
-            return depth
-
-        return len(prerequisites)
 
 class SkillSlot(pygame.sprite.Sprite):
     """A skill slot representing a selectable skill."""
@@ -291,8 +310,13 @@ class SkillSlot(pygame.sprite.Sprite):
         self.rect = pygame.Rect(x, y, width, 30)
         self.image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
 
-        self.checkmark = pygame.image.load(ResourcePath("checkmark.png").path).convert_alpha()
-        self.checkmark = pygame.transform.scale(self.checkmark, (16, 16))
+        self.checkmark = ASSETS.get_scaled(ResourcePath("checkmark.png").path, (16, 16))
+
+        # Format skill name with indentation and "L" bracket if it has prerequisites
+        prefix = "└─" if self.indent_level > 0 else ""
+        self.text = font_skills.render(f"{prefix}{self.properties.skill_type}", True, WHITE)
+
+        self.update()
 
     def update(self):
         """Update the skill slot appearance."""
@@ -300,17 +324,11 @@ class SkillSlot(pygame.sprite.Sprite):
 
         border_colour = WHITE if self.selected else (0, 0, 0)
 
-        # Format skill name with indentation and "L" bracket if it has prerequisites
-        prefix = "└─" if self.indent_level > 0 else ""
-        skill_text = f"{prefix}{self.properties.skill_type}"
-
-        text = font_skills.render(skill_text, True, WHITE)
-
         # Draw selection border if selected
         if self.selected:
             pygame.draw.rect(self.image, border_colour, (0, 0, self.width - 100, self.height), 2)
 
-        self.image.blit(text, (10, 5))
+        self.image.blit(self.text, (10, 5))
 
         if self.acquired:
             self.image.blit(self.checkmark, (self.width - 120, 5))
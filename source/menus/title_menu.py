@@ -3,11 +3,13 @@
 import pygame
 from settings import *
 from ui import Button
-from data import Action, ResourcePath
+from data import Action
+from assets import ASSETS
 
 
 class TitleMenu:
-    def __init__(self):
+    def __init__(self, game):
+        self.game = game
         self.buttons = self.create_buttons()
         self.playing_music = False
 
@@ -41,15 +43,25 @@ class TitleMenu:
 
         self.buttons.draw(screen)
 
+        if not ASSETS.loaded:
+            self.draw_loading_progress(screen)
+
+    def draw_loading_progress(self, screen):
+        """Show how far background asset loading has got."""
+        width, height = SCREEN_WIDTH // 3, 10
+        x, y = (SCREEN_WIDTH - width) // 2, SCREEN_HEIGHT - 40
+        pygame.draw.rect(screen, WHITE, (x, y, width, height), 1)
+        pygame.draw.rect(screen, WHITE, (x, y, int(width * ASSETS.progress), height))
+
+        loading_text = font_small.render("Loading...", True, WHITE)
+        screen.blit(loading_text, loading_text.get_rect(midbottom=(SCREEN_WIDTH // 2, y - 5)))
+
     def title_music(self):
         if self.playing_music:
             return
         else:
             self.playing_music = True
-            pygame.mixer.init()
-            pygame.mixer.music.load(ResourcePath("music/summoning.mp3").path)
-            pygame.mixer.music.set_volume(0.3)  # Set volume to 50%
-            pygame.mixer.music.play(-1)
+            self.game.audio.play_music("title")
 
 class TitleAction:
     """Handles executing actions for the title screen."""
@@ -0,0 +1,141 @@
+# pathfinding.py
+
+from enum import Enum, auto
+
+from settings import *
+from data import BLOCKS, BlockType
+from topology import BLOCK_COUNT, LOCATIONS, NEIGHBOUR_INDICES, to_index
+
+
+class PathGoal(Enum):
+    LIT_BUILDINGS = auto()
+    HOSPITALS = auto()
+    POLICE_DEPARTMENTS = auto()
+    MALLS = auto()
+    SHELTER = auto()
+
+
+# Goal sets defined by block type never change once the city is built
+GOAL_BLOCK_TYPES = {
+    PathGoal.HOSPITALS: {BlockType.HOSPITAL},
+    PathGoal.POLICE_DEPARTMENTS: {BlockType.POLICE_DEPARTMENT},
+    PathGoal.MALLS: {BlockType.MALL},
+    PathGoal.SHELTER: {BlockType.FACTORY, BlockType.AUTO_REPAIR, BlockType.WAREHOUSE},
+}
+
+# How far away each goal set draws characters, in blocks
+GOAL_RANGES = {
+    PathGoal.LIT_BUILDINGS: LIGHT_SIGHT_RANGE,
+}
+
+UNREACHABLE = BLOCK_COUNT
+
+
+class FlowField:
+    """Distance to the nearest goal block and the next step toward it, for every block in the city."""
+    def __init__(self, goals=(), max_distance=None):
+        self.goals = set(goals) # Flat indices of goal blocks
+        self.max_distance = max_distance or UNREACHABLE
+        self.distances = []
+        self.next_steps = [] # Flat index of the next block toward a goal, or None
+        self.dirty = True
+
+    def add_goal(self, index):
+        """Add a goal block, updating only the blocks it brings closer to a goal."""
+        if index in self.goals:
+            return
+        self.goals.add(index)
+        if not self.dirty:
+            self._expand([index])
+
+    def remove_goal(self, index):
+        """Remove a goal block. Paths can only get longer, so the field is rebuilt on next use."""
+        if index in self.goals:
+            self.goals.discard(index)
+            self.dirty = True
+
+    def next_step(self, x, y):
+        """Return the adjacent block one step closer to the nearest goal, or None if there isn't one."""
+        if self.dirty:
+            self._rebuild()
+        step = self.next_steps[y * CITY_SIZE + x]
+        return None if step is None else LOCATIONS[step]
+
+    def distance(self, x, y):
+        if self.dirty:
+            self._rebuild()
+        return self.distances[y * CITY_SIZE + x]
+
+    def _rebuild(self):
+        self.distances = [UNREACHABLE] * BLOCK_COUNT
+        self.next_steps = [None] * BLOCK_COUNT
+        self.dirty = False
+        self._expand(self.goals)
+
+    def _expand(self, sources):
+        """Breadth-first search out from the sources, keeping any shorter distances found.
+
+        Every move costs the same, so breadth-first order gives the same result as Dijkstra.
+        """
+        distances, next_steps = self.distances, self.next_steps
+        frontier = list(sources)
+        for index in frontier:
+            distances[index] = 0
+            next_steps[index] = None
+
+        distance = 0
+        while frontier and distance < self.max_distance:
+            distance += 1
+            next_frontier = []
+            for index in frontier:
+                for neighbour in NEIGHBOUR_INDICES[index]:
+                    if distance < distances[neighbour]:
+                        distances[neighbour] = distance
+                        next_steps[neighbour] = index
+                        next_frontier.append(neighbour)
+            frontier = next_frontier
+
+
+class PathfindingService:
+    """Maintains a flow field per goal set, built on first use and updated as goal blocks change."""
+    def __init__(self, city):
+        self.city = city
+        self.fields = {} # FlowField keyed by PathGoal
+
+    def get_field(self, goal):
+        field = self.fields.get(goal)
+        if field is None:
+            field = self.fields[goal] = FlowField(self._find_goals(goal), GOAL_RANGES.get(goal))
+        return field
+
+    def next_step(self, goal, x, y):
+        """Return the adjacent block one step closer to the nearest block in a goal set."""
+        return self.get_field(goal).next_step(x, y)
+
+    def distance(self, goal, x, y):
+        return self.get_field(goal).distance(x, y)
+
+    def update_block(self, block):
+        """Update the dynamic goal sets after a block's state changes."""
+        field = self.fields.get(PathGoal.LIT_BUILDINGS)
+        if field is None:
+            return # Built with current state on first use
+        if self._is_goal(PathGoal.LIT_BUILDINGS, block):
+            field.add_goal(to_index(block.x, block.y))
+        else:
+            field.remove_goal(to_index(block.x, block.y))
+
+    def on_lights_changed(self, event):
+        self.update_block(self.city.block(event.x, event.y))
+
+    def _find_goals(self, goal):
+        return [
+            to_index(block.x, block.y)
+            for row in self.city.grid for block in row
+            if self._is_goal(goal, block)
+        ]
+
+    def _is_goal(self, goal, block):
+        if goal == PathGoal.LIT_BUILDINGS:
+            return BLOCKS[block.type].is_building and block.lights_on
+        return block.type in GOAL_BLOCK_TYPES[goal]
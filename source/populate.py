@@ -57,11 +57,6 @@ class GenerateNPCs:
         for npc in self.list:
             npc.ap += 1
 
-    def take_action(self):
-        """Allow all NPCs to take an action, such as moving or attacking."""
-        for npc in self.list:
-            npc.state.act()
-
     # Assign a random name to the character
     def _assign_name(self):
         file_path = DataPath('tables/character_names.csv').path
@@ -0,0 +1,132 @@
+# profiler.py
+
+import json
+import time
+from collections import deque
+
+from settings import *
+from data import SaveLoadPath
+
+
+class ProfilerSection:
+    """Times one named section of a frame when used as a context manager."""
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profiler.record(self.name, self.start, time.perf_counter() - self.start)
+        return False
+
+
+class FrameProfiler:
+    """Records per-section frame timings in a ring buffer, with an overlay and trace export."""
+    def __init__(self, max_frames=300, refresh_interval=30):
+        self.frames = deque(maxlen=max_frames) # (start, duration, sections) per finished frame
+        self.sections = {} # Reusable timers keyed by section name
+        self.counters = {} # Latest value of each named counter
+        self.current_sections = []
+        self.frame_start = None
+        self.origin = time.perf_counter() # Trace timestamps are relative to this
+        self.visible = False
+        self.refresh_interval = refresh_interval # Frames between overlay redraws
+        self.frames_since_refresh = 0
+        self.overlay = None
+
+    def section(self, name):
+        """Return the timer for a named section."""
+        timer = self.sections.get(name)
+        if timer is None:
+            timer = self.sections[name] = ProfilerSection(self, name)
+        return timer
+
+    def set_counter(self, name, value):
+        self.counters[name] = value
+
+    def begin_frame(self):
+        self.frame_start = time.perf_counter()
+        self.current_sections = []
+
+    def record(self, name, start, duration):
+        self.current_sections.append((name, start, duration))
+
+    def end_frame(self):
+        """Store the frame in the ring buffer."""
+        if self.frame_start is None:
+            return
+        duration = time.perf_counter() - self.frame_start
+        self.frames.append((self.frame_start, duration, self.current_sections))
+        self.frame_start = None
+        self.frames_since_refresh += 1
+
+    def toggle(self):
+        self.visible = not self.visible
+        self.overlay = None
+
+    def get_stats(self):
+        """Return rolling average and worst times in milliseconds, per section and for whole frames."""
+        totals, worst, counts = {}, {}, {}
+        for _, frame_duration, sections in self.frames:
+            for name, _, duration in sections + [("frame", 0, frame_duration)]:
+                totals[name] = totals.get(name, 0) + duration
+                worst[name] = max(worst.get(name, 0), duration)
+                counts[name] = counts.get(name, 0) + 1
+        return {
+            name: (totals[name] / counts[name] * 1000, worst[name] * 1000)
+            for name in totals
+        }
+
+    def draw(self, screen):
+        """Draw the overlay, re-rendering it every few frames."""
+        if not self.visible:
+            return
+        if self.overlay is None or self.frames_since_refresh >= self.refresh_interval:
+            self.overlay = self._render_overlay()
+            self.frames_since_refresh = 0
+        screen.blit(self.overlay, (SCREEN_WIDTH - self.overlay.get_width() - 10, 10))
+
+    def _render_overlay(self):
+        stats = self.get_stats()
+        lines = [f"{'section':<12}{'avg ms':>8}{'worst':>8}"]
+        lines += [f"{name:<12}{average:>8.2f}{worst:>8.2f}" for name, (average, worst) in stats.items()]
+        lines += [f"{name:<12}{value:>8}" for name, value in self.counters.items()]
+        lines.append(f"{len(self.frames)} frames, F4 saves trace")
+
+        line_height = font_skills.get_linesize()
+        width = max(font_skills.size(line)[0] for line in lines) + 20
+        overlay = pygame.Surface((width, line_height * len(lines) + 20))
+        overlay.fill(BLACK)
+        overlay.set_alpha(200)
+        for index, line in enumerate(lines):
+            overlay.blit(font_skills.render(line, True, WHITE), (10, 10 + index * line_height))
+        return overlay
+
+    def dump_trace(self, filename="frame_trace.json"):
+        """Write the buffered frames as Chrome trace events, returning the file path."""
+        events = []
+        for frame_start, frame_duration, sections in self.frames:
+            events.append(self._trace_event("frame", frame_start, frame_duration))
+            events.extend(self._trace_event(name, start, duration) for name, start, duration in sections)
+
+        path = SaveLoadPath(filename).path
+        with open(path, 'w') as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
+        return path
+
+    def _trace_event(self, name, start, duration):
+        return {
+            "name": name,
+            "ph": "X",
+            "ts": (start - self.origin) * 1_000_000,
+            "dur": duration * 1_000_000,
+            "pid": 1,
+            "tid": 1,
+        }
+
+
+PROFILER = FrameProfiler()
@@ -6,6 +6,7 @@ import os
 from settings import *
 from data import BLOCKS, ITEMS, ItemFunction, SaveLoadPath
 from characters import CharacterName
+from topology import NEIGHBOURHOOD_IDS_BY_NAME
 
 class GameData:
     def __init__(self, game):
@@ -26,7 +27,7 @@ class GameData:
                     "block_type": block.type,
                     "block_name": block.name,
                     "block_outside_desc": block.block_outside_desc,
-                    "neighbourhood": block.neighbourhood,
+                    "neighbourhood_id": block.neighbourhood_id,
                     "is_known": block.is_known,
                 }
                 if properties.is_building:
@@ -37,8 +38,7 @@ class GameData:
                         "ransack_level": block.ransack_level,
                         "ruined": block.ruined,
                         "fuel_expiration": block.fuel_expiration,
-                        "barricade_level": block.barricade.level,
-                        "barricade_sublevel": block.barricade.sublevel,
+                        "barricade_hp": block.barricade.hp,
                     })
                 city_data.append(block_data)
         return city_data
@@ -148,8 +148,10 @@ class GameData:
                 block.lights_on = block_data["lights_on"]
                 block.generator_installed = block_data["generator_installed"]
                 block.fuel_expiration = block_data["fuel_expiration"]
-                block.barricade.set_barricade_level(block_data["barricade_level"])
-                block.barricade.sublevel = block_data["barricade_sublevel"]
+                if "barricade_hp" in block_data:
+                    block.barricade.set_hp(block_data["barricade_hp"])
+                else: # Saved before barricades were kept as HP
+                    block.barricade.set_barricade_level(block_data["barricade_level"], block_data["barricade_sublevel"])
                 block.ransack_level = block_data["ransack_level"]
                 block.ruined = block_data["ruined"]
             else:
@@ -160,7 +162,10 @@ class GameData:
             block.block_outside_desc = block_data["block_outside_desc"]
             block.x = block_data["x"]
             block.y = block_data["y"]
-            block.neighbourhood = block_data["neighbourhood"]
+            if "neighbourhood_id" in block_data:
+                block.neighbourhood_id = block_data["neighbourhood_id"]
+            else: # Saves from before neighbourhood ids stored the name
+                block.neighbourhood_id = NEIGHBOURHOOD_IDS_BY_NAME[block_data["neighbourhood"]]
             block.is_known = block_data["is_known"]
 
             # Place the block in the correct position in the grid
@@ -206,6 +211,7 @@ class GameData:
             player.human_skills.add(skill)
         for skill in self.player_data["zombie_skills"]:
             player.zombie_skills.add(skill)
+        player.update_skill_mask()
 
         player.hp = self.player_data.get("hp", player.max_hp)
         player.ap = self.player_data.get("ap", 0)
@@ -260,6 +266,7 @@ class GameData:
                 npc.human_skills.add(skill)
             for skill in npc_data["zombie_skills"]:
                 npc.zombie_skills.add(skill)
+            npc.update_skill_mask()
 
             npc.hp = npc_data.get("hp", npc.max_hp)
             npc.ap = npc_data.get("ap", 0)
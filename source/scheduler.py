@@ -0,0 +1,115 @@
+# scheduler.py
+
+import heapq
+from collections import deque
+from dataclasses import dataclass
+
+from settings import *
+from event_bus import CHARACTER_EVENTS, BLOCK_EVENTS
+from topology import get_adjacent_locations
+from profiler import PROFILER
+
+
+@dataclass
+class DormancyStats:
+    ticker: int
+    dormant: int # NPCs asleep when the tick's turns were handed out
+    awake: int
+    woken: int # NPCs woken since the previous tick
+    slept: int # NPCs put to sleep during the previous tick
+
+
+class DormantNPC:
+    """An NPC parked until its wake tick, or until something happens at or next to its block."""
+    def __init__(self, scheduler, npc, wake_tick):
+        self.scheduler = scheduler
+        self.npc = npc
+        self.wake_tick = wake_tick
+        self.locations = () # Blocks whose events wake the NPC
+
+    def __lt__(self, other):
+        return self.wake_tick < other.wake_tick # Order within the timer heap
+
+    def on_event(self, event):
+        if event.character is not self.npc and self.npc.state.should_wake(event):
+            self.scheduler.wake(self.npc)
+
+
+class NPCScheduler:
+    """Hands out turns to NPCs, parking those with nothing to do until a wake condition fires.
+
+    NPCs short of AP, and dead NPCs, sleep until they have the AP to act or stand. Idle NPCs sleep
+    until something happens at their block or an adjacent one, they are attacked, or
+    DORMANT_WAKE_TICKS pass.
+    """
+    def __init__(self, game):
+        self.game = game
+        self.dormant = {} # DormantNPC keyed by NPC
+        self.timers = [] # Heap of DormantNPCs by wake tick, including stale entries for NPCs woken early
+        self.woken = 0
+        self.slept = 0
+        self.history = deque(maxlen=DORMANCY_HISTORY) # DormancyStats per tick
+
+    def is_dormant(self, npc):
+        return npc in self.dormant
+
+    def get_awake_npcs(self, ticker):
+        """Wake the NPCs whose timers are due and return every NPC that should take a turn this tick."""
+        while self.timers and self.timers[0].wake_tick <= ticker:
+            sleeper = heapq.heappop(self.timers)
+            if self.dormant.get(sleeper.npc) is sleeper:
+                self.wake(sleeper.npc)
+
+        awake = [npc for npc in self.game.state.npcs.list if npc not in self.dormant]
+        self._record(ticker, len(awake))
+        return awake
+
+    def take_turn(self, npc):
+        """Let an NPC decide and act, putting it to sleep if it can't or decided to do nothing."""
+        if npc.ap < 1:
+            # Nothing nearby can give AP, so just wait for enough to act
+            self.sleep(npc, 1 - npc.ap, listen=False)
+            return
+
+        state = npc.state
+        state.get_action()
+        state.act()
+        state.gain_skill()
+        if not state.next_action:
+            # Dead NPCs only wait for AP to stand
+            self.sleep(npc, state.get_sleep_ticks(), listen=not npc.is_dead)
+
+    def sleep(self, npc, ticks, listen=True):
+        """Park an NPC for up to a number of ticks, or until something happens around it if listening."""
+        if npc in self.dormant:
+            return
+
+        sleeper = DormantNPC(self, npc, self.game.ticker + ticks)
+        if listen:
+            bus = self.game.event_bus
+            x, y = npc.location
+            sleeper.locations = ((x, y),) + get_adjacent_locations(x, y)
+            bus.subscribe_block(x, y, sleeper.on_event, CHARACTER_EVENTS | BLOCK_EVENTS)
+            for adjacent_x, adjacent_y in sleeper.locations[1:]:
+                bus.subscribe_block(adjacent_x, adjacent_y, sleeper.on_event, CHARACTER_EVENTS)
+
+        self.dormant[npc] = sleeper
+        heapq.heappush(self.timers, sleeper)
+        self.slept += 1
+
+    def wake(self, npc):
+        """Return a sleeping NPC to the turn order. Does nothing if the NPC is awake."""
+        sleeper = self.dormant.pop(npc, None)
+        if sleeper is None:
+            return
+
+        bus = self.game.event_bus
+        for x, y in sleeper.locations:
+            bus.unsubscribe_block(x, y, sleeper.on_event)
+        self.woken += 1
+
+    def _record(self, ticker, awake):
+        stats = DormancyStats(ticker, len(self.dormant), awake, self.woken, self.slept)
+        self.history.append(stats)
+        self.woken = self.slept = 0
+        PROFILER.set_counter("dormant", stats.dormant)
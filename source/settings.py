@@ -1,5 +1,6 @@
 # settings.py
 
+import io
 import pygame
 from data import DataPath
 
@@ -22,6 +23,9 @@ FONT_SIZE = 16
 CHAT_HEIGHT = SCREEN_HEIGHT * 1 // 4
 CHAT_LINES = 10
 ACTION_INTERVAL = 1500 # Time between actions in milliseconds
+UTILITY_AI_ENABLED = True # Score human NPC decisions in batches (needs numpy)
+DORMANT_WAKE_TICKS = 10 # Longest an idle NPC sleeps before checking for something to do
+DORMANCY_HISTORY = 300 # Ticks of dormancy stats kept
 
 # Gameplay
 FUEL_DURATION = 200
@@ -29,6 +33,7 @@ MAX_ITEMS = 10
 ATTACK_DIFFICULTY = 10
 MAX_HP = 50
 BLOCK_CAPACITY = 8 # Limit of characters per block
+LIGHT_SIGHT_RANGE = 6 # Blocks away that zombies notice lit buildings
 STAND_AP = 50
 SEARCH_MULTIPLIER = 1.0
 LIGHTSON_MULTIPLIER = 2.5
@@ -44,12 +49,15 @@ ZOMBIE_ATTACKS = {
 
 # Fonts
 pygame.init()
-font_xs = pygame.font.Font(DataPath('fonts/PixelifySans.ttf').path, 10)
-font_small = pygame.font.Font(DataPath('fonts/PixelifySans.ttf').path, 12)
-font_large = pygame.font.Font(DataPath('fonts/PixelifySans.ttf').path, 18)
-font_xl = pygame.font.Font(DataPath('fonts/PixelifySans.ttf').path, 56)
-font_xxl = pygame.font.Font(DataPath('fonts/PixelifySans.ttf').path, 102)
-font_chat = pygame.font.Font(DataPath('fonts/PixelifySans.ttf').path, 16)
+with open(DataPath('fonts/PixelifySans.ttf').path, 'rb') as font_file:
+    PIXEL_FONT = font_file.read() # Read once, each size gets its own stream
+
+font_xs = pygame.font.Font(io.BytesIO(PIXEL_FONT), 10)
+font_small = pygame.font.Font(io.BytesIO(PIXEL_FONT), 12)
+font_large = pygame.font.Font(io.BytesIO(PIXEL_FONT), 18)
+font_xl = pygame.font.Font(io.BytesIO(PIXEL_FONT), 56)
+font_xxl = pygame.font.Font(io.BytesIO(PIXEL_FONT), 102)
+font_chat = pygame.font.Font(io.BytesIO(PIXEL_FONT), 16)
 font_skills = pygame.font.SysFont("Courier New", 16)
 
 # Colors
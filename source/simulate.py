@@ -5,6 +5,7 @@ import logging
 import pygame
 
 from main import GameInitializer  # Import the game setup
+from characters.actions.utility_ai import UTILITY_AI
 from settings import *
 
 screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -16,7 +17,7 @@ def run_simulation(rounds=500):
     """Runs the AI balance test without opening the game window."""
     
     # Initialize game (without rendering)
-    game = GameInitializer(screen)
+    game = GameInitializer(screen, audio=False)
     game.initialize_simulation()
     
     # If you want to load a save file, do this:
@@ -29,13 +30,14 @@ def run_simulation(rounds=500):
     for round_number in range(1, rounds + 1):
         game.ticker += 1  # Advance game time
 
-        # NPCs gain action points and act
-        for npc in game.state.npcs.list:
-            npc.ap += 1  # Gain 1 AP per round
-            if npc.ap >= 1:
-                npc.state.get_action()
-                npc.state.act()
-                npc.state.gain_skill()
+        # NPCs gain action points, and those awake act
+        game.state.npcs.gain_ap()
+        awake_npcs = game.scheduler.get_awake_npcs(game.ticker)
+        UTILITY_AI.assign(awake_npcs)
+        for npc in awake_npcs:
+            game.scheduler.take_turn(npc)
+        game.siege.resolve()
+        game.combat.resolve()
 
         # Count populations
         living_humans = sum(1 for npc in game.state.npcs.list if npc.is_human and not npc.is_dead)
@@ -0,0 +1,67 @@
+# topology.py
+
+from settings import CITY_SIZE, NEIGHBOURHOOD_SIZE
+from data import NEIGHBOURHOODS
+
+
+BLOCK_COUNT = CITY_SIZE * CITY_SIZE
+NEIGHBOURHOODS_PER_ROW = CITY_SIZE // NEIGHBOURHOOD_SIZE
+NEIGHBOURHOOD_COUNT = NEIGHBOURHOODS_PER_ROW * NEIGHBOURHOODS_PER_ROW
+
+# Offsets of the 8 adjacent blocks, top row to bottom row
+ADJACENT_OFFSETS = (
+    (-1, -1), (0, -1), (1, -1),
+    (-1, 0),           (1, 0),
+    (-1, 1),  (0, 1),  (1, 1),
+)
+
+
+def to_index(x, y):
+    """Return the flat row-major index of a block."""
+    return y * CITY_SIZE + x
+
+
+def in_bounds(x, y):
+    return 0 <= x < CITY_SIZE and 0 <= y < CITY_SIZE
+
+
+# Coordinates of every block, by flat index
+LOCATIONS = tuple((index % CITY_SIZE, index // CITY_SIZE) for index in range(BLOCK_COUNT))
+
+# Flat indices of the blocks adjacent to each block, by flat index
+NEIGHBOUR_INDICES = tuple(
+    tuple(to_index(x + dx, y + dy) for dx, dy in ADJACENT_OFFSETS if in_bounds(x + dx, y + dy))
+    for x, y in LOCATIONS
+)
+
+# Coordinates of the blocks adjacent to each block, by flat index
+ADJACENT_LOCATIONS = tuple(
+    tuple(LOCATIONS[neighbour] for neighbour in neighbours) for neighbours in NEIGHBOUR_INDICES
+)
+
+# Neighbourhood ids run row-major over the 10x10 neighbourhood grid
+NEIGHBOURHOOD_IDS = tuple(
+    (y // NEIGHBOURHOOD_SIZE) * NEIGHBOURHOODS_PER_ROW + x // NEIGHBOURHOOD_SIZE for x, y in LOCATIONS
+)
+NEIGHBOURHOOD_NAMES = tuple(NEIGHBOURHOODS[:NEIGHBOURHOOD_COUNT])
+NEIGHBOURHOOD_IDS_BY_NAME = {name: neighbourhood_id for neighbourhood_id, name in enumerate(NEIGHBOURHOOD_NAMES)}
+
+# Top-left block of each neighbourhood, and the flat indices of its blocks
+NEIGHBOURHOOD_ORIGINS = tuple(
+    ((neighbourhood_id % NEIGHBOURHOODS_PER_ROW) * NEIGHBOURHOOD_SIZE,
+     (neighbourhood_id // NEIGHBOURHOODS_PER_ROW) * NEIGHBOURHOOD_SIZE)
+    for neighbourhood_id in range(NEIGHBOURHOOD_COUNT)
+)
+NEIGHBOURHOOD_BLOCKS = tuple(
+    tuple(to_index(origin_x + col, origin_y + row) for row in range(NEIGHBOURHOOD_SIZE) for col in range(NEIGHBOURHOOD_SIZE))
+    for origin_x, origin_y in NEIGHBOURHOOD_ORIGINS
+)
+
+
+def get_adjacent_locations(x, y):
+    """Return the coordinates of the blocks adjacent to a block."""
+    return ADJACENT_LOCATIONS[to_index(x, y)]
+
+
+def get_neighbourhood_id(x, y):
+    return NEIGHBOURHOOD_IDS[to_index(x, y)]
@@ -8,6 +8,8 @@ from ui.viewport import Viewport
 from ui.utils import ActionProgress, DayCycleManager, DeathScreen, WrapText
 from ui.effects import ScreenTransition
 from ui.widgets import Cursor, Button
+from ui.hit_test import HitTestIndex
+from profiler import PROFILER
 from ui.map import Map
 
 
@@ -23,23 +25,47 @@ class DrawUI:
         self.description_panel = DescriptionPanel(game, screen)
         self.action_progress = ActionProgress(game, screen)
         self.screen_transition = ScreenTransition(screen, self.draw, self.update)
-        self.day_cycle = DayCycleManager(game)        
+        self.day_cycle = DayCycleManager(game, self._get_night_regions())
         self.map = Map(game, screen)
         self.death_screen = DeathScreen(game, screen)
+        self.hit_test = HitTestIndex()
 
     def draw(self, chat_history):
-        self.screen.fill(DARK_GREEN)
-        self.viewport.draw()
-        self.actions_panel.draw()
-        self.status_panel.draw()
-        self.chat_panel.draw(chat_history)
-        self.inventory_panel.draw()
-        self.description_panel.draw()
-        self.action_progress.draw()
-        self.day_cycle.draw()
+        with PROFILER.section("draw"):
+            self.screen.fill(DARK_GREEN)
+            self.viewport.draw()
+            self.actions_panel.draw()
+            self.status_panel.draw()
+            self.chat_panel.draw(chat_history)
+            self.inventory_panel.draw()
+            self.description_panel.draw()
+            self.action_progress.draw()
+            self.day_cycle.draw()
+            self._publish_hit_regions()
+
+    def _publish_hit_regions(self):
+        """Publish the interactive sprites as laid out this frame for mouse queries."""
+        self.hit_test.publish('block', self.viewport.viewport_group)
+        self.hit_test.publish('item', self.inventory_panel.inventory_group)
+        self.hit_test.publish('zombie', self.description_panel.zombie_sprite_group)
+        self.hit_test.publish('human', self.description_panel.human_sprite_group)
+        self.hit_test.publish('self', self.status_panel.player_sprite_group)
+
+    def _get_night_regions(self):
+        """Screen regions showing the setting, which darken as night approaches."""
+        viewport_rect = pygame.Rect(10, 10, self.viewport.frame_size, self.viewport.frame_size)
+        setting_rect = pygame.Rect(
+            self.description_panel.setting_image_x, self.description_panel.setting_image_y,
+            self.description_panel.setting_width, self.description_panel.setting_height,
+        )
+        return [viewport_rect, setting_rect]
 
     def update(self):
-        self.viewport.update()
-        self.actions_panel.update()
-        self.description_panel.update()
-        self.day_cycle.update()
+        with PROFILER.section("viewport"):
+            self.viewport.update()
+        with PROFILER.section("actions"):
+            self.actions_panel.update()
+        with PROFILER.section("description"):
+            self.description_panel.update()
+        with PROFILER.section("day cycle"):
+            self.day_cycle.update()
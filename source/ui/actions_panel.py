@@ -4,6 +4,7 @@ import pygame
 
 from settings import *
 from ui.widgets import Button
+from ui.utils import PanelBase
 from data import BLOCKS, SKILLS, SkillType
 
 
@@ -15,18 +16,24 @@ class ActionsPanel:
         self.width = SCREEN_HEIGHT // 2
         self.height = SCREEN_HEIGHT * 3 // 20 - 10
         self.button_group = self._create_button_group()
+        self.base = PanelBase(self._compose_base)
 
     def draw(self):
         x, y = 10, (SCREEN_HEIGHT // 2) + 40     
-        # Draw the panel background and border
-        pygame.draw.rect(self.screen, WHITE, (x, y, self.width, self.height))
-        pygame.draw.rect(self.screen, BLACK, (x, y, self.width, self.height), 2)
+        self.screen.blit(self.base.get(), (x, y))
+        self.button_group.draw(self.screen)        
+
+    def _compose_base(self):
+        """Draw the panel background, border and title."""
+        base = pygame.Surface((self.width, self.height))
+        base.fill(WHITE)
+        pygame.draw.rect(base, BLACK, (0, 0, self.width, self.height), 2)
 
         # Render the title
         title_text = font_large.render("Available Actions", True, BLACK)
-        title_rect = title_text.get_rect(center=(x + self.width // 2, y + 15))
-        self.screen.blit(title_text, title_rect)
-        self.button_group.draw(self.screen)        
+        title_rect = title_text.get_rect(center=(self.width // 2, 15))
+        base.blit(title_text, title_rect)
+        return base
 
     # Set up action button group
     def _create_button_group(self):
@@ -1,20 +1,20 @@
 # chat_panel.py
 
 from settings import *
-from ui.utils import WrapText
+from ui.utils import WrapText, PanelBase
 from data import ResourcePath
+from assets import ASSETS
 
 
 class ChatPanel:
     def __init__(self, screen):
         self.screen = screen
-        self.original_image = pygame.image.load(ResourcePath("panels/chat_panel.png").path).convert_alpha()
         self.width, self.height = SCREEN_HEIGHT // 2, SCREEN_HEIGHT * 3 // 10
-        self.image = pygame.transform.scale(self.original_image, (self.width, self.height))
+        self.base = PanelBase(self._compose_base)
 
     def draw(self, chat_history):
         x, y = 10, SCREEN_HEIGHT * 13 // 20 + 30
-        self.screen.blit(self.image, (x, y))
+        self.screen.blit(self.base.get(), (x, y))
 
         # Render chat messages
         wrapped_history = []
@@ -26,4 +26,7 @@ class ChatPanel:
         for message in reversed(wrapped_history[-10:]):  # Show last 10 messages
             text = font_chat.render(message, True, WHITE)
             self.screen.blit(text, (x + 30, y_offset))
-            y_offset -= font_chat.get_linesize()
\ No newline at end of file
+            y_offset -= font_chat.get_linesize()
+
+    def _compose_base(self):
+        return ASSETS.get_scaled(ResourcePath("panels/chat_panel.png").path, (self.width, self.height))
\ No newline at end of file
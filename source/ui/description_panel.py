@@ -1,11 +1,14 @@
 # description_panel.py
 
 import random
+from collections import defaultdict
 
 from settings import *
-from ui.utils import WrapText, SpriteSheet
+from ui.utils import WrapText, SpriteSheet, PanelBase
 from data import BLOCKS, BlockType, SkillType, OCCUPATIONS, ResourcePath
+from assets import ASSETS
 from ui.widgets import ClockHUD
+from event_bus import CHARACTER_EVENTS, BLOCK_EVENTS
 
 
 class DescriptionPanel:
@@ -17,8 +20,7 @@ class DescriptionPanel:
         self.height = SCREEN_HEIGHT * 25 // 32
         self.x = SCREEN_HEIGHT // 2 + 10
         
-        self.original_image = pygame.image.load(ResourcePath("panels/description_panel.png").path).convert_alpha()
-        self.image = pygame.transform.scale(self.original_image, (self.width, self.height))
+        self.base = PanelBase(self._compose_base)
 
         self.setting_width = self.width * 5 // 6
         self.setting_height = self.setting_width * 4 // 9  # 9:4 aspect ratio
@@ -31,13 +33,17 @@ class DescriptionPanel:
         # Store current description and setting image data
         self.current_description = []
         self.setting_image = None
+        self.surroundings_snapshot = None # Surroundings the description was last built for
+        self.view = None # Player location, side and skills the panel was last built for
+        self.watched_location = None # Block whose events mark the panel for rebuilding
+        self.dirty = True
 
         # Set up Clock HUD
         self.clock = ClockHUD(self.game)        
 
     def draw(self):
         # Blit the panel background
-        self.screen.blit(self.image, (self.x, 10))
+        self.screen.blit(self.base.get(), (self.x, 10))
 
         # Blit the setting image at the top of the panel
         self.screen.blit(self.setting_image, (self.setting_image_x, self.setting_image_y)) 
@@ -61,32 +67,91 @@ class DescriptionPanel:
             self.screen.blit(text, text_rect)
             text_start_y += font_large.size(line)[1]  # Move down for the next line        
 
+    def _compose_base(self):
+        return ASSETS.get_scaled(ResourcePath("panels/description_panel.png").path, (self.width, self.height))
+
     def update(self):
-        self._update_observations()
-        self._update_npc_sprites()
+        player = self.game.state.player
+        view = (player.location, player.inside, SkillType.NECROTECH_EMPLOYMENT in player.human_skills)
+        if view != self.view:
+            self.view = view
+            self._watch_location(player.location)
+            self.dirty = True
+
+        # Only look at who is here again once something at the block has changed
+        if self.dirty:
+            self.dirty = False
+            x, y = player.location
+            block_characters = player.state.filter_characters_at_location(x, y, player.inside, include_player=False)
+            self._update_description(block_characters)
+            self._update_npc_sprites(block_characters)
+
         self.clock.update()
-        self.setting_image = self._get_setting_image()
-        self.current_description = self._get_formatted_description()
         self.zombie_sprite_group.update(self.game)
         self._position_npc_sprites(self.zombie_sprite_group, 'right')
         self.human_sprite_group.update(self.game)
         self._position_npc_sprites(self.human_sprite_group, 'left')    
 
+    def _watch_location(self, location):
+        bus = self.game.event_bus
+        if self.watched_location is not None:
+            bus.unsubscribe_block(*self.watched_location, self._on_block_event)
+        self.watched_location = location
+        bus.subscribe_block(*location, self._on_block_event, CHARACTER_EVENTS | BLOCK_EVENTS)
+
+    def _on_block_event(self, event):
+        self.dirty = True
+
     def _create_sprite_elements(self):
         self.zombie_sprite_group = pygame.sprite.Group()
-        self.zombie_sprite_sheet_image = pygame.image.load(ResourcePath("sprite_sheets/zombie_sprite_sheet.png").path).convert_alpha()
+        self.zombie_sprite_sheet_image = ASSETS.get_image(ResourcePath("sprite_sheets/zombie_sprite_sheet.png").path)
         self.zombie_sprite_sheet = SpriteSheet(self.zombie_sprite_sheet_image)
 
         self.human_sprite_group = pygame.sprite.Group()      
-        self.consumer_sprite_sheet_image = pygame.image.load(ResourcePath("sprite_sheets/consumer_sprite_sheet.png").path).convert_alpha()
+        self.consumer_sprite_sheet_image = ASSETS.get_image(ResourcePath("sprite_sheets/consumer_sprite_sheet.png").path)
         self.consumer_sprite_sheet = SpriteSheet(self.consumer_sprite_sheet_image)
-        self.civilian_sprite_sheet_image = pygame.image.load(ResourcePath("sprite_sheets/civilian_sprite_sheet.png").path).convert_alpha()
+        self.civilian_sprite_sheet_image = ASSETS.get_image(ResourcePath("sprite_sheets/civilian_sprite_sheet.png").path)
         self.civilian_sprite_sheet = SpriteSheet(self.civilian_sprite_sheet_image)
-        self.military_sprite_sheet_image = pygame.image.load(ResourcePath("sprite_sheets/military_sprite_sheet.png").path).convert_alpha()
+        self.military_sprite_sheet_image = ASSETS.get_image(ResourcePath("sprite_sheets/military_sprite_sheet.png").path)
         self.military_sprite_sheet = SpriteSheet(self.military_sprite_sheet_image)
-        self.science_sprite_sheet_image = pygame.image.load(ResourcePath("sprite_sheets/science_sprite_sheet.png").path).convert_alpha()
+        self.science_sprite_sheet_image = ASSETS.get_image(ResourcePath("sprite_sheets/science_sprite_sheet.png").path)
         self.science_sprite_sheet = SpriteSheet(self.science_sprite_sheet_image)                             
 
+        # Map NPCs to their sprites
+        self.zombie_sprites = NPCSpriteRegistry(self.screen, self.zombie_sprite_group)
+        self.human_sprites = NPCSpriteRegistry(self.screen, self.human_sprite_group)
+
+    def get_npc_sprite(self, npc):
+        """Return the sprite showing an NPC in the description panel, if any."""
+        return self.zombie_sprites.get(npc) or self.human_sprites.get(npc)
+
+    def _update_description(self, block_characters):
+        """Rebuild the setting image and description only when the player's surroundings change."""
+        snapshot = self._get_surroundings_snapshot(block_characters)
+        if snapshot == self.surroundings_snapshot:
+            return
+
+        self.surroundings_snapshot = snapshot
+        self._update_observations(block_characters)
+        self.setting_image = self._get_setting_image()
+        self.current_description = self._get_formatted_description()
+
+    def _get_surroundings_snapshot(self, block_characters):
+        """Return everything the setting image and description depend on."""
+        player = self.game.state.player
+        x, y = player.location
+        current_block = self.game.state.city.block(x, y)
+        return (
+            player.location,
+            player.inside,
+            SkillType.NECROTECH_EMPLOYMENT in player.human_skills,
+            current_block.type,
+            current_block.get_observable_state(),
+            len(block_characters.living_zombies),
+            len(block_characters.living_humans),
+            len(block_characters.dead_bodies),
+        )
+
     def _get_setting_image(self):
         """Determine the setting image."""
         x, y = self.game.state.player.location
@@ -95,7 +160,7 @@ class DescriptionPanel:
         image_path = ResourcePath(f"settings/{current_block.type.name.lower()}_{image_suffix}.png").path
 
         try:
-            setting_image = pygame.image.load(image_path)
+            setting_image = ASSETS.get_image(image_path)
         except FileNotFoundError:
             setting_image = pygame.Surface((1, 1))  # Fallback if image not found
             setting_image.fill((0, 0, 0))
@@ -123,8 +188,10 @@ class DescriptionPanel:
        
     def _get_formatted_description(self):
         """Get the description text and wrap it to fit within the panel"""
+        x, y = self.game.state.player.location
+        current_block = self.game.state.city.block(x, y)
         paragraphs = []
-        for observation in self._description():
+        for observation in current_block.observations:
             wrapped_text = WrapText(observation, font_large, self.width - 100)  # 50px padding on each side
             for line in wrapped_text.lines:
                 paragraphs.append(line)
@@ -132,7 +199,7 @@ class DescriptionPanel:
 
         return paragraphs
 
-    def _get_current_observations(self):
+    def _get_current_observations(self, block_characters):
         """Get the current observations based on the player's surroundings."""
         player = self.game.state.player
         x, y = player.location
@@ -184,8 +251,6 @@ class DescriptionPanel:
                 current_observations += f'You are standing in {properties.description}. '
 
         # Add observations for NPCs and dead bodies
-        block_characters = player.state.filter_characters_at_location(x, y, player.inside, include_player=False)
-
         if block_characters.living_zombies:
             if len(block_characters.living_zombies) == 1:
                 current_observations += "There is a lone zombie here. "
@@ -206,82 +271,84 @@ class DescriptionPanel:
 
         return current_observations
 
-    def _update_observations(self):
+    def _update_observations(self, block_characters):
         """Update the observations list based on the player's current state."""
         player = self.game.state.player
         x, y = player.location
         current_block = self.game.state.city.block(x, y)        
         current_block.observations.clear()  # Clear existing observations
         if self.game.state.player.inside:
-            current_block.observations.append(self._get_current_observations())
+            current_block.observations.append(self._get_current_observations(block_characters))
             current_block.observations.append(current_block.block_inside_desc)
         else:
-            current_block.observations.append(self._get_current_observations())
+            current_block.observations.append(self._get_current_observations(block_characters))
             current_block.observations.append(current_block.block_outside_desc)
 
-    def _description(self):
-        """Return the current list of observations as a list."""
-        player = self.game.state.player
-        x, y = player.location
-        current_block = self.game.state.city.block(x, y)        
-        self._update_observations()  # Ensure observations are current
-        return current_block.observations
-
-    def _update_npc_sprites(self):
+    def _update_npc_sprites(self, block_characters):
         """Update NPC sprites' visibility."""
-        player = self.game.state.player
-        x, y = player.location        
-
-        # Keep track of NPCs currently at the player's location
-        block_characters = player.state.filter_characters_at_location(x, y, player.inside, include_player=False)
-
-        # Update existing sprites or create new ones if necessary
-        updated_sprites = []
+        # Dead zombies keep their sprite until the death animation finishes
+        self.zombie_sprites.sync(
+            block_characters.living_zombies + block_characters.dead_zombies,
+            lambda zombie: self.zombie_sprite_sheet,
+        )
+        self.human_sprites.sync(block_characters.living_humans, self._get_human_sprite_sheet)
 
-        for zombie in block_characters.living_zombies + block_characters.dead_zombies:
-            # Check if a sprite for this zombie already exists
-            existing_sprite = next(
-                (sprite for sprite in self.zombie_sprite_group if sprite.npc == zombie), None
-            )
-            if existing_sprite:
-                updated_sprites.append(existing_sprite)
-            else:
-                if not zombie.is_dead:
-                    # Create a new sprite for the zombie
-                    new_sprite = NPCSprite(
-                        self.screen, zombie, self.zombie_sprite_sheet, 2.5, (0, 0, 0)
-                    )
-                    self.zombie_sprite_group.add(new_sprite)
-                    updated_sprites.append(new_sprite)
-
-        # Remove sprites for zombies that are no longer here
-        for sprite in list(self.zombie_sprite_group):
-            if sprite not in updated_sprites:
-                sprite.kill()
-
-        for human in block_characters.living_humans:
-            # Check if a sprite for this human already exists
-            existing_sprite = next(
-                (sprite for sprite in self.human_sprite_group if sprite.npc == human), None
-            )
-            if existing_sprite:
-                updated_sprites.append(existing_sprite)
-            else:
-                # Create a new sprite for the human
-                occupation = human.occupation
-                sprite_sheet_name = OCCUPATIONS[occupation].sprite_sheet
-                sprite_sheet = getattr(self, sprite_sheet_name)
+    def _get_human_sprite_sheet(self, human):
+        """Return the sprite sheet for a human's occupation."""
+        sprite_sheet_name = OCCUPATIONS[human.occupation].sprite_sheet
+        return getattr(self, sprite_sheet_name)
 
-                new_sprite = NPCSprite(
-                    self.screen, human, sprite_sheet, 2.5, (0, 0, 0)
-                )
-                self.human_sprite_group.add(new_sprite)
-                updated_sprites.append(new_sprite)                
 
-        # Remove sprites for humans that are no longer here
-        for sprite in list(self.human_sprite_group):
-            if sprite not in updated_sprites:
-                sprite.kill()  
+class NPCSpriteRegistry:
+    """Maps NPCs to their sprites, recycling sprites from a pool as NPCs come and go."""
+    def __init__(self, screen, sprite_group, scale=2.5, colour=(0, 0, 0), max_pool_size=16):
+        self.screen = screen
+        self.sprite_group = sprite_group
+        self.scale = scale
+        self.colour = colour
+        self.max_pool_size = max_pool_size # Spare sprites kept per sprite sheet
+        self.sprites = {} # NPCSprite keyed by NPC
+        self.pool = defaultdict(list) # Released sprites keyed by sprite sheet
+
+    def get(self, npc):
+        """Return the sprite for an NPC, if it has one."""
+        return self.sprites.get(npc)
+
+    def sync(self, npcs, get_sprite_sheet):
+        """Match sprites to the NPCs present. New sprites are only added for living NPCs."""
+        # Release sprites for NPCs that are no longer here
+        for npc in self.sprites.keys() - set(npcs):
+            self._release(npc)
+
+        for npc in npcs:
+            sprite = self.sprites.get(npc)
+
+            # Sprites kill themselves when their death animation ends
+            if sprite and not sprite.alive():
+                self._release(npc)
+                sprite = None
+
+            if sprite is None and not npc.is_dead:
+                sprite = self._acquire(npc, get_sprite_sheet(npc))
+                self.sprites[npc] = sprite
+                self.sprite_group.add(sprite)
+
+    def _acquire(self, npc, sprite_sheet):
+        """Reuse a pooled sprite for the NPC, or create one if the pool is empty."""
+        pool = self.pool[sprite_sheet]
+        if pool:
+            sprite = pool.pop()
+            sprite.reset(npc)
+            return sprite
+        return NPCSprite(self.screen, npc, sprite_sheet, self.scale, self.colour)
+
+    def _release(self, npc):
+        """Remove an NPC's sprite from the panel and return it to the pool."""
+        sprite = self.sprites.pop(npc)
+        sprite.kill()
+        pool = self.pool[sprite.sprite_sheet]
+        if len(pool) < self.max_pool_size:
+            pool.append(sprite)
 
 
 class NPCSprite(pygame.sprite.Sprite):
@@ -289,18 +356,14 @@ class NPCSprite(pygame.sprite.Sprite):
     def __init__(self, screen, npc, sprite_sheet, scale, colour):
         super().__init__()
         self.screen = screen
-        self.npc = npc  # Reference to the parent NPC
         self.sprite_sheet = sprite_sheet
         self.frame_count = [8, 7, 6, 3]  # Total number of frames
-        self.action = 0
         self.frame_width = 64  # Width of each frame
         self.frame_height = 64  # Height of each frame
         self.scale = scale  # Scale factor for the frames
         self.colour = colour  # Transparent color for the frames
         self.animation_speed = 0.15  # Animation speed (seconds per frame)
-        self.last_update_time = pygame.time.get_ticks()  # Time since the last frame update
         self.hp_bar_height = 10
-        self.play_once = False # For one-time animations
 
         # Calculate starting frames for each action
         self.action_start_frames = [
@@ -309,29 +372,29 @@ class NPCSprite(pygame.sprite.Sprite):
             self.frame_count[0] + self.frame_count[1],  # Action 2 (Die)
             self.frame_count[0] + self.frame_count[1] + self.frame_count[2],  # Action 3 (Hurt)
         ]
+
+        # Frames are shared by every sprite using this sheet
+        self.frames = self.sprite_sheet.get_frames(self.frame_width, self.frame_height, self.scale, self.colour)
+
+        self.reset(npc)
+
+    def reset(self, npc):
+        """Assign the sprite to an NPC and restart its idle animation."""
+        self.npc = npc  # Reference to the parent NPC
+        self.action = 0
+        self.play_once = False # For one-time animations
+        self.last_update_time = pygame.time.get_ticks()  # Time since the last frame update
         self.current_frame = self.action_start_frames[self.action] + random.randint(0, self.frame_count[0] - 1)
 
         # Set the initial image and rect
-        self.image = self.sprite_sheet.get_image(
-            frame=self.current_frame,
-            width=self.frame_width,
-            height=self.frame_height,
-            scale=self.scale,
-            colour=self.colour,
-        )
+        self.image = self.frames[self.current_frame]
         self.rect = self.image.get_rect()
 
 
     def _get_current_frame(self):
-        """Retrieve the correct frame from the sprite sheet."""
+        """Retrieve the correct frame from the frame bank."""
         start_frame = self.action_start_frames[self.action]
-        return self.sprite_sheet.get_image(
-            frame=start_frame + self.current_frame,
-            width=self.frame_width,
-            height=self.frame_height,
-            scale=self.scale,
-            colour=self.colour,
-        )
+        return self.frames[start_frame + self.current_frame]
 
     def set_action(self, action):
         """
@@ -77,4 +77,43 @@ class ScreenTransition:
         for _ in range(steps):
             self.screen.blit(overlay, (0, 0))
             pygame.display.flip()
-            self.clock.tick(60)  # 60 FPS flicker effect    
\ No newline at end of file
+            self.clock.tick(60)  # 60 FPS flicker effect
+
+
+class NightOverlay:
+    """Caches tinted overlay layers and blits them over selected screen regions."""
+    def __init__(self, screen, colour, regions=None):
+        self.screen = screen
+        self.colour = colour # RGB colour of the tint
+        self.regions = []
+        self.layers = {} # Cached layers keyed by (size, alpha)
+
+        self.set_regions(regions)
+
+    def set_regions(self, regions=None):
+        """Set the screen regions to tint. Tints the whole screen if no regions are given."""
+        if regions:
+            self.regions = [pygame.Rect(region) for region in regions]
+        else:
+            self.regions = [self.screen.get_rect()]
+        self.layers.clear()
+
+    def get_layer(self, size, alpha):
+        """Return the overlay layer for a region size and alpha step, creating it once."""
+        key = (size, alpha)
+        layer = self.layers.get(key)
+        if layer is None:
+            # A plain surface with surface-level alpha blends much faster than per-pixel alpha
+            layer = pygame.Surface(size).convert()
+            layer.fill(self.colour)
+            layer.set_alpha(alpha)
+            self.layers[key] = layer
+        return layer
+
+    def draw(self, alpha):
+        """Blit the overlay over each region. Nothing is drawn while fully transparent."""
+        if alpha <= 0:
+            return
+
+        for region in self.regions:
+            self.screen.blit(self.get_layer(region.size, alpha), region.topleft)
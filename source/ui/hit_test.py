@@ -0,0 +1,56 @@
+# hit_test.py
+
+from bisect import bisect_right
+
+
+class HitTestIndex:
+    """Z-ordered registry of interactive screen regions, indexed for mouse queries."""
+    LAYERS = ('block', 'item', 'zombie', 'human', 'self') # Bottom to top
+
+    def __init__(self):
+        self.layers = {layer: [] for layer in self.LAYERS} # (rect, sprite) pairs per layer
+        self.edges = [] # Sorted x coordinates where regions start or end
+        self.slabs = [] # Regions spanning each strip between edges, top-most first
+        self.dirty = False
+
+    def publish(self, layer, sprites):
+        """Publish the rects of a layer's sprites, marking the index stale if the layout changed."""
+        regions = [(tuple(sprite.rect), sprite) for sprite in sprites]
+        if regions != self.layers[layer]:
+            self.layers[layer] = regions
+            self.dirty = True
+
+    def query(self, pos):
+        """Return the layer and sprite of the top-most region under a point."""
+        if self.dirty:
+            self._rebuild()
+
+        x, y = pos
+        index = bisect_right(self.edges, x) - 1
+        if 0 <= index < len(self.slabs):
+            for top, bottom, layer, sprite in self.slabs[index]:
+                if top <= y < bottom:
+                    return layer, sprite
+        return None, None
+
+    def _rebuild(self):
+        """Split the screen into vertical strips and stack the regions covering each one."""
+        regions = []
+        for z, layer in enumerate(self.LAYERS):
+            for order, ((x, y, width, height), sprite) in enumerate(self.layers[layer]):
+                if width > 0 and height > 0:
+                    regions.append(((z, order), x, x + width, y, y + height, layer, sprite))
+
+        # Later layers, and later sprites within a layer, are drawn on top
+        regions.sort(key=lambda region: region[0], reverse=True)
+
+        self.edges = sorted({edge for region in regions for edge in region[1:3]})
+        self.slabs = [
+            [
+                (top, bottom, layer, sprite)
+                for _, left, right, top, bottom, layer, sprite in regions
+                if left <= slab_left and right >= slab_right
+            ]
+            for slab_left, slab_right in zip(self.edges, self.edges[1:])
+        ]
+        self.dirty = False
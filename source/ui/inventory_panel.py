@@ -4,6 +4,8 @@ import pygame
 
 from settings import *
 from data import ITEMS, ItemFunction, ResourcePath
+from assets import ASSETS
+from ui.utils import PanelBase
 
 
 class InventoryPanel:
@@ -13,11 +15,12 @@ class InventoryPanel:
         self.screen = screen
         self.width, self.height = (SCREEN_WIDTH * 7 // 16) + (SCREEN_HEIGHT * -7 // 32) - 20, SCREEN_HEIGHT * 31 // 160
         self.weapon_size = self.height
-        self.original_image = pygame.image.load(ResourcePath("panels/inventory_panel.png").path).convert_alpha()
-        self.image = pygame.transform.scale(self.original_image, (self.width, self.height))
-        self.original_weapon_image = pygame.image.load(ResourcePath("panels/equipped_panel.png").path).convert_alpha()
-        self.weapon_image = pygame.transform.scale(self.original_weapon_image, (self.weapon_size, self.weapon_size))
         self.inventory_group = pygame.sprite.Group()
+        self.base = PanelBase(self._compose_base)
+
+        # Equipped weapon display, rendered only when the weapon or its ammo changes
+        self.weapon_display = None
+        self.weapon_display_key = None
 
     def draw(self):
         """Draw the inventory panel."""
@@ -25,12 +28,18 @@ class InventoryPanel:
         weapon_x, weapon_y = x - self.weapon_size, y
 
         # Blit the panel backgrounds
-        self.screen.blit(self.image, (x, y))
-        self.screen.blit(self.weapon_image, (weapon_x, weapon_y))
+        self.screen.blit(self.base.get(), (weapon_x, weapon_y))
 
         # Draw inventory items and weapon
         self._draw_items(x, y)
 
+    def _compose_base(self):
+        """Composite the equipped weapon frame and inventory panel into one surface."""
+        base = pygame.Surface((self.weapon_size + self.width, self.height), pygame.SRCALPHA)
+        base.blit(ASSETS.get_scaled(ResourcePath("panels/equipped_panel.png").path, (self.weapon_size, self.weapon_size)), (0, 0))
+        base.blit(ASSETS.get_scaled(ResourcePath("panels/inventory_panel.png").path, (self.width, self.height)), (self.weapon_size, 0))
+        return base
+
     def _draw_items(self, x, y):
         """Inventory item scaling, positioning and drawing."""
         item_width = int(self.width * 0.14)
@@ -71,28 +80,9 @@ class InventoryPanel:
                 highlight.fill((TRANS_YELLOW))
                 self.screen.blit(highlight, sprite.rect.topleft)
 
-                # Draw enlarged equipped item
-                weapon_properties = ITEMS[item.type]
-                weapon_item_size = self.weapon_size * 3 // 5
-                enlarged_weapon_image = pygame.transform.scale(sprite.image, (weapon_item_size, weapon_item_size))
-                weapon_item_x = x - (self.weapon_size // 2) - (weapon_item_size // 2)
-                weapon_item_y = y + (self.weapon_size // 2) - (weapon_item_size // 2)
-                self.screen.blit(enlarged_weapon_image, (weapon_item_x, weapon_item_y))
-
-                # Draw equipped item label
-                weapon_text = font_large.render(weapon_properties.item_type, True, ORANGE)
-                weapon_text_shadow = font_large.render(weapon_properties.item_type, True, BLACK)                
-                text_width = weapon_text.get_width()
-                self.screen.blit(weapon_text_shadow, (weapon_item_x + (weapon_item_size // 2) - (text_width // 2) + 1, weapon_item_y + weapon_item_size + 8))                
-                self.screen.blit(weapon_text, (weapon_item_x + (weapon_item_size // 2) - (text_width // 2), weapon_item_y + weapon_item_size + 7))
-
-                # Draw currently loaded ammo
-                if weapon_properties.item_function == ItemFunction.FIREARM:
-                    label_x = weapon_item_x + weapon_item_size - 20
-                    label_y = weapon_item_y + weapon_item_size - 20
-                    pygame.draw.rect(self.screen, WHITE, (label_x, label_y, 20, 20))
-                    loaded_ammo = font_large.render(str(item.loaded_ammo), True, BLACK)
-                    self.screen.blit(loaded_ammo, (label_x + 5, label_y + 2))
+                # Draw enlarged equipped item, label and ammo
+                weapon_display, weapon_display_x = self._get_weapon_display(item)
+                self.screen.blit(weapon_display, (x - self.weapon_size + weapon_display_x, y))
 
             else:
                 highlight.fill((0, 0, 0, 0))
@@ -106,13 +96,54 @@ class InventoryPanel:
         self.inventory_group.draw(self.screen)
 
 
+    def _get_weapon_display(self, item):
+        """Return the equipped weapon display and its x offset, re-rendering it when the weapon or ammo changes."""
+        key = (item, item.type, getattr(item, 'loaded_ammo', None))
+        if key != self.weapon_display_key:
+            self.weapon_display = self._render_weapon_display(item)
+            self.weapon_display_key = key
+        return self.weapon_display
+
+    def _render_weapon_display(self, item):
+        weapon_properties = ITEMS[item.type]
+        weapon_item_size = self.weapon_size * 3 // 5
+        weapon_text = font_large.render(weapon_properties.item_type, True, ORANGE)
+        weapon_text_shadow = font_large.render(weapon_properties.item_type, True, BLACK)
+        text_width = weapon_text.get_width()
+
+        # Widen the display if the label is wider than the weapon frame
+        width = max(self.weapon_size, text_width + 2)
+        offset = (width - self.weapon_size) // 2
+        display = pygame.Surface((width, self.weapon_size + font_large.get_linesize()), pygame.SRCALPHA)
+
+        # Draw enlarged equipped item
+        weapon_item_x = offset + self.weapon_size - (self.weapon_size // 2) - (weapon_item_size // 2)
+        weapon_item_y = (self.weapon_size // 2) - (weapon_item_size // 2)
+        enlarged_weapon_image = ASSETS.get_scaled(weapon_properties.image_file, (weapon_item_size, weapon_item_size))
+        display.blit(enlarged_weapon_image, (weapon_item_x, weapon_item_y))
+
+        # Draw equipped item label
+        text_x = weapon_item_x + (weapon_item_size // 2) - (text_width // 2)
+        display.blit(weapon_text_shadow, (text_x + 1, weapon_item_y + weapon_item_size + 8))
+        display.blit(weapon_text, (text_x, weapon_item_y + weapon_item_size + 7))
+
+        # Draw currently loaded ammo
+        if weapon_properties.item_function == ItemFunction.FIREARM:
+            label_x = weapon_item_x + weapon_item_size - 20
+            label_y = weapon_item_y + weapon_item_size - 20
+            pygame.draw.rect(display, WHITE, (label_x, label_y, 20, 20))
+            loaded_ammo = font_large.render(str(item.loaded_ammo), True, BLACK)
+            display.blit(loaded_ammo, (label_x + 5, label_y + 2))
+
+        return display, -offset
+
+
 class InventorySprite(pygame.sprite.Sprite):
     """An item sprite for the inventory panel."""
     def __init__(self, item, x, y, width, height):
         super().__init__()
         self.item = item  # Reference to the actual item object
-        self.image = pygame.image.load(item.image_file).convert_alpha()  # Load item image
-        self.image = pygame.transform.scale(self.image, (width, height))  # Scale to fit inventory
+        self.image = ASSETS.get_scaled(item.image_file, (width, height))  # Load item image scaled to fit inventory
         self.rect = self.image.get_rect(topleft=(x, y))
 
     def update_position(self, x, y):
@@ -2,14 +2,40 @@
 
 import pygame
 import random
+from enum import Enum
 
 from settings import *
 from ui.utils import WrapText
-from data import BLOCKS, BlockType, NEIGHBOURHOODS
+from data import BLOCKS, BlockType, BARRICADE_MAX_LEVEL
+from topology import NEIGHBOURHOOD_NAMES, NEIGHBOURHOOD_ORIGINS, get_neighbourhood_id
+from assets import ASSETS
+
+try:
+    import numpy
+except ImportError:
+    numpy = None # Heatmap layers need numpy for pygame.surfarray
+
+
+class MapLayer(Enum):
+    NEIGHBOURHOODS = 'Neighbourhoods'
+    ZOMBIES = 'Zombie Density'
+    LIGHTS = 'Lit Buildings'
+    BARRICADES = 'Barricades'
+    KNOWLEDGE = 'Explored Blocks'
+
+
+# Colour ramps (low, high) for each heatmap layer
+HEATMAP_COLOURS = {
+    MapLayer.ZOMBIES: ((20, 20, 20), GREEN),
+    MapLayer.LIGHTS: ((20, 20, 20), PALE_YELLOW),
+    MapLayer.BARRICADES: ((20, 20, 20), ORANGE),
+    MapLayer.KNOWLEDGE: ((125, 125, 125), WHITE),
+}
 
 
 class Map:
     def __init__(self, game, screen):
+        self.game = game
         self.screen = screen
         self.player = game.state.player
         self.city = game.state.city
@@ -28,88 +54,138 @@ class Map:
 
         self.block_images = {
             block_type: pygame.transform.scale(
-                pygame.image.load(properties.image_file).convert_alpha(), 
+                ASSETS.get_image(properties.image_file), 
                 (self.block_size, self.block_size)
             ) 
             for block_type, properties in BLOCKS.items()
         }
 
+        # Rendered map caches
+        self.neighbourhood_maps = {} # Neighbourhood surfaces keyed by neighbourhood id
+        self.cell_states = {} # Last rendered state of each block, keyed by (x, y)
+        self.overview_map = self._render_overview()
+
+        # City overview layers
+        self.map_layer = MapLayer.NEIGHBOURHOODS
+        self.map_layers = list(MapLayer) if numpy else [MapLayer.NEIGHBOURHOODS]
+        self.heatmap = CityHeatmap(game, self.MAP_SIZE) if numpy else None
+        self._draw_map_info()
+
     def draw(self):
         blink_state = pygame.time.get_ticks() // 500 % 2 == 0
-        player_block = self.city.block(self.player.location[0], self.player.location[1])
 
         self.screen.blit(self.map_surface, (10, 10))
 
-        map_data = self._get_map_data(player_block)
-        self._draw_map(map_data)
+        # Blit the cached map for the current zoom level
+        if self.zoom_in:
+            self.city_map.blit(self._get_neighbourhood_map(), (0, 0))
+        elif self.map_layer == MapLayer.NEIGHBOURHOODS:
+            self.city_map.blit(self.overview_map, (0, 0))
+        else:
+            self.city_map.blit(self.heatmap.get_surface(self.map_layer), (0, 0))
+
         if blink_state:
-            self._draw_player_location(map_data)  
-        
+            self._draw_player_location()
+
         self.screen.blit(self.city_map, (25, 25))
 
+    def cycle_layer(self):
+        """Switch the city overview to the next available map layer."""
+        index = self.map_layers.index(self.map_layer)
+        self.map_layer = self.map_layers[(index + 1) % len(self.map_layers)]
         self._draw_map_info()
 
-    def _draw_map(self, map_data): 
-        index = 0
+    def _get_cell_position(self, col, row):
+        """Return the top-left corner of a map cell."""
+        x = self.BLOCK_PADDING + col * (self.block_size + self.BLOCK_PADDING) + 4
+        y = self.BLOCK_PADDING + row * (self.block_size + self.BLOCK_PADDING) + 4
+        return x, y
+
+    def _get_neighbourhood_map(self):
+        """Return the rendered map of the player's neighbourhood, redrawing only changed cells."""
+        x, y = self.player.location
+        neighbourhood_id = get_neighbourhood_id(x, y)
+        col_offset, row_offset = NEIGHBOURHOOD_ORIGINS[neighbourhood_id]
+
+        neighbourhood_map = self.neighbourhood_maps.get(neighbourhood_id)
+        if neighbourhood_map is None:
+            neighbourhood_map = pygame.Surface((self.MAP_SIZE, self.MAP_SIZE))
+            neighbourhood_map.fill((0, 0, 0))
+            self.neighbourhood_maps[neighbourhood_id] = neighbourhood_map
+
         for row in range(self.GRID_ROWS):
             for col in range(self.GRID_COLS):
-                # Calculate top-left corner of the block
-                x = self.BLOCK_PADDING + col * (self.block_size + self.BLOCK_PADDING) + 4
-                y = self.BLOCK_PADDING + row * (self.block_size + self.BLOCK_PADDING) + 4
-
-                if self.zoom_in:
-                    player_block = self.city.block(self.player.location[0], self.player.location[1])
-                    neighbourhood_index = NEIGHBOURHOODS.index(player_block.neighbourhood)
-                    col_offset = neighbourhood_index % 10 * 10
-                    row_offset = int(neighbourhood_index // 10) * 10
-                    current_block = self.city.block(col + col_offset, row + row_offset)
-
-                    # Check if the player has seen the block before
-                    if current_block.is_known:
-                        # Draw block
-                        block_image = self.block_images[current_block.type]
-                        if current_block.type == BlockType.STREET:
-                            image_width, image_height = block_image.get_width(), block_image.get_height()
-
-                            # Define the zoom-in factor (e.g., 2x zoom = 50% of the original size)
-                            zoom_factor = 2
-                            zoom_width, zoom_height = image_width // zoom_factor, image_height // zoom_factor
-
-                            # Check if zoom coordinates are cached
-                            if (col, row) in self.cached_zoom:
-                                (zoom_x, zoom_y) = self.cached_zoom[(col, row)]
-                            else:
-                                zoom_x = random.randint(0, image_width - zoom_width)
-                                zoom_y = random.randint(0, image_height - zoom_height)
-
-                                self.cached_zoom[(col, row)] = (zoom_x, zoom_y)
-
-                            # Extract the zoomed-in portion
-                            zoomed_surface = block_image.subsurface((zoom_x, zoom_y, zoom_width, zoom_height))
-
-                            # Scale it to the target block size and assign it to the sprite
-                            block_image = pygame.transform.scale(zoomed_surface, (self.block_size, self.block_size))
-
-                        label_name = map_data[index]
-                        block_image = self._draw_block_label(block_image, label_name)
-
-                        self.city_map.blit(block_image, (x, y))
-
-                    else:
-                        # Draw fog of war block
-                        pygame.draw.rect(self.city_map, (125, 125, 125), (x, y, self.block_size, self.block_size))
-
-                else:
-                    # Draw neighbourhood
-                    neighbourhood_block = pygame.Surface((self.block_size, self.block_size))
-                    neighbourhood_block.fill((255, 255, 255))
-                    label_name = map_data[index]
-                    neighbourhood_block = self._draw_block_label(neighbourhood_block, label_name)
-                    self.city_map.blit(neighbourhood_block, (x, y))
-
-                index += 1
-
-    def _draw_block_label(self, block_image, label_name):
+                block_x, block_y = col + col_offset, row + row_offset
+                current_block = self.city.block(block_x, block_y)
+                cell_state = self._get_cell_state(current_block)
+
+                # Only redraw cells that changed since they were last rendered
+                if self.cell_states.get((block_x, block_y)) != cell_state:
+                    self._draw_cell(neighbourhood_map, current_block, col, row)
+                    self.cell_states[(block_x, block_y)] = cell_state
+
+        return neighbourhood_map
+
+    def _get_cell_state(self, block):
+        """Return the block state that affects how its map cell looks."""
+        if not block.is_known:
+            return None
+        return block.type
+
+    def _draw_cell(self, surface, block, col, row):
+        """Render a single city block onto a neighbourhood map."""
+        x, y = self._get_cell_position(col, row)
+
+        # Draw fog of war if the player hasn't seen the block before
+        if not block.is_known:
+            pygame.draw.rect(surface, (125, 125, 125), (x, y, self.block_size, self.block_size))
+            return
+
+        block_image = self.block_images[block.type]
+        if block.type == BlockType.STREET:
+            block_image = self._get_street_image(block_image, col, row)
+
+        block_image = self._draw_block_label(block_image, block.name, WHITE)
+        surface.blit(block_image, (x, y))
+
+    def _get_street_image(self, block_image, col, row):
+        """Return a zoomed-in portion of the street image for a map cell."""
+        image_width, image_height = block_image.get_width(), block_image.get_height()
+
+        # Define the zoom-in factor (e.g., 2x zoom = 50% of the original size)
+        zoom_factor = 2
+        zoom_width, zoom_height = image_width // zoom_factor, image_height // zoom_factor
+
+        # Check if zoom coordinates are cached
+        if (col, row) in self.cached_zoom:
+            (zoom_x, zoom_y) = self.cached_zoom[(col, row)]
+        else:
+            zoom_x = random.randint(0, image_width - zoom_width)
+            zoom_y = random.randint(0, image_height - zoom_height)
+
+            self.cached_zoom[(col, row)] = (zoom_x, zoom_y)
+
+        # Extract the zoomed-in portion
+        zoomed_surface = block_image.subsurface((zoom_x, zoom_y, zoom_width, zoom_height))
+
+        # Scale it to the target block size
+        return pygame.transform.scale(zoomed_surface, (self.block_size, self.block_size))
+
+    def _render_overview(self):
+        """Render the zoomed-out map of all neighbourhoods once."""
+        overview_map = pygame.Surface((self.MAP_SIZE, self.MAP_SIZE))
+        overview_map.fill((0, 0, 0))
+
+        for index, neighbourhood in enumerate(NEIGHBOURHOOD_NAMES[:self.GRID_ROWS * self.GRID_COLS]):
+            row, col = divmod(index, self.GRID_COLS)
+            neighbourhood_block = pygame.Surface((self.block_size, self.block_size))
+            neighbourhood_block.fill((255, 255, 255))
+            neighbourhood_block = self._draw_block_label(neighbourhood_block, neighbourhood, ORANGE)
+            overview_map.blit(neighbourhood_block, self._get_cell_position(col, row))
+
+        return overview_map
+
+    def _draw_block_label(self, block_image, label_name, label_colour):
         """Render the block label onto the block's surface."""
         label_text = WrapText(label_name, font_xs, self.block_size - 2).lines
         text_height = sum(font_xs.size(line)[1] for line in label_text)
@@ -118,11 +194,7 @@ class Map:
         label_rect = pygame.Rect(
             0, self.block_size - text_height - 2, self.block_size, text_height + 2
         )
-
-        if self.zoom_in:
-            pygame.draw.rect(image_copy, WHITE, label_rect)
-        else:
-            pygame.draw.rect(image_copy, ORANGE, label_rect)
+        pygame.draw.rect(image_copy, label_colour, label_rect)
 
         # Draw text onto the block surface
         y_offset = label_rect.top + 5
@@ -134,48 +206,26 @@ class Map:
 
         return image_copy
 
-    def _get_map_data(self, player_block):
+    def _draw_player_location(self):
+        """Mark the player's position on the map."""
+        player_x, player_y = self.player.location
+        if not self.zoom_in and self.map_layer != MapLayer.NEIGHBOURHOODS:
+            # Heatmaps show every block, so mark the exact block
+            pixels_per_block = self.MAP_SIZE / CITY_SIZE
+            centre = ((player_x + 0.5) * pixels_per_block, (player_y + 0.5) * pixels_per_block)
+            pygame.draw.circle(self.city_map, (255, 0, 0), centre, 5)
+            return
+
         if self.zoom_in:
-            map_data = []
-            neighbourhood_index = NEIGHBOURHOODS.index(player_block.neighbourhood)
-            neighbourhood_x = neighbourhood_index % 10 * 10
-            neighbourhood_y = int(neighbourhood_index // 10) * 10
-
-            for y in range(neighbourhood_y, neighbourhood_y + 10):
-                for x in range(neighbourhood_x, neighbourhood_x + 10):
-                    block = self.city.block(x, y)
-                    map_data.append(block.name)
-            return map_data
-        
+            col, row = player_x % NEIGHBOURHOOD_SIZE, player_y % NEIGHBOURHOOD_SIZE
         else:
-            return NEIGHBOURHOODS
-                    
-
-    def _draw_player_location(self, map_data):
-        (player_x, player_y) = self.player.location
-        current_block = self.city.block(player_x, player_y)
-        for index, datum in enumerate(map_data):
-            if self.zoom_in:
-                if datum == current_block.name:
-                    player_index = index
-            else:
-                if datum == current_block.neighbourhood:
-                    player_index = index
-        
-        # Count the city blocks until player location is reached
-        index = 0
-        for row in range(self.GRID_ROWS):
-            for col in range(self.GRID_COLS):
-                if index == player_index:                    
-                    # Calculate top-left corner of the city block
-                    x = self.BLOCK_PADDING + col * (self.block_size + self.BLOCK_PADDING) + 4
-                    y = self.BLOCK_PADDING + row * (self.block_size + self.BLOCK_PADDING) + 4
+            row, col = divmod(get_neighbourhood_id(player_x, player_y), self.GRID_COLS)
 
-                    pygame.draw.circle(self.city_map, (255, 0, 0), (x + self.block_size // 2, y + self.block_size // 2 - 10), 10)
-                
-                index += 1
+        x, y = self._get_cell_position(col, row)
+        pygame.draw.circle(self.city_map, (255, 0, 0), (x + self.block_size // 2, y + self.block_size // 2 - 10), 10)
 
     def _draw_map_info(self):
+        """Render the static map legend onto the map background."""
         map_info_width = SCREEN_WIDTH - self.MAP_SIZE - 30
         self.map_info = pygame.Surface((map_info_width, self.MAP_SIZE))
         self.map_info.fill((255, 255, 255))
@@ -185,6 +235,9 @@ class Map:
             'body_1': 'Press ESC to exit map.',
             'body_2': 'Use PAGE UP and PAGE DOWN to zoom.',
         }
+        if self.heatmap:
+            map_info_text['body_3'] = 'Press TAB to change map layer.'
+            map_info_text['body_4'] = f'Layer: {self.map_layer.value}'
         y_offset = 50
         for format, text in map_info_text.items():
             if format == 'header':
@@ -200,4 +253,53 @@ class Map:
                 self.map_info.blit(line_surface, line_rect)
                 y_offset += line_size                    
 
-        self.map_surface.blit(self.map_info, (self.MAP_SIZE + 20, 20))
\ No newline at end of file
+        self.map_surface.blit(self.map_info, (self.MAP_SIZE + 20, 20))
+
+
+class CityHeatmap:
+    """Renders the whole city as a per-block heatmap, written to a surface in bulk."""
+    def __init__(self, game, size):
+        self.game = game
+        self.size = size
+        self.blocks = [block for row in game.state.city.grid for block in row] # Row-major block list
+        self.surfaces = {} # Rendered layers keyed by MapLayer
+        self.refresh_ticks = {} # Game tick at which each layer was last rendered
+
+    def get_surface(self, layer):
+        """Return the heatmap for a layer, re-rendering it once per action interval."""
+        if self.refresh_ticks.get(layer) != self.game.ticker:
+            self.surfaces[layer] = self._render(layer)
+            self.refresh_ticks[layer] = self.game.ticker
+        return self.surfaces[layer]
+
+    def _get_values(self, layer):
+        """Return a CITY_SIZE x CITY_SIZE array of values between 0 and 1, indexed [y][x]."""
+        if layer == MapLayer.ZOMBIES:
+            counts = numpy.zeros((CITY_SIZE, CITY_SIZE))
+            locations = [
+                npc.location for npc in self.game.state.npcs.list
+                if not npc.is_human and not npc.is_dead
+            ]
+            if locations:
+                xs, ys = numpy.array(locations).T
+                numpy.add.at(counts, (ys, xs), 1)
+            return numpy.minimum(counts / BLOCK_CAPACITY, 1.0)
+
+        if layer == MapLayer.LIGHTS:
+            values = (getattr(block, 'lights_on', False) for block in self.blocks)
+        elif layer == MapLayer.BARRICADES:
+            values = (block.barricade.level / BARRICADE_MAX_LEVEL if hasattr(block, 'barricade') else 0 for block in self.blocks)
+        else:
+            values = (block.is_known for block in self.blocks)
+
+        return numpy.fromiter(values, dtype=float, count=len(self.blocks)).reshape(CITY_SIZE, CITY_SIZE)
+
+    def _render(self, layer):
+        """Map layer values onto the layer's colour ramp and build the scaled surface."""
+        values = self._get_values(layer)
+        low, high = (numpy.array(colour, dtype=float) for colour in HEATMAP_COLOURS[layer])
+        pixels = (low + (high - low) * values[..., None]).astype(numpy.uint8)
+
+        # surfarray indexes pixels [x][y], so swap the grid axes
+        surface = pygame.surfarray.make_surface(pixels.transpose(1, 0, 2))
+        return pygame.transform.scale(surface, (self.size, self.size))
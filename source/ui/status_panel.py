@@ -1,9 +1,10 @@
 # status_panel.py
 
 from settings import *
-from ui.utils import SpriteSheet
+from ui.utils import SpriteSheet, PanelBase
 from ui.widgets import Button
 from data import ResourcePath
+from assets import ASSETS
 
 
 class StatusPanel:
@@ -15,13 +16,10 @@ class StatusPanel:
         self.x, self.y = SCREEN_WIDTH // 3 + 10, SCREEN_HEIGHT * 25 // 32 + 10
         self.width, self.height = SCREEN_WIDTH // 4 - 10, SCREEN_HEIGHT * 31 // 160
         self.portrait_size = self.height - 20
-        self.hp_bar = pygame.image.load(ResourcePath("panels/hp_bar.png").path).convert_alpha()
-        self.hp_bar = pygame.transform.scale(self.hp_bar, (self.portrait_size, 20))
-        self.portrait_frame = pygame.image.load(ResourcePath("panels/player_frame.png").path).convert_alpha()
-        self.portrait_frame = pygame.transform.scale(self.portrait_frame, (self.portrait_size, self.portrait_size))
-        self.player_sprite_sheet_image = pygame.image.load(ResourcePath(self.portrait_path).path).convert_alpha()
-        self.player_info = pygame.image.load(ResourcePath("panels/player_info.png").path).convert_alpha()
-        self.player_info = pygame.transform.scale(self.player_info, (self.width - self.height + 20, self.height))
+        self.hp_bar = ASSETS.get_scaled(ResourcePath("panels/hp_bar.png").path, (self.portrait_size, 20))
+        self.portrait_frame = ASSETS.get_scaled(ResourcePath("panels/player_frame.png").path, (self.portrait_size, self.portrait_size))
+        self.player_sprite_sheet_image = ASSETS.get_image(ResourcePath(self.portrait_path).path)
+        self.base = PanelBase(self._compose_base)
 
         # Set up player portrait
         self.player_portrait_scale = (SCREEN_HEIGHT * 31 // 160 - 20) // 66
@@ -52,10 +50,13 @@ class StatusPanel:
         self.screen.blit(self.hp_bar, (hp_bar_x, hp_bar_y))
 
         # Draw player status
-        self.screen.blit(self.player_info, (self.x + self.portrait_size, self.y))
+        self.screen.blit(self.base.get(), (self.x + self.portrait_size, self.y))
         self._render_player_status()
         self.button_group.draw(self.screen)
 
+    def _compose_base(self):
+        return ASSETS.get_scaled(ResourcePath("panels/player_info.png").path, (self.width - self.height + 20, self.height))
+
     def _render_player_status(self):
         y_offset = 30
         status_text = []
@@ -91,14 +92,11 @@ class PlayerSprite(pygame.sprite.Sprite):
         self.start_frame = 0
         self.current_frame = 0
 
+        # Frames are sliced from the sprite sheet once and reused
+        self.frames = self.sprite_sheet.get_frames(self.frame_width, self.frame_height, self.scale, self.colour)
+
         self.update_animation_set()
-        self.image = self.sprite_sheet.get_image(
-            frame=self.current_frame,
-            width=self.frame_width,
-            height=self.frame_height,
-            scale=self.scale,
-            colour=self.colour,
-        )
+        self.image = self.frames[self.current_frame]
         self.rect = self.image.get_rect(topleft=(x, y))
 
     def update_animation_set(self):
@@ -123,10 +121,4 @@ class PlayerSprite(pygame.sprite.Sprite):
         if now - self.last_update_time > self.animation_speed * 1000:
             self.last_update_time = now
             self.current_frame = self.start_frame + ((self.current_frame - self.start_frame - 1) % self.frame_count)
-            self.image = self.sprite_sheet.get_image(
-                frame=self.current_frame,
-                width=self.frame_width,
-                height=self.frame_height,
-                scale=self.scale,
-                colour=self.colour,
-            )
\ No newline at end of file
+            self.image = self.frames[self.current_frame]
\ No newline at end of file
@@ -5,7 +5,8 @@ import pygame
 import sys
 
 from settings import *
-from data import ResourcePath
+from ui.effects import NightOverlay
+from characters.actions.utility_ai import UTILITY_AI
 
 
 class WrapText:
@@ -76,11 +77,41 @@ class ActionProgress:
                     self.target_function = None
 
 
+class PanelBase:
+    """A panel's static artwork, scaled and composited the first time it is drawn."""
+    def __init__(self, compose):
+        self.compose = compose # Builds the base surface
+        self.surface = None
+
+    def get(self):
+        """Return the base surface, building it on first use."""
+        if self.surface is None:
+            self.surface = self.compose()
+        return self.surface
+
+
 class SpriteSheet():
     def __init__(self, image):
         self.sheet = image
+        self.frame_banks = {} # Sliced and scaled frames keyed by (width, height, scale, colour)
+
+    def get_frames(self, width, height, scale, colour):
+        """Return every frame on the sheet at the given size, slicing the sheet only once."""
+        key = (width, height, scale, colour)
+        frames = self.frame_banks.get(key)
+        if frames is None:
+            frame_count = self.sheet.get_width() // width
+            frames = [self._slice_frame(frame, width, height, scale, colour) for frame in range(frame_count)]
+            self.frame_banks[key] = frames
+        return frames
 
     def get_image(self, frame, width, height, scale, colour):
+        frames = self.get_frames(width, height, scale, colour)
+        if 0 <= frame < len(frames):
+            return frames[frame]
+        return self._slice_frame(frame, width, height, scale, colour)
+
+    def _slice_frame(self, frame, width, height, scale, colour):
         image = pygame.Surface((width, height)).convert_alpha()
         image.blit(self.sheet, (0, 0), ((frame * width), 0, width, height))
         image = pygame.transform.scale(image, (width * scale, height * scale))
@@ -91,14 +122,13 @@ class SpriteSheet():
 
 class DayCycleManager:
     """Manages the transition from daytime to nighttime."""
-    def __init__(self, game):
+    def __init__(self, game, regions=None):
         self.game = game
         self.night_overlay_alpha = 0 # Start the day with a transparent overlay
         self.is_night = False
+        self.night_overlay = NightOverlay(game.screen, (0, 0, 139), regions) # Dark blue tint
 
-        pygame.mixer.init() # Initialize the sound mixer
-        pygame.mixer.music.load(ResourcePath("music/road_runner.mp3").path)
-        pygame.mixer.music.set_volume(0.3)  # Set volume to 50%
+        game.audio.stop_music() # End the title music
 
     def update(self):
         """Updates the environment based on the time of day."""
@@ -129,10 +159,7 @@ class DayCycleManager:
 
     def draw(self):
         """Draws the transparent night overlay onto the screen."""
-        overlay = pygame.Surface(self.game.screen.get_size(), pygame.SRCALPHA)
-        night_colour = (0, 0, 139, self.night_overlay_alpha)  # Dark blue with transparency
-        overlay.fill(night_colour)
-        self.game.screen.blit(overlay, (0, 0))
+        self.night_overlay.draw(self.night_overlay_alpha)
 
     def start_night(self):
         """Trigger night transition when 12:00 PM hits."""
@@ -140,10 +167,18 @@ class DayCycleManager:
 
     def process_night_cycle(self):
         """Process 8 hours of NPC actions."""
+        game = self.game
         for _ in range(8 * 10 * 1000 // ACTION_INTERVAL): # Calculate number of NPC actions in 8 hours
-            self.game.state.npcs.gain_ap()
-            self.game.state.npcs.take_action()
-            self.game.ticker += 1  # Track time progression
+            game.state.npcs.gain_ap()
+            game.ticker += 1  # Track time progression
+
+            # Awake NPCs take their turns, as in the day loop
+            awake_npcs = game.scheduler.get_awake_npcs(game.ticker)
+            UTILITY_AI.assign(awake_npcs)
+            for npc in awake_npcs:
+                game.scheduler.take_turn(npc)
+            game.siege.resolve()
+            game.combat.resolve()
 
         self.start_new_day()
         self.game.game_ui.description_panel.clock.time_in_minutes = 8 * 60  # Reset to 8:00 AM
@@ -151,7 +186,7 @@ class DayCycleManager:
     def start_new_day(self):
         """End the night cycle and start a new day."""
         self.night_overlay_alpha = 0 # Make night overlay transparent
-        pygame.mixer.music.play(0)
+        self.game.audio.play_music("day", loops=0)
         print("You wake up at dawn...")
 
 
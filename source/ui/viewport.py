@@ -3,23 +3,30 @@ import random
 
 from settings import *
 from data import BLOCKS, BlockType, SkillType, ResourcePath
-from ui.utils import WrapText
+from assets import ASSETS
+from topology import NEIGHBOURHOOD_NAMES, get_neighbourhood_id
+from event_bus import WorldEvent, CHARACTER_EVENTS
+from ui.utils import WrapText, PanelBase
 
 class Viewport:
     def __init__(self, game, screen):
         self.game = game
         self.screen = screen
-        self.frame = pygame.image.load(ResourcePath('panels/viewport_frame.png').path).convert_alpha()
+        self.frame_path = ResourcePath('panels/viewport_frame.png').path
         self.frame_size = SCREEN_HEIGHT // 2
         self.grid_topleft = (self.frame_size // 9) + 12
         self.viewport_group = self._create_viewport_group()
+        self.base = PanelBase(self._compose_base)
+        self.neighbourhood_labels = {} # Rendered name bars keyed by neighbourhood id
 
     def draw(self):
-        scaled_viewport_frame = pygame.transform.scale(self.frame, (self.frame_size, self.frame_size))
-        self.screen.blit(scaled_viewport_frame, (10, 10))
+        self.screen.blit(self.base.get(), (10, 10))
         self.viewport_group.draw(self.screen)
         self.draw_neighbourhood_name()
 
+    def _compose_base(self):
+        return ASSETS.get_scaled(self.frame_path, (self.frame_size, self.frame_size))
+
     #  Set up viewport group
     def _create_viewport_group(self):
         viewport_group = pygame.sprite.Group()
@@ -31,22 +38,27 @@ class Viewport:
         return viewport_group
 
     def update(self):
+        player = self.game.state.player
+        view = (player.location, player.inside, SkillType.NECROTECH_EMPLOYMENT in player.human_skills)
         for sprite in self.viewport_group:
-            sprite.update_data()
+            sprite.refresh(view)
             sprite.block.is_known = True
 
-    def draw_viewport_frame(self):
-        """Draw the 3x3 viewport representing the player's surroundings."""
-        scaled_viewport_frame = pygame.transform.scale(self.viewport_frame, (self.viewport_frame_width, self.viewport_frame_height))
-        self.screen.blit(scaled_viewport_frame, (10, 10))
-
     def draw_neighbourhood_name(self):
         # Draw neighbourhood name
         x, y = self.game.state.player.location
-        current_block = self.game.state.city.block(x, y)
-        pygame.draw.rect(self.screen, ORANGE, (10, self.frame_size + 10, self.frame_size, 30))
-        text = font_large.render(current_block.neighbourhood, True, WHITE)
-        self.screen.blit(text, ((self.frame_size // 2) - (text.get_width() // 2), self.frame_size + 15))        
+        neighbourhood_id = get_neighbourhood_id(x, y)
+        label = self.neighbourhood_labels.get(neighbourhood_id)
+        if label is None:
+            label = self.neighbourhood_labels[neighbourhood_id] = self._render_neighbourhood_name(NEIGHBOURHOOD_NAMES[neighbourhood_id])
+        self.screen.blit(label, (10, self.frame_size + 10))
+
+    def _render_neighbourhood_name(self, neighbourhood):
+        label = pygame.Surface((self.frame_size, 30))
+        label.fill(ORANGE)
+        text = font_large.render(neighbourhood, True, WHITE)
+        label.blit(text, ((self.frame_size // 2) - (text.get_width() // 2) - 10, 5))
+        return label
 
 
 class BlockSprite(pygame.sprite.Sprite):
@@ -63,7 +75,35 @@ class BlockSprite(pygame.sprite.Sprite):
         self.image = pygame.Surface((BLOCK_SIZE, BLOCK_SIZE))
         self.rect = self.image.get_rect(topleft=(self.viewport_x, self.viewport_y))
         self.viewport_npcs = []
+        self.view = None # Player location, side and skills the sprite was last drawn for
+        self.watched_location = None # Block whose events mark the sprite for redrawing
+        self.dirty = True
+
+    def refresh(self, view):
+        """Redraw the sprite only when the player's view or the block it shows has changed."""
+        if view != self.view:
+            self.view = view
+            self._watch_location()
+            self.dirty = True
+
+        if self.dirty:
+            self.dirty = False
+            self.update_data()
+
+    def _watch_location(self):
+        bus = self.game.event_bus
+        if self.watched_location is not None:
+            bus.unsubscribe_block(*self.watched_location, self._on_block_event)
+            self.watched_location = None
+
+        x, y = self.game.state.player.location
+        x, y = x + self.dx, y + self.dy
+        if 0 <= x < CITY_SIZE and 0 <= y < CITY_SIZE:
+            self.watched_location = (x, y)
+            bus.subscribe_block(x, y, self._on_block_event, CHARACTER_EVENTS | WorldEvent.LIGHTS_CHANGED | WorldEvent.BUILDING_CHANGED)
 
+    def _on_block_event(self, event):
+        self.dirty = True
 
     def update_data(self):
         """
@@ -84,8 +124,7 @@ class BlockSprite(pygame.sprite.Sprite):
 
             # Load the block image
             image_filename = self.properties.image_file
-            self.image = pygame.image.load(image_filename).convert_alpha()
-            self.image = pygame.transform.scale(self.image, (BLOCK_SIZE, BLOCK_SIZE))
+            self.image = ASSETS.get_scaled(image_filename, (BLOCK_SIZE, BLOCK_SIZE))
 
             # Apply zoom effect for street blocks
             if self.block.type == BlockType.STREET:
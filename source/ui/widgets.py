@@ -5,6 +5,7 @@ import time
 
 from settings import *
 from data import ResourcePath, ItemType
+from assets import ASSETS
 
 class Button(pygame.sprite.Sprite):
     """A button that changes images on mouse events."""
@@ -20,14 +21,14 @@ class Button(pygame.sprite.Sprite):
         self.rect = pygame.Rect(0, 0, width, height)  # Initial rect size (scale later when image is loaded)
 
         if not is_pressable:
-            self._image = pygame.image.load(ResourcePath(f"buttons/{self.name}.png").path).convert_alpha()
+            self._image = ASSETS.get_image(ResourcePath(f"buttons/{self.name}.png").path)
             self._image = pygame.transform.scale(self._image, (width, height))  # Scale when loading
 
     @property
     def image_up(self):
         """Lazy load the 'up' image when first accessed."""
         if self._image_up is None:
-            self._image_up = pygame.image.load(ResourcePath(f"buttons/{self.name}_up.png").path).convert_alpha()
+            self._image_up = ASSETS.get_image(ResourcePath(f"buttons/{self.name}_up.png").path)
             self._image_up = pygame.transform.scale(self._image_up, (self.width, self.height))  # Scale when loading
         return self._image_up
 
@@ -35,7 +36,7 @@ class Button(pygame.sprite.Sprite):
     def image_down(self):
         """Lazy load the 'down' image when first accessed."""
         if self._image_down is None:
-            self._image_down = pygame.image.load(ResourcePath(f"buttons/{self.name}_down.png").path).convert_alpha()
+            self._image_down = ASSETS.get_image(ResourcePath(f"buttons/{self.name}_down.png").path)
             self._image_down = pygame.transform.scale(self._image_down, (self.width, self.height))  # Scale when loading
         return self._image_down
 
@@ -82,50 +83,27 @@ class Cursor(object):
         self.set_default()
 
     def _create_cursor(self, image_path):
-        image = pygame.image.load(image_path).convert_alpha()
+        image = ASSETS.get_image(image_path)
         image = pygame.transform.scale(image, (32, 32))
         cursor = pygame.cursors.Cursor((0, 0), image)
         return cursor
 
     def update(self):
-        game_ui = self.game.game_ui
         player = self.game.state.player
-        player_sprite = self.game.game_ui.status_panel.player_sprite
-        mouse_x, mouse_y = pygame.mouse.get_pos()
-
-        cursor_changed = False    
-
-        # Check collisions with zombie sprites
-        for zombie in game_ui.description_panel.zombie_sprite_group:
-            if zombie.rect.collidepoint((mouse_x, mouse_y)):
-                if player.weapon:
-                    if player.weapon.type == ItemType.DNA_EXTRACTOR:
-                        self.set_extract()
-                        cursor_changed = True
-                        break
-                    elif player.weapon.type == ItemType.SYRINGE:
-                        self.set_revivify()
-                        cursor_changed = True
-                        break
+        target_type, _ = self.game.game_ui.hit_test.query(pygame.mouse.get_pos())
+        weapon_type = player.weapon.type if player.weapon else None
+
+        # Shape the cursor for the top-most target under the mouse
+        if target_type == 'zombie':
+            if weapon_type == ItemType.DNA_EXTRACTOR:
+                self.set_extract()
+            elif weapon_type == ItemType.SYRINGE:
+                self.set_revivify()
+            else:
                 self.set_attack()
-                cursor_changed = True
-                break
-
-        for human in game_ui.description_panel.human_sprite_group:
-            if human.rect.collidepoint((mouse_x, mouse_y)):
-                if player.weapon:
-                    if player.weapon.type == ItemType.FIRST_AID_KIT:
-                        self.set_heal()
-                        cursor_changed = True
-                        break
-
-        if player_sprite.rect.collidepoint((mouse_x, mouse_y)):
-            if player.weapon:
-                if player.weapon.type == ItemType.FIRST_AID_KIT:
-                    self.set_heal()
-                    cursor_changed = True
-
-        if not cursor_changed:
+        elif target_type in ('human', 'self') and weapon_type == ItemType.FIRST_AID_KIT:
+            self.set_heal()
+        else:
             self.set_default()
 
     def set_default(self):